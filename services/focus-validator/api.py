@@ -3,16 +3,78 @@ FastAPI wrapper for FOCUS Validator service.
 Provides REST API for validating FOCUS-compliant cost data.
 """
 
+import asyncio
 import tempfile
 import os
+import time
 from typing import Optional
 from fastapi import FastAPI, UploadFile, File, HTTPException, Query
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import PlainTextResponse
 from pydantic import BaseModel
-import polars as pl
 
+from focus_validator.config_objects.focus_to_duckdb_converter import parse_count_mode
+from focus_validator.data_loaders.input_streams import split_compression_suffix
+from focus_validator.utils.cpu_profiler import PROFILERS, CPUProfiler
+from focus_validator.utils.prometheus import CONTENT_TYPE, Registry
 from focus_validator.validator import Validator
 
+SUPPORTED_EXTENSIONS = (".csv", ".parquet", ".arrow", ".feather", ".ipc")
+
+# Profiling requests are only honoured when the service runs in debug mode
+DEBUG = os.environ.get("FOCUS_VALIDATOR_DEBUG", "").lower() in ("1", "true", "yes")
+
+# Validations run off the event loop; more than this many at once wait in a queue
+MAX_CONCURRENT_VALIDATIONS = int(os.environ.get("FOCUS_VALIDATOR_MAX_CONCURRENCY", "1"))
+_validation_slots = asyncio.Semaphore(MAX_CONCURRENT_VALIDATIONS)
+
+# Upper bound on one validation's run time (0 disables); requests may ask for
+# less. When it runs out the response carries partial results.
+DEADLINE_SECONDS = (
+    float(os.environ.get("FOCUS_VALIDATOR_DEADLINE_SECONDS", "300")) or None
+)
+# Rule results reused across uploads of unchanged data (unset disables)
+RESULT_CACHE_DIR = os.environ.get("FOCUS_VALIDATOR_RESULT_CACHE_DIR") or None
+# Optional cap on any single rule's run time
+RULE_TIMEOUT_SECONDS = (
+    float(os.environ.get("FOCUS_VALIDATOR_RULE_TIMEOUT_SECONDS", "0")) or None
+)
+
+# In-process metrics served by /metrics
+metrics_registry = Registry()
+REQUESTS = metrics_registry.counter(
+    "focus_validator_requests_total",
+    "Validation requests by outcome (valid, invalid, rejected, error)",
+    ["outcome"],
+)
+PHASE_SECONDS = metrics_registry.histogram(
+    "focus_validator_phase_seconds",
+    "Validation latency by phase (upload, plan, load, execute, output)",
+    ["phase"],
+)
+CHECK_SECONDS = metrics_registry.histogram(
+    "focus_validator_check_seconds",
+    "Execution time of each rule's run_check by check type",
+    ["check_type"],
+    buckets=(0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 5.0),
+)
+JOBS_IN_FLIGHT = metrics_registry.gauge(
+    "focus_validator_jobs_in_flight", "Validations currently running"
+)
+JOBS_QUEUED = metrics_registry.gauge(
+    "focus_validator_jobs_queued", "Validations waiting for a free slot"
+)
+PROCESSED_BYTES = metrics_registry.counter(
+    "focus_validator_processed_bytes_total",
+    "Bytes of uploaded data accepted for validation",
+)
+CACHE_LOOKUPS = metrics_registry.counter(
+    "focus_validator_cache_lookups_total",
+    "Cache lookups by cache and result (hit, miss)",
+    ["cache", "result"],
+)
+
 app = FastAPI(
     title="FOCUS Validator Service",
     description="Validates cloud cost data against FOCUS specification",
@@ -35,6 +97,15 @@ class ValidationError(BaseModel):
     column: Optional[str] = None
     error_message: str
     violation_count: int
+    # True when counting stopped early (count_mode exists / capped:N)
+    violation_count_lower_bound: bool = False
+
+
+class ProfiledFunction(BaseModel):
+    function: str
+    calls: Optional[int] = None
+    self_s: float
+    cumulative_s: float
 
 
 class ValidationResult(BaseModel):
@@ -45,6 +116,10 @@ class ValidationResult(BaseModel):
     rules_failed: int
     errors: list[ValidationError]
     summary: str
+    # True when the time limit ran out before every rule was evaluated
+    partial: bool = False
+    rules_not_evaluated: int = 0
+    profile: Optional[list[ProfiledFunction]] = None
 
 
 class HealthResponse(BaseModel):
@@ -58,10 +133,72 @@ async def health_check():
     return HealthResponse(status="healthy", version="1.0.0")
 
 
+@app.get("/metrics", response_class=PlainTextResponse)
+async def metrics():
+    """Service metrics in the Prometheus text exposition format."""
+    return PlainTextResponse(metrics_registry.render(), media_type=CONTENT_TYPE)
+
+
+def _record_run_metrics(validator: Validator) -> None:
+    for phase, seconds in validator.phase_seconds.items():
+        PHASE_SECONDS.observe(seconds, phase=phase)
+    for check_type, seconds in validator.check_seconds:
+        CHECK_SECONDS.observe(seconds, check_type=check_type)
+    if validator.load_cache is not None:
+        CACHE_LOOKUPS.inc(validator.load_cache.hits, cache="load", result="hit")
+        CACHE_LOOKUPS.inc(validator.load_cache.misses, cache="load", result="miss")
+    if validator.result_cache is not None:
+        CACHE_LOOKUPS.inc(validator.result_cache.hits, cache="result", result="hit")
+        CACHE_LOOKUPS.inc(validator.result_cache.misses, cache="result", result="miss")
+
+
+def _run_validation(
+    tmp_path: str,
+    version: str,
+    profile: Optional[str],
+    count_mode: str,
+    deadline_seconds: Optional[float] = None,
+):
+    validator = Validator(
+        data_filename=tmp_path,
+        output_type="console",
+        output_destination=None,
+        rules_version=version,
+        focus_dataset="CostAndUsage",
+        count_mode=count_mode,
+        deadline_seconds=deadline_seconds,
+        rule_timeout_seconds=RULE_TIMEOUT_SECONDS,
+        result_cache_dir=RESULT_CACHE_DIR,
+    )
+    cpu_profiler = CPUProfiler(profile) if profile else None
+    if cpu_profiler is not None:
+        with cpu_profiler.profile():
+            results = validator.validate()
+    else:
+        results = validator.validate()
+    _record_run_metrics(validator)
+    return validator, results, cpu_profiler
+
+
 @app.post("/validate", response_model=ValidationResult)
 async def validate_focus_file(
     file: UploadFile = File(...),
-    version: str = Query(default="1.2", description="FOCUS version to validate against"),
+    version: str = Query(
+        default="1.2", description="FOCUS version to validate against"
+    ),
+    profile: Optional[str] = Query(
+        default=None,
+        description="Debug only: profile the run with 'cprofile' or 'sampling' and return the top functions",
+    ),
+    count_mode: str = Query(
+        default="exact",
+        description="'exact' violation counts, or stop at the first ('exists') or first N ('capped:N') violating rows per rule",
+    ),
+    deadline_seconds: Optional[float] = Query(
+        default=None,
+        gt=0,
+        description="Time limit for this validation, up to the service's own limit; rules not evaluated in time are reported as a partial result",
+    ),
 ):
     """
     Validate a FOCUS-compliant CSV file.
@@ -69,52 +206,98 @@ async def validate_focus_file(
     Returns validation results with any failures.
     Only failed rules are included in the response.
     """
+    try:
+        result = await _validate_upload(
+            file, version, profile, count_mode, deadline_seconds
+        )
+    except HTTPException as e:
+        REQUESTS.inc(outcome="rejected" if e.status_code < 500 else "error")
+        raise
+    REQUESTS.inc(outcome="valid" if result.valid else "invalid")
+    return result
+
+
+async def _validate_upload(
+    file: UploadFile,
+    version: str,
+    profile: Optional[str],
+    count_mode: str = "exact",
+    deadline_seconds: Optional[float] = None,
+) -> ValidationResult:
     if not file.filename:
         raise HTTPException(status_code=400, detail="No file provided")
-
-    if not file.filename.endswith(('.csv', '.parquet')):
+    try:
+        parse_count_mode(count_mode)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    if profile is not None:
+        if not DEBUG:
+            raise HTTPException(
+                status_code=403,
+                detail="Profiling requires FOCUS_VALIDATOR_DEBUG to be set on the service",
+            )
+        if profile not in PROFILERS:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Invalid profiler. Choose one of: {', '.join(PROFILERS)}",
+            )
+
+    # Compressed CSV uploads (.csv.gz / .csv.zst / .csv.bz2) are streamed by the loader
+    base_filename, compression = split_compression_suffix(file.filename)
+    if not base_filename.endswith(SUPPORTED_EXTENSIONS) or (
+        compression and not base_filename.endswith(".csv")
+    ):
         raise HTTPException(
             status_code=400,
-            detail="Invalid file type. Only CSV and Parquet files are supported."
+            detail="Invalid file type. Only CSV (optionally .gz/.zst/.bz2 compressed), Parquet and Arrow IPC files are supported.",
         )
+    suffix = os.path.splitext(base_filename)[1] + file.filename[len(base_filename) :]
+    if DEADLINE_SECONDS is not None:
+        deadline_seconds = min(deadline_seconds or DEADLINE_SECONDS, DEADLINE_SECONDS)
 
     # Save uploaded file to temp location
-    with tempfile.NamedTemporaryFile(delete=False, suffix=os.path.splitext(file.filename)[1]) as tmp:
+    upload_start = time.perf_counter()
+    with tempfile.NamedTemporaryFile(delete=False, suffix=suffix) as tmp:
         content = await file.read()
         tmp.write(content)
         tmp_path = tmp.name
+    PHASE_SECONDS.observe(time.perf_counter() - upload_start, phase="upload")
+    PROCESSED_BYTES.inc(len(content))
+    del content
 
     try:
-        # Count rows for reporting (read as strings to avoid type inference issues)
-        if file.filename.endswith('.csv'):
-            df = pl.read_csv(tmp_path, infer_schema=False, null_values=["NULL", "null", ""])
-        else:
-            df = pl.read_parquet(tmp_path)
-        total_rows = len(df)
-        del df  # Free memory
-
-        # Run validation
-        validator = Validator(
-            data_filename=tmp_path,
-            output_type="console",
-            output_destination=None,
-            rules_version=version,
-            focus_dataset="CostAndUsage",
-        )
-
-        results = validator.validate()
+        # Run validation in a worker thread so /health and /metrics stay responsive
+        with JOBS_QUEUED.track():
+            await _validation_slots.acquire()
+        try:
+            with JOBS_IN_FLIGHT.track():
+                validator, results, cpu_profiler = await run_in_threadpool(
+                    _run_validation,
+                    tmp_path,
+                    version,
+                    profile,
+                    count_mode,
+                    deadline_seconds,
+                )
+        finally:
+            _validation_slots.release()
+        total_rows = validator.data_row_count
 
         # Process results - only collect failures
         errors = []
         rules_passed = 0
         rules_failed = 0
         rules_skipped = 0
+        rules_not_evaluated = 0
 
-        if results and hasattr(results, 'by_rule_id'):
+        if results and hasattr(results, "by_rule_id"):
             for rule_id, entry in results.by_rule_id.items():
                 details = entry.get("details") or {}
 
                 # Check if skipped
+                if details.get("not_evaluated"):
+                    rules_not_evaluated += 1
+                    continue
                 if details.get("skipped"):
                     rules_skipped += 1
                     continue
@@ -131,11 +314,15 @@ async def validate_focus_file(
                     column = None
 
                     if rule_info:
-                        rule_name = getattr(rule_info, 'name', rule_id) or rule_id
-                        column = getattr(rule_info, 'column', None)
+                        rule_name = getattr(rule_info, "name", rule_id) or rule_id
+                        column = getattr(rule_info, "column", None)
 
                     # Build error message
-                    error_msg = details.get("message") or details.get("reason") or "Validation failed"
+                    error_msg = (
+                        details.get("message")
+                        or details.get("reason")
+                        or "Validation failed"
+                    )
                     violation_count = details.get("violations", 0)
 
                     error = ValidationError(
@@ -144,16 +331,28 @@ async def validate_focus_file(
                         column=column,
                         error_message=str(error_msg),
                         violation_count=violation_count,
+                        violation_count_lower_bound=bool(
+                            details.get("violations_lower_bound")
+                        ),
                     )
                     errors.append(error)
 
         rules_checked = rules_passed + rules_failed
-        valid = rules_failed == 0
+        partial = rules_not_evaluated > 0
+        valid = rules_failed == 0 and not partial
 
         if valid:
-            summary = f"All {rules_passed} validation rules passed for {total_rows:,} rows."
-        else:
+            summary = (
+                f"All {rules_passed} validation rules passed for {total_rows:,} rows."
+            )
+        elif rules_failed:
             summary = f"{rules_failed} of {rules_checked} rules failed. Please fix the errors and re-upload."
+        else:
+            summary = (
+                f"All {rules_passed} rules checked passed for {total_rows:,} rows."
+            )
+        if partial:
+            summary += f" The time limit ran out before {rules_not_evaluated} rules were evaluated."
 
         return ValidationResult(
             valid=valid,
@@ -163,13 +362,17 @@ async def validate_focus_file(
             rules_failed=rules_failed,
             errors=errors,
             summary=summary,
+            partial=partial,
+            rules_not_evaluated=rules_not_evaluated,
+            profile=(
+                [ProfiledFunction(**row) for row in cpu_profiler.top_functions()]
+                if cpu_profiler is not None
+                else None
+            ),
         )
 
     except Exception as e:
-        raise HTTPException(
-            status_code=500,
-            detail=f"Validation error: {str(e)}"
-        )
+        raise HTTPException(status_code=500, detail=f"Validation error: {str(e)}")
     finally:
         # Cleanup temp file
         if os.path.exists(tmp_path):
@@ -187,4 +390,5 @@ async def get_supported_versions():
 
 if __name__ == "__main__":
     import uvicorn
+
     uvicorn.run(app, host="0.0.0.0", port=8000)
@@ -0,0 +1,183 @@
+"""
+Compare the CSV loader engines on synthetic FOCUS-shaped inputs.
+
+    python -m focus_validator.benchmarks.csv_engines --rows 100000 1000000
+
+Every engine is timed through ``CSVDataLoader.load`` with the same column
+types, so the numbers include type normalization and, for dirty inputs,
+the coercion fallback. The fastest engine per input is reported; use the
+results to tune ``AUTO_DUCKDB_MIN_BYTES`` / ``AUTO_DUCKDB_MIN_CORES``.
+"""
+
+import argparse
+import gzip
+import json
+import logging
+import os
+import shutil
+import tempfile
+import time
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+import polars as pl
+from tabulate import tabulate
+
+from focus_validator.data_loaders.csv_data_loader import CSVDataLoader
+from focus_validator.data_loaders.csv_engines import CSV_ENGINES
+
+COLUMN_TYPES = {
+    "BilledCost": "float64",
+    "EffectiveCost": "float64",
+    "ListCost": "float64",
+    "ConsumedQuantity": "float64",
+    "ChargePeriodStart": "datetime64[ns, UTC]",
+    "ChargePeriodEnd": "datetime64[ns, UTC]",
+    "BillingCurrency": "string",
+    "ProviderName": "string",
+    "ServiceName": "string",
+    "ResourceId": "string",
+    "ChargeCategory": "string",
+}
+
+_PROVIDERS = ["AWS", "Microsoft", "Google Cloud", "Oracle"]
+_SERVICES = ["Compute", "Storage", "Networking", "Database", "Analytics"]
+_CATEGORIES = ["Usage", "Purchase", "Tax", "Credit", "Adjustment"]
+
+
+def generate_csv(path: str, rows: int, dirty: bool = False, seed: int = 0) -> str:
+    """Write a FOCUS-shaped CSV with ``rows`` rows. ``dirty`` injects bad values."""
+    rng = np.random.default_rng(seed)
+    start = (
+        np.datetime64("2024-01-01T00:00:00")
+        + rng.integers(0, 365 * 24, rows).astype("timedelta64[h]")
+    ).astype("datetime64[us]")
+    billed = rng.gamma(2.0, 10.0, rows).round(6)
+    df = pl.DataFrame(
+        {
+            "BilledCost": billed,
+            "EffectiveCost": (billed * 0.9).round(6),
+            "ListCost": (billed * 1.1).round(6),
+            "ConsumedQuantity": rng.integers(1, 1000, rows).astype(float),
+            "ChargePeriodStart": start,
+            "ChargePeriodEnd": start + np.timedelta64(1, "h"),
+            "BillingCurrency": np.full(rows, "USD"),
+            "ProviderName": rng.choice(_PROVIDERS, rows),
+            "ServiceName": rng.choice(_SERVICES, rows),
+            "ResourceId": [f"res-{i:010d}" for i in rng.integers(0, rows, rows)],
+            "ChargeCategory": rng.choice(_CATEGORIES, rows),
+        }
+    ).with_columns(
+        pl.col("ChargePeriodStart").dt.strftime("%Y-%m-%dT%H:%M:%SZ"),
+        pl.col("ChargePeriodEnd").dt.strftime("%Y-%m-%dT%H:%M:%SZ"),
+    )
+    if dirty:
+        # ~0.1% unparseable costs force every engine onto the coercion path
+        bad = rng.random(rows) < 0.001
+        df = df.with_columns(
+            pl.when(pl.Series(bad))
+            .then(pl.lit("n/a"))
+            .otherwise(pl.col("BilledCost").cast(pl.Utf8))
+            .alias("BilledCost")
+        )
+    df.write_csv(path)
+    return path
+
+
+def _time_load(
+    path: str, engine: str, compression: Optional[str], repeat: int
+) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        loader = CSVDataLoader(
+            path, column_types=COLUMN_TYPES, compression=compression, engine=engine
+        )
+        start = time.perf_counter()
+        loader.load()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def run_benchmark(
+    rows: Sequence[int],
+    engines: Sequence[str] = tuple(CSV_ENGINES),
+    repeat: int = 3,
+    work_dir: Optional[str] = None,
+) -> List[Dict[str, Any]]:
+    """Time every engine on every generated input; return one record per input."""
+    own_dir = work_dir is None
+    work_dir = work_dir or tempfile.mkdtemp(prefix="focus-csv-bench-")
+    results = []
+    try:
+        for n in rows:
+            for dirty in (False, True):
+                path = os.path.join(
+                    work_dir, f"focus-{n}-{'dirty' if dirty else 'clean'}.csv"
+                )
+                generate_csv(path, n, dirty=dirty)
+                gz_path = path + ".gz"
+                with open(path, "rb") as src, gzip.open(
+                    gz_path, "wb", compresslevel=1
+                ) as dst:
+                    shutil.copyfileobj(src, dst)
+
+                for input_path, compression in ((path, None), (gz_path, "gzip")):
+                    timings = {
+                        engine: _time_load(input_path, engine, compression, repeat)
+                        for engine in engines
+                    }
+                    results.append(
+                        {
+                            "rows": n,
+                            "input": "dirty" if dirty else "clean",
+                            "compression": compression or "none",
+                            "size_mb": round(
+                                os.path.getsize(input_path) / 1024 / 1024, 2
+                            ),
+                            "cores": os.cpu_count() or 1,
+                            "seconds": {k: round(v, 4) for k, v in timings.items()},
+                            "winner": min(timings, key=lambda k: timings[k]),
+                        }
+                    )
+    finally:
+        if own_dir:
+            shutil.rmtree(work_dir, ignore_errors=True)
+    return results
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:  # pragma: no cover
+    parser = argparse.ArgumentParser(description="Benchmark the CSV loader engines.")
+    parser.add_argument(
+        "--rows", type=int, nargs="+", default=[10_000, 100_000, 1_000_000]
+    )
+    parser.add_argument(
+        "--engines", nargs="+", choices=list(CSV_ENGINES), default=list(CSV_ENGINES)
+    )
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--json", help="Also write the raw results to this file")
+    args = parser.parse_args(argv)
+
+    logging.disable(logging.WARNING)
+    results = run_benchmark(args.rows, args.engines, args.repeat)
+    table = [
+        [r["rows"], r["input"], r["compression"], r["size_mb"]]
+        + [r["seconds"][e] for e in args.engines]
+        + [r["winner"]]
+        for r in results
+    ]
+    print(f"CPU cores: {os.cpu_count()}")
+    print(
+        tabulate(
+            table,
+            headers=["rows", "input", "compression", "MB"]
+            + [f"{e} (s)" for e in args.engines]
+            + ["winner"],
+        )
+    )
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":  # pragma: no cover
+    main()
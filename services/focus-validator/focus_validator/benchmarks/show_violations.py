@@ -0,0 +1,138 @@
+"""
+Compare the cost of ``--show-violations`` with a plain run.
+
+    python -m focus_validator.benchmarks.show_violations --rows 1000000 20000000
+
+Every profile injects faults into a synthetic Parquet file, including rules
+that fail on most rows, where collecting samples and frequent values costs
+the most. The rules of the faulted column are validated with and without
+``--show-violations`` and the best execute-phase time of each is reported.
+"""
+
+import argparse
+import json
+import logging
+import os
+import shutil
+import tempfile
+from typing import Any, Dict, List, Optional, Sequence
+
+from tabulate import tabulate
+
+from focus_validator.benchmarks.synthetic import generate_frame, write_frame
+from focus_validator.validator import Validator
+
+# Profile -> (rules to validate, fault rates)
+PROFILES: Dict[str, Any] = {
+    # Null values: one frequent violating value
+    "mostly_null": ("BilledCost", {"BilledCost-C-003-M": 0.9}),
+    # Distinct violating values on most rows
+    "mostly_distinct": ("ResourceId", {"ResourceId-C-002-M": 0.9}),
+    "sparse": ("ResourceId", {"ResourceId-C-002-M": 0.001}),
+}
+
+
+def _time_execute(
+    path: str, filter_rules: str, show_violations: bool, work_dir: str, repeat: int
+) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        validator = Validator(
+            data_filename=path,
+            output_destination=os.path.join(work_dir, "results.xml"),
+            output_type="unittest",
+            rules_version="1.2",
+            focus_dataset="CostAndUsage",
+            filter_rules=filter_rules,
+            rules_block_remote_download=True,
+            show_violations=show_violations,
+        )
+        validator.validate()
+        best = min(best, validator.phase_seconds["execute"])
+    return best
+
+
+def run_benchmark(
+    rows: Sequence[int],
+    profiles: Sequence[str] = tuple(PROFILES),
+    repeat: int = 3,
+    work_dir: Optional[str] = None,
+) -> List[Dict[str, Any]]:
+    """Time every profile with and without samples; one record per input."""
+    own_dir = work_dir is None
+    work_dir = work_dir or tempfile.mkdtemp(prefix="focus-show-violations-bench-")
+    results = []
+    try:
+        for n in rows:
+            for profile in profiles:
+                filter_rules, rates = PROFILES[profile]
+                df, _ = generate_frame(n, rates)
+                path = write_frame(
+                    df,
+                    os.path.join(work_dir, f"focus-{profile}-{n}.parquet"),
+                    "parquet",
+                )
+                del df
+                plain = _time_execute(path, filter_rules, False, work_dir, repeat)
+                samples = _time_execute(path, filter_rules, True, work_dir, repeat)
+                results.append(
+                    {
+                        "rows": n,
+                        "profile": profile,
+                        "seconds": {
+                            "plain": round(plain, 4),
+                            "show_violations": round(samples, 4),
+                        },
+                        "overhead": round(samples / plain - 1, 3) if plain else None,
+                    }
+                )
+                os.remove(path)
+    finally:
+        if own_dir:
+            shutil.rmtree(work_dir, ignore_errors=True)
+    return results
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:  # pragma: no cover
+    parser = argparse.ArgumentParser(
+        description="Benchmark --show-violations against a plain run."
+    )
+    parser.add_argument("--rows", type=int, nargs="+", default=[100_000, 1_000_000])
+    parser.add_argument(
+        "--profiles", nargs="+", choices=list(PROFILES), default=list(PROFILES)
+    )
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--json", help="Also write the raw results to this file")
+    args = parser.parse_args(argv)
+
+    logging.disable(logging.WARNING)
+    results = run_benchmark(args.rows, args.profiles, args.repeat)
+    table = [
+        [
+            r["rows"],
+            r["profile"],
+            r["seconds"]["plain"],
+            r["seconds"]["show_violations"],
+            f"{r['overhead']:+.0%}" if r["overhead"] is not None else "",
+        ]
+        for r in results
+    ]
+    print(
+        tabulate(
+            table,
+            headers=[
+                "rows",
+                "profile",
+                "plain (s)",
+                "--show-violations (s)",
+                "overhead",
+            ],
+        )
+    )
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":  # pragma: no cover
+    main()
@@ -0,0 +1,268 @@
+"""
+End-to-end benchmark suite with per-phase timings and baseline comparison.
+
+    focus-validator-bench --rows 10000 100000 --baseline bench-baseline.json
+
+Every case (format x data profile x row count) runs the full ``Validator``
+pipeline under a tracing session; the load / plan / execute / output phases
+are read from the recorded spans. Results can be saved as a JSON baseline,
+and later runs report every phase that got slower than the baseline by more
+than the threshold (the command exits non-zero when there are regressions).
+"""
+
+import argparse
+import importlib.metadata
+import json
+import logging
+import math
+import os
+import platform
+import shutil
+import sys
+import tempfile
+import time
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+from tabulate import tabulate
+
+from focus_validator.benchmarks.synthetic import (
+    generate_frame,
+    uniform_rates,
+    write_frame,
+)
+from focus_validator.utils import tracing
+from focus_validator.validator import Validator
+
+BASELINE_VERSION = 1
+DEFAULT_ROWS = (10_000, 100_000, 1_000_000, 10_000_000)
+FORMATS = ("csv", "parquet")
+DATA_PROFILES = ("clean", "violations")
+DEFAULT_THRESHOLD = 0.20
+# Phase changes smaller than this are timer noise, whatever the ratio
+DEFAULT_MIN_DELTA_SECONDS = 0.05
+
+# Phase name -> span recorded by the pipeline
+PHASE_SPANS = {
+    "load": "data_loader.load",
+    "plan": "json_loader.load_json_rules_with_dependencies_and_types",
+    "execute": "spec_rules.validate",
+    "output": "outputter.write",
+    "total": "validator.validate",
+}
+PHASES = tuple(PHASE_SPANS)
+
+# Fault injection rate per catalogued rule for the violation-heavy profile
+VIOLATION_RATE = 0.02
+
+
+def case_key(fmt: str, profile: str, rows: int) -> str:
+    return f"{fmt}/{profile}/{rows}"
+
+
+def _phase_seconds(tracer: tracing.Tracer) -> Dict[str, float]:
+    seconds = {}
+    for phase, span_name in PHASE_SPANS.items():
+        spans = [s for s in tracer.spans if s.name == span_name]
+        seconds[phase] = sum(s.duration_ms for s in spans) / 1000.0
+    return seconds
+
+
+def run_case(path: str, fmt: str, work_dir: str, repeat: int = 1) -> Dict[str, float]:
+    """Validate ``path`` ``repeat`` times; return the best time of each phase."""
+    best: Dict[str, float] = {}
+    for _ in range(repeat):
+        validator = Validator(
+            data_filename=path,
+            data_format=fmt,
+            output_destination=os.path.join(work_dir, "results.xml"),
+            output_type="unittest",
+            rules_version="1.2",
+            focus_dataset="CostAndUsage",
+            rules_block_remote_download=True,
+        )
+        with tracing.trace_session() as tracer:
+            validator.validate()
+        for phase, value in _phase_seconds(tracer).items():
+            best[phase] = min(best.get(phase, math.inf), value)
+    return best
+
+
+def run_suite(
+    rows: Sequence[int] = DEFAULT_ROWS,
+    formats: Sequence[str] = FORMATS,
+    profiles: Sequence[str] = DATA_PROFILES,
+    repeat: int = 1,
+    work_dir: Optional[str] = None,
+) -> Dict[str, Any]:
+    """Run every case and return a baseline-shaped result document."""
+    own_dir = work_dir is None
+    work_dir = work_dir or tempfile.mkdtemp(prefix="focus-bench-")
+    results: Dict[str, Any] = {}
+    try:
+        for n in rows:
+            for profile in profiles:
+                rates = uniform_rates(VIOLATION_RATE) if profile == "violations" else {}
+                df, _ = generate_frame(n, rates)
+                for fmt in formats:
+                    path = write_frame(
+                        df, os.path.join(work_dir, f"focus-{profile}-{n}.{fmt}"), fmt
+                    )
+                    seconds = run_case(path, fmt, work_dir, repeat)
+                    results[case_key(fmt, profile, n)] = {
+                        "format": fmt,
+                        "data": profile,
+                        "rows": n,
+                        "size_mb": round(os.path.getsize(path) / 1024 / 1024, 2),
+                        "seconds": {k: round(v, 4) for k, v in seconds.items()},
+                    }
+                    os.remove(path)
+    finally:
+        if own_dir:
+            shutil.rmtree(work_dir, ignore_errors=True)
+
+    return {
+        "version": BASELINE_VERSION,
+        "created": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        "environment": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cores": os.cpu_count() or 1,
+            "duckdb": importlib.metadata.version("duckdb"),
+            "polars": importlib.metadata.version("polars"),
+        },
+        "results": results,
+    }
+
+
+def scaling_exponents(report: Dict[str, Any]) -> Dict[str, Optional[float]]:
+    """
+    Log-log slope of total time against row count per format/data series.
+    1.0 is linear scaling; None when a series has fewer than two sizes.
+    """
+    series: Dict[str, List[tuple]] = {}
+    for record in report["results"].values():
+        key = f"{record['format']}/{record['data']}"
+        series.setdefault(key, []).append((record["rows"], record["seconds"]["total"]))
+
+    exponents: Dict[str, Optional[float]] = {}
+    for key, points in series.items():
+        points = [(r, t) for r, t in sorted(points) if r > 0 and t > 0]
+        if len(points) < 2:
+            exponents[key] = None
+            continue
+        x = np.log([r for r, _ in points])
+        y = np.log([t for _, t in points])
+        exponents[key] = round(float(np.polyfit(x, y, 1)[0]), 3)
+    return exponents
+
+
+def compare_to_baseline(
+    report: Dict[str, Any],
+    baseline: Dict[str, Any],
+    threshold: float = DEFAULT_THRESHOLD,
+    min_delta_seconds: float = DEFAULT_MIN_DELTA_SECONDS,
+) -> List[Dict[str, Any]]:
+    """Return every case phase slower than the baseline by more than ``threshold``."""
+    regressions = []
+    for key, record in report["results"].items():
+        base = baseline.get("results", {}).get(key)
+        if not base:
+            continue
+        for phase in PHASES:
+            current = record["seconds"].get(phase)
+            previous = base["seconds"].get(phase)
+            if current is None or not previous:
+                continue
+            if (
+                current > previous * (1 + threshold)
+                and current - previous > min_delta_seconds
+            ):
+                regressions.append(
+                    {
+                        "case": key,
+                        "phase": phase,
+                        "baseline": previous,
+                        "current": current,
+                        "change": round(current / previous - 1, 4),
+                    }
+                )
+    return regressions
+
+
+def _results_table(report: Dict[str, Any]) -> str:
+    rows = []
+    for key, record in report["results"].items():
+        total = record["seconds"]["total"]
+        rows.append(
+            [key, record["size_mb"]]
+            + [record["seconds"][p] for p in PHASES]
+            + [int(record["rows"] / total) if total else None]
+        )
+    return tabulate(
+        rows, headers=["case", "MB"] + [f"{p} (s)" for p in PHASES] + ["rows/s"]
+    )
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:  # pragma: no cover
+    parser = argparse.ArgumentParser(
+        description="Benchmark the FOCUS validator end to end, per phase."
+    )
+    parser.add_argument("--rows", type=int, nargs="+", default=list(DEFAULT_ROWS))
+    parser.add_argument("--formats", nargs="+", choices=FORMATS, default=list(FORMATS))
+    parser.add_argument(
+        "--data", nargs="+", choices=DATA_PROFILES, default=list(DATA_PROFILES)
+    )
+    parser.add_argument("--repeat", type=int, default=1)
+    parser.add_argument("--work-dir", help="Directory for generated inputs")
+    parser.add_argument("--output", help="Write this run's results to this JSON file")
+    parser.add_argument("--baseline", help="Baseline JSON file to compare against")
+    parser.add_argument(
+        "--update-baseline",
+        action="store_true",
+        help="Overwrite --baseline with this run's results",
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=DEFAULT_THRESHOLD,
+        help="Relative slowdown that counts as a regression (default: 0.20)",
+    )
+    args = parser.parse_args(argv)
+
+    logging.disable(logging.WARNING)
+    report = run_suite(args.rows, args.formats, args.data, args.repeat, args.work_dir)
+    print(f"CPU cores: {report['environment']['cores']}")
+    print(_results_table(report))
+    print()
+    print(
+        tabulate(
+            sorted(scaling_exponents(report).items()),
+            headers=["series", "scaling exponent"],
+        )
+    )
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+
+    regressions: List[Dict[str, Any]] = []
+    if args.baseline and os.path.exists(args.baseline) and not args.update_baseline:
+        with open(args.baseline) as f:
+            regressions = compare_to_baseline(report, json.load(f), args.threshold)
+        print()
+        if regressions:
+            print(f"Regressions beyond {args.threshold:.0%}:")
+            print(tabulate(regressions, headers="keys"))
+        else:
+            print(f"No regressions beyond {args.threshold:.0%} against {args.baseline}")
+    elif args.baseline:
+        with open(args.baseline, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"\nWrote baseline to {args.baseline}")
+
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":  # pragma: no cover
+    sys.exit(main())
@@ -0,0 +1,405 @@
+"""
+Vectorized synthetic FOCUS 1.2 data with known rule violations.
+
+    python -m focus_validator.benchmarks.synthetic --rows 50000000 \\
+        --format parquet --partition-rows 1000000 --fault-rate 0.001 --out data/
+
+Rows are built column-at-a-time with NumPy and Polars, one partition at a
+time, so memory stays bounded by ``partition_rows`` whatever the total size.
+Clean rows follow ``scripts/generate_focus_csv.py`` (Usage charges without
+commitment discounts or capacity reservations). Faults are injected per rule
+into disjoint rows, so the violation count of every targeted rule equals the
+number of injected rows; ``expected_violations`` computes it up front and
+``write_dataset`` records it in ``manifest.json``.
+"""
+
+import argparse
+import json
+import logging
+import os
+from dataclasses import dataclass
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
+import polars as pl
+
+DEFAULT_PARTITION_ROWS = 1_000_000
+OUTPUT_FORMATS = {"csv": ".csv", "parquet": ".parquet", "arrow": ".arrow"}
+MANIFEST_FILE = "manifest.json"
+
+_SERVICES = [
+    ("Amazon Elastic Compute Cloud", "Compute", "Virtual Machines"),
+    ("Amazon Simple Storage Service", "Storage", "Object Storage"),
+    ("Amazon Relational Database Service", "Databases", "Relational Databases"),
+    ("AWS Lambda", "Compute", "Serverless Compute"),
+    ("Amazon DynamoDB", "Databases", "NoSQL Databases"),
+    ("Amazon CloudFront", "Networking", "Content Delivery"),
+    ("Amazon VPC", "Networking", "Network Connectivity"),
+    ("Amazon EKS", "Compute", "Containers"),
+]
+_REGIONS = [
+    ("us-east-1", "US East (N. Virginia)"),
+    ("us-west-2", "US West (Oregon)"),
+    ("eu-west-1", "Europe (Ireland)"),
+    ("ap-southeast-1", "Asia Pacific (Singapore)"),
+]
+_PRICING_CATEGORIES = ["Standard", "Dynamic"]
+_UNITS = ["Hours", "GB", "Requests", "Units"]
+_PROVIDER = "Amazon Web Services"
+_BILLING_PERIOD_START = np.datetime64("2024-09-01T00:00:00", "us")
+_BILLING_PERIOD_END = np.datetime64("2024-10-01T00:00:00", "us")
+
+
+@dataclass(frozen=True)
+class Fault:
+    """
+    A value corruption that violates exactly one unconditional rule.
+
+    Timestamp columns are never nulled: the loaders drop datetime columns
+    with nulls, which would turn row counts into a missing-column failure.
+    """
+
+    rule_id: str
+    column: str
+    kind: str  # null | non_ascii | bad_currency | negative
+
+
+FAULTS: Dict[str, Fault] = {
+    fault.rule_id: fault
+    for fault in (
+        Fault("BilledCost-C-003-M", "BilledCost", "null"),
+        Fault("BillingAccountId-C-001-M", "BillingAccountId", "null"),
+        Fault("BillingCurrency-C-003-M", "BillingCurrency", "bad_currency"),
+        Fault("ChargeCategory-C-002-M", "ChargeCategory", "null"),
+        Fault("EffectiveCost-C-003-M", "EffectiveCost", "null"),
+        Fault("InvoiceIssuerName-C-003-M", "InvoiceIssuerName", "null"),
+        Fault("ListUnitPrice-C-008-M", "ListUnitPrice", "negative"),
+        Fault("ProviderName-C-003-M", "ProviderName", "null"),
+        Fault("ResourceId-C-002-M", "ResourceId", "non_ascii"),
+        Fault("ServiceName-C-003-M", "ServiceName", "null"),
+        Fault("ServiceCategory-C-002-M", "ServiceCategory", "null"),
+        Fault("SubAccountName-C-002-M", "SubAccountName", "non_ascii"),
+    )
+}
+
+
+def _validate_rates(rates: Mapping[str, float]) -> None:
+    unknown = set(rates) - set(FAULTS)
+    if unknown:
+        raise ValueError(
+            f"No fault defined for rule(s): {', '.join(sorted(unknown))}. "
+            f"Choose from: {', '.join(FAULTS)}"
+        )
+    if any(rate < 0 for rate in rates.values()) or sum(rates.values()) > 1:
+        raise ValueError("Fault rates must be non-negative and sum to at most 1")
+
+
+def _fault_counts(rows: int, rates: Mapping[str, float]) -> Dict[str, int]:
+    return {rule_id: int(round(rate * rows)) for rule_id, rate in rates.items()}
+
+
+def _partition_sizes(rows: int, partition_rows: int) -> List[int]:
+    if partition_rows <= 0:
+        raise ValueError("partition_rows must be positive")
+    full, rest = divmod(rows, partition_rows)
+    return [partition_rows] * full + ([rest] if rest else [])
+
+
+def expected_violations(
+    rows: int,
+    rates: Mapping[str, float],
+    partition_rows: int = DEFAULT_PARTITION_ROWS,
+) -> Dict[str, int]:
+    """Violation count per targeted rule for a dataset of ``rows`` rows."""
+    _validate_rates(rates)
+    totals: Dict[str, int] = {rule_id: 0 for rule_id in rates}
+    for size in _partition_sizes(rows, partition_rows):
+        for rule_id, count in _fault_counts(size, rates).items():
+            totals[rule_id] += count
+    return totals
+
+
+def _pick(rng: np.random.Generator, values: Sequence, rows: int) -> pl.Series:
+    return pl.Series(values)[rng.integers(0, len(values), rows)]
+
+
+def clean_frame(rows: int, seed: int = 0, offset: int = 0) -> pl.DataFrame:
+    """Valid FOCUS 1.2 Usage rows; ``offset`` keeps ids unique across partitions."""
+    rng = np.random.default_rng(seed)
+    service_idx = rng.integers(0, len(_SERVICES), rows)
+    region_idx = rng.integers(0, len(_REGIONS), rows)
+    period_hours = int(
+        (_BILLING_PERIOD_END - _BILLING_PERIOD_START) // np.timedelta64(1, "h")
+    )
+    charge_start = _BILLING_PERIOD_START + rng.integers(0, period_hours, rows).astype(
+        "timedelta64[h]"
+    )
+    billed = rng.uniform(0.01, 100, rows).round(6)
+    consumed = rng.uniform(0.001, 100, rows).round(6)
+    unit_price = (billed / np.maximum(consumed, 0.001)).round(6)
+
+    base = pl.DataFrame(
+        {
+            "_row": pl.int_range(offset, offset + rows, eager=True),
+            "_service": service_idx,
+            "_region": region_idx,
+            "_unit": _pick(rng, _UNITS, rows),
+            "_pricing": _pick(rng, _PRICING_CATEGORIES, rows),
+            "_billed": billed,
+            "_consumed": consumed,
+            "_unit_price": unit_price,
+            "_charge_start": charge_start,
+        }
+    )
+    service = pl.col("_service")
+    region_id = pl.lit(pl.Series([r[0] for r in _REGIONS])).gather(pl.col("_region"))
+    service_name = pl.lit(pl.Series([s[0] for s in _SERVICES])).gather(service)
+    row_id = pl.col("_row").cast(pl.Utf8)
+    billed_col, unit_price_col = pl.col("_billed"), pl.col("_unit_price")
+    charge_start_utc = pl.col("_charge_start").dt.replace_time_zone("UTC")
+    null_str = pl.lit(None, dtype=pl.Utf8)
+
+    def const(value: str) -> pl.Expr:
+        return pl.lit(value, dtype=pl.Utf8)
+
+    def timestamp(value: np.datetime64) -> pl.Expr:
+        return pl.lit(value.astype(object), dtype=pl.Datetime("us", "UTC"))
+
+    return base.select(
+        AvailabilityZone=region_id + "a",
+        BilledCost=billed_col,
+        BillingAccountId=const("123456789012"),
+        BillingAccountName=const("Main Account"),
+        BillingAccountType=const("Consolidated"),
+        BillingCurrency=const("USD"),
+        BillingPeriodEnd=timestamp(_BILLING_PERIOD_END),
+        BillingPeriodStart=timestamp(_BILLING_PERIOD_START),
+        ChargeCategory=const("Usage"),
+        ChargeClass=null_str,
+        ChargeDescription="Usage charge for " + service_name,
+        ChargeFrequency=const("Usage-Based"),
+        ChargePeriodEnd=charge_start_utc + pl.duration(hours=1),
+        ChargePeriodStart=charge_start_utc,
+        ConsumedQuantity=pl.col("_consumed"),
+        ConsumedUnit=pl.col("_unit"),
+        ContractedCost=billed_col,
+        ContractedUnitPrice=unit_price_col,
+        EffectiveCost=billed_col,
+        InvoiceIssuerName=const(_PROVIDER),
+        ListCost=billed_col,
+        ListUnitPrice=unit_price_col,
+        PricingCategory=pl.col("_pricing"),
+        PricingCurrency=const("USD"),
+        PricingQuantity=pl.col("_consumed"),
+        PricingUnit=pl.col("_unit"),
+        ProviderName=const(_PROVIDER),
+        PublisherName=const(_PROVIDER),
+        RegionId=region_id,
+        RegionName=pl.lit(pl.Series([r[1] for r in _REGIONS])).gather(
+            pl.col("_region")
+        ),
+        ResourceId=pl.format(
+            "arn:aws:ec2:{}:123456789012:instance/i-{}", region_id, row_id.str.zfill(8)
+        ),
+        ResourceName="Resource-" + row_id,
+        ResourceType=const("Compute Instance"),
+        ServiceCategory=pl.lit(pl.Series([s[1] for s in _SERVICES])).gather(service),
+        ServiceName=service_name,
+        ServiceSubcategory=pl.lit(pl.Series([s[2] for s in _SERVICES])).gather(service),
+        SkuId="SKU" + row_id.str.zfill(6),
+        SkuPriceId="SKU" + row_id.str.zfill(6),
+        SubAccountId=const("987654321098"),
+        SubAccountName=const("Development"),
+        SubAccountType=const("Linked"),
+        CommitmentDiscountCategory=null_str,
+        CommitmentDiscountId=null_str,
+        CommitmentDiscountName=null_str,
+        CommitmentDiscountStatus=null_str,
+        CommitmentDiscountType=null_str,
+        CommitmentDiscountUnit=null_str,
+        CommitmentDiscountQuantity=pl.lit(None, dtype=pl.Float64),
+        CapacityReservationId=null_str,
+        CapacityReservationStatus=null_str,
+        InvoiceId="INV-2024-" + row_id.str.zfill(6),
+        SkuMeter=pl.col("_unit") + "/Hour",
+        SkuPriceDetails=null_str,
+        Tags=null_str,
+        PricingCurrencyContractedUnitPrice=unit_price_col,
+        PricingCurrencyEffectiveCost=billed_col,
+        PricingCurrencyListUnitPrice=unit_price_col,
+    )
+
+
+def _corrupt(column: str, kind: str, mask: pl.Series) -> pl.Expr:
+    col = pl.col(column)
+    if kind == "null":
+        bad = pl.lit(None)
+    elif kind == "non_ascii":
+        bad = col + "é"
+    elif kind == "bad_currency":
+        bad = col.str.to_lowercase()
+    elif kind == "negative":
+        bad = -col.abs() - 1
+    else:
+        raise ValueError(f"Unknown fault kind '{kind}'")
+    return pl.when(mask).then(bad).otherwise(col).alias(column)
+
+
+def generate_frame(
+    rows: int,
+    rates: Optional[Mapping[str, float]] = None,
+    seed: int = 0,
+    offset: int = 0,
+) -> Tuple[pl.DataFrame, Dict[str, int]]:
+    """
+    Clean rows with faults injected at ``rates`` (rule_id -> fraction of rows).
+    Returns the frame and the number of injected rows per rule.
+    """
+    rates = dict(rates or {})
+    _validate_rates(rates)
+    df = clean_frame(rows, seed=seed, offset=offset)
+    counts = _fault_counts(rows, rates)
+    if not counts:
+        return df, counts
+
+    # Disjoint row sets keep every targeted rule's count exact
+    order = np.random.default_rng(seed + 1).permutation(rows)
+    exprs, start = [], 0
+    for rule_id, count in counts.items():
+        mask = np.zeros(rows, dtype=bool)
+        mask[order[start : start + count]] = True
+        start += count
+        fault = FAULTS[rule_id]
+        exprs.append(_corrupt(fault.column, fault.kind, pl.Series(mask)))
+    return df.with_columns(exprs), counts
+
+
+def uniform_rates(
+    rate: float, rule_ids: Optional[Sequence[str]] = None
+) -> Dict[str, float]:
+    """The same injection rate for every catalogued fault (or ``rule_ids``)."""
+    return {rule_id: rate for rule_id in (rule_ids or FAULTS)}
+
+
+def write_frame(df: pl.DataFrame, path: str, fmt: str) -> str:
+    if fmt == "csv":
+        df.write_csv(path, datetime_format="%Y-%m-%dT%H:%M:%SZ")
+    elif fmt == "parquet":
+        df.write_parquet(path)
+    elif fmt == "arrow":
+        df.write_ipc(path)
+    else:
+        raise ValueError(
+            f"Unsupported output format '{fmt}'. Choose one of: {', '.join(OUTPUT_FORMATS)}"
+        )
+    return path
+
+
+def write_dataset(
+    out_dir: str,
+    rows: int,
+    fmt: str = "parquet",
+    partition_rows: int = DEFAULT_PARTITION_ROWS,
+    rates: Optional[Mapping[str, float]] = None,
+    seed: int = 0,
+) -> Dict[str, Any]:
+    """
+    Write ``rows`` rows as ``part-NNNNN`` files of at most ``partition_rows``
+    rows and a manifest with the expected violations per rule.
+    """
+    if fmt not in OUTPUT_FORMATS:
+        raise ValueError(
+            f"Unsupported output format '{fmt}'. Choose one of: {', '.join(OUTPUT_FORMATS)}"
+        )
+    rates = dict(rates or {})
+    os.makedirs(out_dir, exist_ok=True)
+    seeds = np.random.SeedSequence(seed).generate_state(
+        max(1, len(_partition_sizes(rows, partition_rows)))
+    )
+
+    partitions = []
+    totals: Dict[str, int] = {rule_id: 0 for rule_id in rates}
+    offset = 0
+    for i, size in enumerate(_partition_sizes(rows, partition_rows)):
+        df, counts = generate_frame(size, rates, seed=int(seeds[i]), offset=offset)
+        path = write_frame(
+            df, os.path.join(out_dir, f"part-{i:05d}{OUTPUT_FORMATS[fmt]}"), fmt
+        )
+        partitions.append(
+            {"path": os.path.basename(path), "rows": size, "violations": counts}
+        )
+        for rule_id, count in counts.items():
+            totals[rule_id] += count
+        offset += size
+
+    manifest = {
+        "rows": rows,
+        "format": fmt,
+        "seed": seed,
+        "rates": rates,
+        "expected_violations": totals,
+        "partitions": partitions,
+    }
+    with open(os.path.join(out_dir, MANIFEST_FILE), "w") as f:
+        json.dump(manifest, f, indent=2)
+    return manifest
+
+
+def _parse_rate(value: str) -> Tuple[str, float]:
+    rule_id, _, rate = value.partition("=")
+    if not rate:
+        raise argparse.ArgumentTypeError(f"Expected RULE_ID=RATE, got '{value}'")
+    return rule_id, float(rate)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:  # pragma: no cover
+    parser = argparse.ArgumentParser(
+        description="Generate partitioned synthetic FOCUS 1.2 data with known violations."
+    )
+    parser.add_argument("--rows", type=int, default=DEFAULT_PARTITION_ROWS)
+    parser.add_argument("--out", help="Output directory")
+    parser.add_argument("--format", choices=list(OUTPUT_FORMATS), default="parquet")
+    parser.add_argument("--partition-rows", type=int, default=DEFAULT_PARTITION_ROWS)
+    parser.add_argument(
+        "--fault-rate",
+        type=float,
+        default=0.0,
+        help="Inject every catalogued fault into this fraction of rows",
+    )
+    parser.add_argument(
+        "--rate",
+        type=_parse_rate,
+        action="append",
+        default=[],
+        metavar="RULE_ID=RATE",
+        help="Injection rate for one rule (overrides --fault-rate for that rule)",
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--list-faults", action="store_true", help="List the injectable rules and exit"
+    )
+    args = parser.parse_args(argv)
+
+    if args.list_faults:
+        for fault in FAULTS.values():
+            print(f"{fault.rule_id:<30} {fault.column:<20} {fault.kind}")
+        return
+    if not args.out:
+        parser.error("--out is required")
+
+    rates = uniform_rates(args.fault_rate) if args.fault_rate else {}
+    rates.update(dict(args.rate))
+    logging.getLogger(__name__).info("Writing %d rows to %s", args.rows, args.out)
+    manifest = write_dataset(
+        args.out, args.rows, args.format, args.partition_rows, rates, args.seed
+    )
+    print(
+        f"Wrote {manifest['rows']} rows in {len(manifest['partitions'])} "
+        f"partition(s) to {args.out}"
+    )
+    for rule_id, count in manifest["expected_violations"].items():
+        print(f"  {rule_id}: {count} expected violations")
+
+
+if __name__ == "__main__":  # pragma: no cover
+    main()
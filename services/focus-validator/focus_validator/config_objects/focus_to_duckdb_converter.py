@@ -1,23 +1,50 @@
 import inspect
 import json
 import logging
+import math
+import os
 import re
 import textwrap
 import time
 from abc import ABC, abstractmethod
+from contextlib import contextmanager
 from types import MappingProxyType, SimpleNamespace
-from typing import Any, Callable, ClassVar, Dict, List, Optional, Tuple, Union
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    ClassVar,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
 
 import duckdb  # type: ignore[import-untyped]
+import pandas as pd
 import sqlglot  # type: ignore[import-untyped]
 import sqlglot.expressions as exp  # type: ignore[import-untyped]
 
 from focus_validator.exceptions import InvalidRuleException
 from focus_validator.utils.download_currency_codes import get_currency_codes
+from focus_validator.utils.metrics import MetricsCollector, RowsScannedProbe
+from focus_validator.utils.sampling import (
+    DEFAULT_CONFIDENCE,
+    sample_clause,
+    wilson_interval,
+)
+from focus_validator.utils.sql_profiler import SQLProfiler
+from focus_validator.utils.tracing import traced
 
 from .plan_builder import EdgeCtx, ValidationPlan
 from .rule import ModelRule
 
+if TYPE_CHECKING:
+    from .incremental import PartitionStateStore
+    from .result_cache import ResultCache
+
 log = logging.getLogger(__name__)
 
 
@@ -28,6 +55,281 @@ def _compact_json(data: dict, max_len: int = 600) -> str:
     return s[:max_len] + " ... (truncated)"
 
 
+def _count(conn: duckdb.DuckDBPyConnection, table_name: str) -> int:
+    row = conn.execute(f"SELECT COUNT(*) FROM {table_name}").fetchone()
+    return int(row[0]) if row is not None else 0
+
+
+# --- Violation counting ----------------------------------------------------
+
+COUNT_MODES = ("exact", "exists", "capped:N")
+_INVALID_CTE = re.compile(r"\binvalid\s+AS\s*\(", re.IGNORECASE)
+# Checks whose result depends on more than one row (or on no rows at all),
+# so a sample says nothing about the full table
+EXACT_CHECK_TYPES = frozenset({"column_presence", "distinct_count"})
+_CROSS_ROW_SQL = re.compile(r"\bGROUP\s+BY\b|\bOVER\s*\(|\bDISTINCT\b", re.IGNORECASE)
+# The part of a leaf query after its invalid CTE: one aggregate row over it
+_OUTER_SELECT = re.compile(
+    r"^\s*SELECT\s+(?P<columns>.*\bAS\s+violations\b.*?)\s+FROM\s+invalid\s*;?\s*$",
+    re.IGNORECASE | re.DOTALL,
+)
+_CTE_SELECT = re.compile(r"^\s*SELECT\s", re.IGNORECASE)
+GROUP_COLUMN = "__focus_group"
+NULL_GROUP = "<null>"
+_IDENTIFIER = re.compile(r"[A-Za-z_][A-Za-z0-9_]*")
+SAMPLE_ROW_COLUMN = "__focus_row"
+VALUE_COLUMN = "__focus_value"
+TOTAL_COLUMN = "__focus_total"
+# Generator params naming the columns whose values a check judges
+VALUE_COLUMN_PARAMS = ("ColumnName", "ColumnAName", "ColumnBName", "ResultColumnName")
+
+
+def parse_count_mode(count_mode: str) -> Optional[int]:
+    """Violation cap for a count mode: None for exact counts, 1 for exists."""
+    if count_mode == "exact":
+        return None
+    if count_mode == "exists":
+        return 1
+    kind, _, value = count_mode.partition(":")
+    if kind == "capped" and value.isdigit() and int(value) > 0:
+        return int(value)
+    raise ValueError(
+        f"Unsupported count mode '{count_mode}'. Choose one of: {', '.join(COUNT_MODES)}"
+    )
+
+
+def _closing_paren(sql: str, start: int) -> Optional[int]:
+    """Position of the ``)`` closing a parenthesis opened just before ``start``."""
+    depth = 1
+    quote = None
+    for pos in range(start, len(sql)):
+        char = sql[pos]
+        if quote:
+            if char == quote:
+                quote = None
+        elif char in ("'", '"'):
+            quote = char
+        elif char == "(":
+            depth += 1
+        elif char == ")":
+            depth -= 1
+            if depth == 0:
+                return pos
+    return None
+
+
+def limit_violations(sql: str, limit: int) -> str:
+    """
+    Bound a leaf query's ``invalid`` CTE with ``LIMIT``, so ``COUNT(*) AS
+    violations`` over it stops scanning after ``limit`` violating rows.
+    Queries without that CTE (e.g. schema checks) are returned unchanged.
+    """
+    match = _INVALID_CTE.search(sql)
+    if match is None:
+        return sql
+    pos = _closing_paren(sql, match.end())
+    if pos is None:
+        return sql
+    return f"{sql[:pos].rstrip()}\n    LIMIT {limit}\n{sql[pos:]}"
+
+
+def grouped_violations_sql(sql: str, group_expr: str, alias: str) -> Optional[str]:
+    """
+    Rewrite a leaf query to return its violation count (and message) per
+    value of ``group_expr``, or None when the query does not have the
+    ``WITH invalid AS (SELECT ... FROM table ...) SELECT ... FROM invalid``
+    shape. The invalid CTE also selects ``group_expr AS alias`` and the
+    final aggregate is grouped by it, so all groups come from one scan.
+    """
+    match = _INVALID_CTE.search(sql)
+    if match is None:
+        return None
+    close = _closing_paren(sql, match.end())
+    if close is None:
+        return None
+    body = sql[match.end() : close]
+    outer = _OUTER_SELECT.match(sql[close + 1 :])
+    select = _CTE_SELECT.match(body)
+    if outer is None or select is None:
+        return None
+    # A column already named ``alias`` (e.g. on a partitioned view) is used as is
+    selected = alias if group_expr == alias else f"{group_expr} AS {alias}"
+    return (
+        sql[: match.end()]
+        + f"{select.group(0)}{selected}, "
+        + body[select.end() :]
+        + ")\n"
+        + f"SELECT {alias}, {outer.group('columns')}\n"
+        + f"FROM invalid GROUP BY {alias}"
+    )
+
+
+def _quote_identifier(column: str) -> str:
+    return '"{}"'.format(column.replace('"', '""'))
+
+
+def _struct_of(columns: List[str]) -> str:
+    fields = ", ".join(
+        f"{_quote_identifier(column)} := {_quote_identifier(column)}"
+        for column in columns
+    )
+    return f"struct_pack({fields})"
+
+
+def _leaf_parts(sql: str) -> Optional[Tuple[str, str, str, str]]:
+    """
+    Split a ``WITH invalid AS (SELECT ...) SELECT ... AS violations ...
+    FROM invalid`` leaf query into the text before the invalid CTE, the
+    CTE's ``SELECT`` keyword, the rest of its body and the outer aggregate
+    columns; None for other shapes.
+    """
+    match = _INVALID_CTE.search(sql)
+    if match is None:
+        return None
+    close = _closing_paren(sql, match.end())
+    if close is None:
+        return None
+    body = sql[match.end() : close]
+    outer = _OUTER_SELECT.match(sql[close + 1 :])
+    select = _CTE_SELECT.match(body)
+    if outer is None or select is None:
+        return None
+    return (
+        sql[: match.start()],
+        select.group(0),
+        body[select.end() :],
+        outer.group("columns"),
+    )
+
+
+def _table_columns_in(
+    body: str, names: List[str], table_columns: List[str]
+) -> List[str]:
+    """The table columns among ``names`` (case-insensitive) that ``body`` mentions."""
+    tokens = {token.casefold() for token in _IDENTIFIER.findall(body)}
+    by_name = {column.casefold(): column for column in table_columns}
+    return [
+        by_name[name.casefold()]
+        for name in names
+        if name.casefold() in by_name and name.casefold() in tokens
+    ]
+
+
+def fused_top_values_sql(
+    sql: str, table_columns: List[str], value_columns: List[str], top_n: int
+) -> Optional[str]:
+    """
+    Rewrite a leaf query to also return, from the same scan, the ``top_n``
+    most frequent violating values of the check's ``value_columns`` with
+    their counts (``__focus_top_values``). A value is the bare column for
+    one value column and a struct for several. The violation count and the
+    per-value counts come from one GROUPING SETS aggregate, so only the
+    value columns are hashed. Returns None for queries without the invalid
+    CTE, or when a value column is not a table column the CTE reads.
+    """
+    parts = _leaf_parts(sql)
+    if parts is None or not value_columns:
+        return None
+    head, select, rest, columns = parts
+    resolved = _table_columns_in(rest, value_columns, table_columns)
+    if len(resolved) != len(value_columns):
+        return None
+    value = (
+        _quote_identifier(resolved[0]) if len(resolved) == 1 else _struct_of(resolved)
+    )
+    top = (
+        f"SELECT {VALUE_COLUMN}, violations FROM __focus_counts "
+        f"WHERE {TOTAL_COLUMN} = 0 ORDER BY violations DESC, {VALUE_COLUMN} "
+        f"LIMIT {int(top_n)}"
+    )
+    return (
+        head
+        + f"invalid AS ({select}{value} AS {VALUE_COLUMN}, {rest}),\n"
+        + f"__focus_counts AS MATERIALIZED (SELECT GROUPING({VALUE_COLUMN}) "
+        + f"AS {TOTAL_COLUMN}, {VALUE_COLUMN}, {columns}\n"
+        + f"FROM invalid GROUP BY GROUPING SETS ((), ({VALUE_COLUMN})))\n"
+        + f"SELECT * EXCLUDE ({TOTAL_COLUMN}, {VALUE_COLUMN}),\n"
+        + f"(SELECT list(struct_pack(value := {VALUE_COLUMN}, count := violations) "
+        + f"ORDER BY violations DESC, {VALUE_COLUMN}) FROM ({top})) "
+        + "AS __focus_top_values\n"
+        + f"FROM __focus_counts WHERE {TOTAL_COLUMN} = 1"
+    )
+
+
+def violation_sample_sql(
+    sql: str, table_columns: List[str], sample_limit: int
+) -> Optional[str]:
+    """
+    Query for up to ``sample_limit`` violating rows of a leaf query, as a
+    list of structs of the table columns its invalid CTE reads
+    (``__focus_sample``). The CTE is not materialized, so the scan stops
+    once enough violating rows are found. Returns None for queries without
+    the invalid CTE or without known columns.
+    """
+    parts = _leaf_parts(sql)
+    if parts is None:
+        return None
+    head, select, rest, _ = parts
+    referenced = _table_columns_in(rest, table_columns, table_columns)
+    if not referenced:
+        return None
+    return (
+        head
+        + f"invalid AS ({select}{_struct_of(referenced)} AS {SAMPLE_ROW_COLUMN}, "
+        + f"{rest})\n"
+        + f"SELECT list({SAMPLE_ROW_COLUMN}) AS __focus_sample FROM "
+        + f"(SELECT {SAMPLE_ROW_COLUMN} FROM invalid LIMIT {int(sample_limit)})"
+    )
+
+
+def group_label_expr(column: str) -> str:
+    """Text label of a column's value for per-group results."""
+    return f"COALESCE(CAST({column} AS VARCHAR), '{NULL_GROUP}')"
+
+
+def is_row_local(check_type: Optional[str], sql: str) -> bool:
+    """Whether a leaf query's violations can be counted row by row on a sample."""
+    if check_type in EXACT_CHECK_TYPES:
+        return False
+    if len(re.findall(r"\{\{?table_name\}\}?", sql)) != 1:
+        return False
+    return _CROSS_ROW_SQL.search(sql) is None
+
+
+def row_violation_predicate(check: Any) -> Optional[str]:
+    """
+    Boolean SQL that is true for the rows violating ``check``, or None when
+    its outcome is not decided row by row. Leaves use the predicate their
+    generator built with ``_apply_condition``; a row violates an AND
+    composite when it violates any child, and an OR composite when it
+    violates all of them.
+    """
+    if getattr(check, "force_fail_due_to_upstream", None):
+        return None
+    nested = getattr(check, "nestedChecks", None) or []
+    if nested:
+        handler = getattr(check, "nestedCheckHandler", None)
+        joiner = {"all": " OR ", "any": " AND "}.get(getattr(handler, "__name__", ""))
+        predicates = [row_violation_predicate(child) for child in nested]
+        if joiner is None or any(p is None for p in predicates):
+            return None
+        return "(" + joiner.join(f"({p})" for p in predicates) + ")"
+    if getattr(check, "special_executor", None) is not None:
+        return None
+    predicate = (getattr(check, "meta", None) or {}).get("violation_predicate")
+    sql = getattr(check, "checkSql", None) or ""
+    check_type = getattr(check, "checkType", None) or getattr(check, "check_type", None)
+    if not predicate or predicate not in sql or not is_row_local(check_type, sql):
+        return None
+    return predicate
+
+
+def _has_error(details: Dict[str, Any]) -> bool:
+    if details.get("error") or details.get("missing_columns"):
+        return True
+    return any(_has_error(child) for child in details.get("children") or [])
+
+
 # --- SQLGlot Integration -------------------------------------------------
 
 
@@ -217,6 +519,7 @@ class DuckDBCheckGenerator(ABC):
         self.plan = kwargs.pop("plan", None)
         self.row_condition_sql = kwargs.pop("row_condition_sql", None)
         self.exec_mode = kwargs.pop("exec_mode", "requirement")
+        self.violation_predicate: Optional[str] = None
         # Validate required keys (allow defaults to satisfy)
         missing = self.REQUIRED_KEYS - (set(kwargs) | set(self.DEFAULTS))
         if missing:
@@ -300,6 +603,18 @@ class DuckDBCheckGenerator(ABC):
             "generator": self.__class__.__name__,
             "row_condition_sql": getattr(self, "row_condition_sql", None),
             "exec_mode": getattr(self, "exec_mode", "requirement"),
+            # Boolean "row violates this check" expression, when the
+            # generator built its WHERE clause with _apply_condition
+            "violation_predicate": getattr(self, "violation_predicate", None),
+            # Columns whose violating values --show-violations counts
+            "value_columns": [
+                self.p[key]
+                for key in VALUE_COLUMN_PARAMS
+                if isinstance(self.p.get(key), str)
+            ],
+            # Group column, value column, expected count and message of a
+            # distinct-count check, which incremental state merges per group
+            "distinct_count": getattr(self, "distinct_count", None),
         }
 
         # 4) Create the final check object
@@ -350,9 +665,11 @@ class DuckDBCheckGenerator(ABC):
         AND it with the effective row_condition_sql if present.
         """
         cond = (self.row_condition_sql or "").strip()
-        if not cond:
-            return violation_pred_sql
-        return f"(({violation_pred_sql})) AND ({cond})"
+        if cond:
+            violation_pred_sql = f"(({violation_pred_sql})) AND ({cond})"
+        # Kept for the row-level violation matrix (see generateCheck)
+        self.violation_predicate = violation_pred_sql
+        return violation_pred_sql
 
     def _lit(self, v) -> str:
         if v is None:
@@ -1415,6 +1732,12 @@ class CheckDistinctCountGenerator(DuckDBCheckGenerator):
             or f"For each {a}, there MUST be exactly {n} distinct {b} values."
         )
         msg_sql = message.replace("'", "''")
+        self.distinct_count = {
+            "group": a,
+            "values": b,
+            "expected": int(n),
+            "message": message,
+        }
 
         # Requirement SQL (finds violations)
         requirement_sql = f"""
@@ -1736,17 +2059,19 @@ class CompositeBaseRuleGenerator(DuckDBCheckGenerator):
                 "failed_dependencies": all_failed,
                 "reason": "upstream dependency failure",
             }
-            # Give a clear message now (executor will reuse it)
+            # Give a clear message now (executor will reuse it). Results are
+            # gathered in execution order, which --schedule cost changes, so
+            # sort them for a report that does not depend on the schedule.
             failure_reason = (
                 f"external dependencies: {external_failed}" if external_failed else ""
             )
             conformance_reason = (
-                f"conformance rules: {failed_conformance_refs}"
+                f"conformance rules: {sorted(failed_conformance_refs)}"
                 if failed_conformance_refs
                 else ""
             )
             same_column_reason = (
-                f"same-column rules: {failed_same_column_rules}"
+                f"same-column rules: {sorted(failed_same_column_rules)}"
                 if failed_same_column_rules
                 else ""
             )
@@ -1868,7 +2193,9 @@ class CompositeORRuleGenerator(CompositeBaseRuleGenerator):
                 total_rows = None
 
                 for child in original_nested_checks:
-                    ok_i, det_i = converter.run_check(child)
+                    # Compared against the row count below, so never capped
+                    with converter.or_child_counts():
+                        ok_i, det_i = converter.run_check(child)
                     violations = det_i.get("violations", 1)
 
                     # Get total row count if we don't have it yet
@@ -1885,8 +2212,9 @@ class CompositeORRuleGenerator(CompositeBaseRuleGenerator):
                             total_rows = 1  # Fallback
 
                     # OR semantics: child passes if it has fewer violations than total rows
-                    # (meaning at least one row matched the condition)
-                    or_child_ok = violations < total_rows
+                    # (meaning at least one row matched the condition); a
+                    # sampled count is compared with the sample's rows
+                    or_child_ok = violations < det_i.get("rows_checked", total_rows)
                     child_oks.append(or_child_ok)
 
                     # Update the details to reflect OR semantics
@@ -1999,9 +2327,25 @@ class CompositeORRuleGenerator(CompositeBaseRuleGenerator):
         return " OR ".join(preds) if preds else "FALSE"
 
 
+def _check_span_attributes(self: Any, check: Any) -> Dict[str, Any]:
+    return {
+        "rule_id": getattr(check, "rule_id", None),
+        "check_type": getattr(check, "checkType", None)
+        or getattr(check, "check_type", None),
+    }
+
+
+def _result_span_attributes(result: Tuple[bool, Dict[str, Any]]) -> Dict[str, Any]:
+    ok, details = result
+    return {"ok": ok, "violations": details.get("violations")}
+
+
 class FocusToDuckDBSchemaConverter:
     # Central configuration for sample violation data collection
     DEFAULT_SAMPLE_LIMIT = 2  # Number of sample violation rows to collect when --show-violations is enabled
+    DEFAULT_TOP_VALUES = (
+        5  # Most frequent violating values reported with --show-violations
+    )
 
     # Default registry for all check types with both generators and check object factories
     # This serves as the base mapping that all versions inherit from
@@ -2210,6 +2554,16 @@ class FocusToDuckDBSchemaConverter:
         transpile_dialect: Optional[str] = None,
         show_violations: bool = False,
         rules_version: Optional[str] = None,
+        metrics: Optional[MetricsCollector] = None,
+        sql_profiler: Optional[SQLProfiler] = None,
+        violation_limit: Optional[int] = None,
+        sample: Optional[str] = None,
+        incremental: Optional["PartitionStateStore"] = None,
+        result_cache: Optional["ResultCache"] = None,
+        group_by: Optional[str] = None,
+        violation_matrix: Optional[str] = None,
+        export_violations: Optional[str] = None,
+        export_violations_limit: Optional[int] = None,
     ) -> None:
         self.log = logging.getLogger(f"{__name__}.{self.__class__.__qualname__}")
         self.conn: duckdb.DuckDBPyConnection | None = None
@@ -2223,6 +2577,36 @@ class FocusToDuckDBSchemaConverter:
         )
         self.show_violations = show_violations
         self.rules_version = rules_version
+        # Optional per-node timing/rows/memory collector (None = no overhead)
+        self.metrics = metrics
+        # Optional DuckDB query-profile capture around leaf queries
+        self.sql_profiler = sql_profiler
+        # Reads rows scanned from DuckDB's query profile (see prepare())
+        self._rows_probe: Optional[RowsScannedProbe] = None
+        # Stop counting a leaf's violations at this many rows (None = exact)
+        self.violation_limit = violation_limit
+        # Row-local leaves run on a sample first and only rerun on the full
+        # table when the sample shows violations (see prepare())
+        self.sample = sample
+        self.sample_table: Optional[str] = None
+        self.sample_rows = 0
+        self.table_rows = 0
+        self._or_child_sampling = False
+        # Row-local leaves count only new or changed partitions (see prepare())
+        self.incremental = incremental
+        # Leaf results reused across runs on unchanged columns (see prepare())
+        self.result_cache = result_cache
+        # Row-local leaves also report violations per value of this column
+        self.group_by = group_by
+        # Parquet file of the rules each row violates, written by finalize()
+        self.violation_matrix = violation_matrix
+        self._row_predicates: Dict[str, str] = {}
+        # Table columns, for the samples of fused --show-violations queries
+        self._table_columns: List[str] = []
+        # Directory that gets one Parquet file of violating rows per failed
+        # rule, at most export_violations_limit rows each (None = all)
+        self.export_violations = export_violations
+        self.export_violations_limit = export_violations_limit
 
         # Build the effective CHECK_GENERATORS mapping for this version
         self.CHECK_GENERATORS = self._build_check_generators_for_version(rules_version)
@@ -2302,6 +2686,7 @@ class FocusToDuckDBSchemaConverter:
         )
 
     # -- lifecycle ------------------------------------------------------------
+    @traced("converter.prepare")
     def prepare(self, *, conn: duckdb.DuckDBPyConnection, plan: ValidationPlan) -> None:
         """Initialize connection, create temp schema/tables/UDFs, register sources."""
         self.conn = conn
@@ -2327,6 +2712,21 @@ class FocusToDuckDBSchemaConverter:
         if self.pragma_threads:
             self.conn.execute(f"PRAGMA threads={int(self.pragma_threads)}")
 
+        if self.sample and self.focus_data is not None:
+            self._create_sample()
+        if self.incremental is not None and self.focus_data is not None:
+            self.incremental.prepare(self.conn, self.table_name)
+        if self.result_cache is not None and self.focus_data is not None:
+            self.result_cache.fingerprint_columns(self.conn, self.table_name)
+        if self.show_violations and self.focus_data is not None:
+            self._table_columns = self._column_names()
+        if self.group_by and self.focus_data is not None:
+            self._check_group_column()
+        if self.export_violations:
+            os.makedirs(self.export_violations, exist_ok=True)
+        if self.metrics is not None and self.focus_data is not None:
+            self._rows_probe = RowsScannedProbe(self.conn)
+
         # Log the validation version for reference
         if self.rules_version:
             best_version = self._find_best_version(self.rules_version)
@@ -2356,11 +2756,43 @@ class FocusToDuckDBSchemaConverter:
         # - create temp schema or set search_path if needed
         # - compile reusable SQL fragments; register any UDFs (from CheckFunctions)
 
+    def _create_sample(self) -> None:
+        conn, sample = self.conn, self.sample
+        if conn is None or sample is None:
+            raise RuntimeError("Converter not prepared for sampling.")
+        sample_table = f"{self.table_name}_sample"
+        self.table_rows = _count(conn, self.table_name)
+        conn.execute(
+            f"CREATE OR REPLACE TEMP TABLE {sample_table} AS "
+            f"SELECT * FROM {self.table_name} {sample_clause(sample)}"
+        )
+        self.sample_rows = _count(conn, sample_table)
+        if 0 < self.sample_rows < self.table_rows:
+            self.sample_table = sample_table
+            self.log.info(
+                "Sampling %d of %d rows (%s)",
+                self.sample_rows,
+                self.table_rows,
+                self.sample,
+            )
+        else:
+            conn.execute(f"DROP TABLE {sample_table}")
+            self.log.info(
+                "Sample of %d rows covers the table (%d rows); validating all rows",
+                self.sample_rows,
+                self.table_rows,
+            )
+
     def finalize(
         self, *, success: bool, results_by_idx: Dict[int, Dict[str, Any]]
     ) -> None:
         """Optional cleanup: drop temps, emit summaries, etc."""
         # e.g., self.conn.execute("DROP VIEW IF EXISTS ...")
+        if success and self.violation_matrix and self.conn is not None:
+            self.write_violation_matrix(self.violation_matrix)
+        if self._rows_probe is not None:
+            self._rows_probe.close()
+            self._rows_probe = None
         # Close DuckDB connection to prevent hanging in CI environments
         if hasattr(self, "conn") and self.conn is not None:
             try:
@@ -2372,6 +2804,13 @@ class FocusToDuckDBSchemaConverter:
                 self.conn = None
 
     # -- check build/execute --------------------------------------------------
+    @traced(
+        "converter.build_check",
+        attributes=lambda self, **kwargs: {
+            "rule_id": kwargs.get("rule_id"),
+            "node_idx": kwargs.get("node_idx"),
+        },
+    )
     def build_check(
         self,
         *,
@@ -2411,6 +2850,11 @@ class FocusToDuckDBSchemaConverter:
         )
         return check_obj
 
+    @traced(
+        "converter.run_check",
+        attributes=_check_span_attributes,
+        result_attributes=_result_span_attributes,
+    )
     def run_check(self, check: Any) -> Tuple[bool, Dict[str, Any]]:  # noqa: C901
         """
         Execute a DuckDBColumnCheck (leaf or composite) or a SkippedCheck.
@@ -2467,6 +2911,8 @@ class FocusToDuckDBSchemaConverter:
             isinstance(check, SkippedCheck)
             or getattr(check, "checkType", "") == "skipped_check"
         ):
+            if self.metrics is not None:
+                self.metrics.set_kind("skipped")
             ok, details = check.run(self.conn)
             details.setdefault("violations", 0)
             details.setdefault(
@@ -2482,6 +2928,8 @@ class FocusToDuckDBSchemaConverter:
         # Check for special executor on composite (e.g., custom OR logic)
         special = getattr(check, "special_executor", None)
         if callable(special):
+            if self.metrics is not None:
+                self.metrics.set_kind("special")
             ok, details = special(self.conn)
             details.setdefault("violations", 0 if ok else 1)
             details.setdefault(
@@ -2496,6 +2944,8 @@ class FocusToDuckDBSchemaConverter:
             return ok, details
 
         if nested and handler:
+            if self.metrics is not None:
+                self.metrics.set_kind("composite")
             # Upstream dependency short-circuit (tag set by composite generator)
             upstream = getattr(check, "force_fail_due_to_upstream", None)
             if upstream:
@@ -2530,7 +2980,8 @@ class FocusToDuckDBSchemaConverter:
             oks: List[bool] = []
             normal_child_details: List[Dict[str, Any]] = []
             for child in nested:
-                ok_i, det_i = self.run_check(child)
+                with self._child_metrics(child):
+                    ok_i, det_i = self.run_check(child)
                 oks.append(ok_i)
                 det_i.setdefault("violations", 0 if ok_i else 1)
                 det_i.setdefault(
@@ -2616,6 +3067,8 @@ class FocusToDuckDBSchemaConverter:
         # Special executor path (e.g., conformance rule reference)
         special = getattr(check, "special_executor", None)
         if callable(special):
+            if self.metrics is not None:
+                self.metrics.set_kind("special")
             ok, details = special(self.conn)
             details.setdefault("violations", 0 if ok else 1)
             details.setdefault(
@@ -2646,15 +3099,111 @@ class FocusToDuckDBSchemaConverter:
             sql_to_execute = sql
 
         sql_final = _sub_table(sql_to_execute)
+        if self.violation_limit is not None:
+            sql_final = limit_violations(sql_final, self.violation_limit)
+
+        check_type = getattr(check, "checkType", None) or getattr(
+            check, "check_type", None
+        )
 
+        cache_key: Optional[str] = None
+        result_cache = self.result_cache
+        if result_cache is not None:
+            cache_key = result_cache.key(
+                sql_final,
+                {
+                    # Messages come from the rule as well as the SQL
+                    "rule_id": getattr(check, "rule_id", None),
+                    "error_message": getattr(check, "errorMessage", None),
+                    "show_violations": self.show_violations,
+                    "sample": self.sample,
+                    "or_child": self._or_child_sampling,
+                    "group_by": self.group_by,
+                },
+            )
+            cached = result_cache.get(cache_key)
+            if cached is not None:
+                return cached
+
+        def _remember(ok: bool, details: Dict[str, Any]) -> Tuple[bool, Dict[str, Any]]:
+            if result_cache is not None and cache_key is not None:
+                result_cache.put(cache_key, ok, details)
+            return ok, details
+
+        sample: Optional[Dict[str, Any]] = None
+        if self.sample_table is not None and is_row_local(check_type, sql_to_execute):
+            try:
+                sample = self._probe_sample(check, sql_to_execute)
+            except (
+                duckdb.CatalogException,
+                duckdb.BinderException,
+                duckdb.ParserException,
+            ):
+                # Let the full-table run below report the missing columns
+                sample = None
+            if sample is not None and not sample["escalated"]:
+                ok = sample["violations"] == 0
+                return _remember(
+                    ok,
+                    {
+                        "violations": sample["violations"],
+                        "rows_checked": sample["rows"],
+                        "message": _msg_for_outcome(
+                            check,
+                            ok,
+                            fallback_fail=f"{getattr(check, 'rule_id', '<rule>')}: check failed",
+                        ),
+                        "timing_ms": sample["timing_ms"],
+                        "check_type": check_type,
+                        "sample": sample,
+                    },
+                )
+        # OR children usually fail on most rows while the OR passes, and
+        # reports only show the rule's own samples
+        collect_samples = self.show_violations and not self._or_child_sampling
+        groups: Optional[Dict[str, int]] = None
+        top_values: Optional[List[Dict[str, Any]]] = None
         t0 = time.perf_counter()
         try:
-            df = self.conn.execute(sql_final).fetchdf()
+            with self._profiled(check):
+                df = None
+                if self.group_by and is_row_local(check_type, sql_to_execute):
+                    grouped = self._grouped_leaf_result(sql_final)
+                    if grouped is not None:
+                        df, groups = grouped
+                distinct_count = (getattr(check, "meta", None) or {}).get(
+                    "distinct_count"
+                )
+                if self.incremental is not None:
+                    if is_row_local(check_type, sql_to_execute):
+                        df = self.incremental.leaf_result(sql_to_execute)
+                    elif distinct_count is not None:
+                        df = self.incremental.distinct_count_result(
+                            sql_to_execute, distinct_count
+                        )
+                if (
+                    df is None
+                    and collect_samples
+                    and is_row_local(check_type, sql_to_execute)
+                ):
+                    fused_sql = fused_top_values_sql(
+                        sql_final,
+                        self._table_columns,
+                        (getattr(check, "meta", None) or {}).get("value_columns") or [],
+                        self.DEFAULT_TOP_VALUES,
+                    )
+                    if fused_sql is not None:
+                        df, top_values = self._fused_leaf_result(fused_sql)
+                if df is None:
+                    df = self.conn.execute(sql_final).fetchdf()
         except (
             duckdb.CatalogException,
             duckdb.BinderException,
             duckdb.ParserException,
         ) as e:
+            if self.metrics is not None:
+                # The query did not run, so it read no rows
+                self.metrics.record_sql((time.perf_counter() - t0) * 1000.0)
             # Convert schema/binder errors into a clean failure
             msg = str(e)
             missing = _extract_missing_columns(msg)
@@ -2674,9 +3223,11 @@ class FocusToDuckDBSchemaConverter:
                 "check_type": getattr(check, "checkType", None)
                 or getattr(check, "check_type", None),
             }
-            return False, details
+            return _remember(False, details)
 
         elapsed_ms = (time.perf_counter() - t0) * 1000.0
+        if self.metrics is not None:
+            self.metrics.record_sql(elapsed_ms, self._last_rows_scanned(profiled=True))
 
         if df.empty:
             raise RuntimeError(
@@ -2751,21 +3302,218 @@ class FocusToDuckDBSchemaConverter:
             "check_type": getattr(check, "checkType", None)
             or getattr(check, "check_type", None),
         }
-
-        # Optional: sample rows if provided by the generator and the check failed
-        # Only execute sample SQL when --show-violations is enabled for performance
-        sample_sql = getattr(check, "sample_sql", None)
-
-        if (not ok) and sample_sql and self.show_violations:
-            try:
-                sql_sample = (
-                    _sub_table(sample_sql) + f" LIMIT {self.DEFAULT_SAMPLE_LIMIT}"
+        if self.violation_limit is not None and violations >= self.violation_limit:
+            # Counting stopped at the limit; there may be more
+            leaf_details["violations_lower_bound"] = True
+        if sample is not None:
+            # Escalated from the sample; the count above is the full table's
+            leaf_details["sample"] = sample
+        if groups is not None:
+            leaf_details["group_by"] = self.group_by
+            leaf_details["violations_by_group"] = groups
+
+        if top_values is not None and not ok:
+            # Already returned by the count query (see fused_top_values_sql)
+            leaf_details["top_violating_values"] = top_values
+
+        # Sample rows of failed checks, only with --show-violations: read
+        # from the check's own query where it has the invalid CTE shape,
+        # otherwise from the generator's sample SQL
+        if (not ok) and collect_samples:
+            row_sample_sql = (
+                violation_sample_sql(
+                    sql_final, self._table_columns, self.DEFAULT_SAMPLE_LIMIT
                 )
-                leaf_details["failure_cases"] = self.conn.execute(sql_sample).fetchdf()
+                if is_row_local(check_type, sql_to_execute)
+                else None
+            )
+            sample_sql = getattr(check, "sample_sql", None)
+            try:
+                t_sample = time.perf_counter()
+                if row_sample_sql is not None:
+                    leaf_details["failure_cases"] = self._violation_sample(
+                        row_sample_sql
+                    )
+                elif sample_sql:
+                    leaf_details["failure_cases"] = self.conn.execute(
+                        _sub_table(sample_sql) + f" LIMIT {self.DEFAULT_SAMPLE_LIMIT}"
+                    ).fetchdf()
+                if self.metrics is not None and (row_sample_sql or sample_sql):
+                    self.metrics.record_sql(
+                        (time.perf_counter() - t_sample) * 1000.0,
+                        self._last_rows_scanned(profiled=False),
+                    )
             except Exception as e:
                 leaf_details["sample_error"] = str(e)
 
-        return ok, leaf_details
+        return _remember(ok, leaf_details)
+
+    @contextmanager
+    def or_child_counts(self) -> Iterator[None]:
+        """
+        Counts for OR children, which pass when some row does not violate:
+        never capped, and a sample only escalates to the full table when
+        every sampled row violates.
+        """
+        limit, self.violation_limit = self.violation_limit, None
+        self._or_child_sampling = True
+        try:
+            yield
+        finally:
+            self.violation_limit = limit
+            self._or_child_sampling = False
+
+    def _column_names(self) -> List[str]:
+        if self.conn is None:
+            raise RuntimeError("Converter not prepared. No DuckDB connection.")
+        return [
+            row[0]
+            for row in self.conn.execute(
+                "SELECT column_name FROM information_schema.columns "
+                "WHERE table_name = ? ORDER BY ordinal_position",
+                [self.table_name],
+            ).fetchall()
+        ]
+
+    def _check_group_column(self) -> None:
+        columns = self._column_names()
+        if self.group_by not in columns:
+            raise ValueError(
+                f"Group-by column '{self.group_by}' is not in the data. "
+                f"Choose one of: {', '.join(columns)}"
+            )
+
+    def _grouped_leaf_result(
+        self, sql: str
+    ) -> Optional[Tuple[pd.DataFrame, Dict[str, int]]]:
+        """
+        Run a leaf query grouped by ``group_by``; returns its one-row
+        ``violations`` / ``error_message`` result, summed over the groups,
+        and the violations of each group with any, or None when the query
+        cannot be grouped.
+        """
+        grouped_sql = grouped_violations_sql(
+            sql, group_label_expr(f'"{self.group_by}"'), GROUP_COLUMN
+        )
+        if grouped_sql is None:
+            return None
+        if self.conn is None:
+            raise RuntimeError("Converter not prepared. No DuckDB connection.")
+        cursor = self.conn.execute(grouped_sql)
+        columns = [d[0] for d in cursor.description]
+        groups: Dict[str, int] = {}
+        message: Optional[str] = None
+        for values in cursor.fetchall():
+            row = dict(zip(columns, values))
+            groups[row[GROUP_COLUMN]] = int(row["violations"])
+            row_message = row.get("error_message")
+            if message is None and row_message is not None:
+                message = str(row_message).strip() or None
+        # Largest groups first, which is what a report reader looks for
+        groups = dict(sorted(groups.items(), key=lambda item: (-item[1], item[0])))
+        violations = sum(groups.values())
+        df = pd.DataFrame(
+            {
+                "violations": [violations],
+                "error_message": [message if violations else None],
+            }
+        )
+        return df, groups
+
+    def _fused_leaf_result(self, sql: str) -> Tuple[pd.DataFrame, List[Dict[str, Any]]]:
+        """
+        Run a fused count-and-top-values leaf query; returns its one-row
+        ``violations`` / ``error_message`` result and the most frequent
+        violating values that came with it.
+        """
+        if self.conn is None:
+            raise RuntimeError("Converter not prepared. No DuckDB connection.")
+        cursor = self.conn.execute(sql)
+        columns = [d[0] for d in cursor.description]
+        # The grand total row of the GROUPING SETS aggregate always exists
+        values = cursor.fetchone()
+        assert values is not None
+        row = dict(zip(columns, values))
+        top_values = [
+            {"value": entry["value"], "count": int(entry["count"])}
+            for entry in row.pop("__focus_top_values") or []
+        ]
+        return pd.DataFrame({key: [value] for key, value in row.items()}), top_values
+
+    def _violation_sample(self, sql: str) -> pd.DataFrame:
+        """Violating rows from a :func:`violation_sample_sql` query."""
+        if self.conn is None:
+            raise RuntimeError("Converter not prepared. No DuckDB connection.")
+        row = self.conn.execute(sql).fetchone()
+        return pd.DataFrame((row[0] if row is not None else None) or [])
+
+    def _probe_sample(self, check: Any, sql: str) -> Dict[str, Any]:
+        """Count a leaf's violations on the sample table, with a rate estimate."""
+        conn, sample_table = self.conn, self.sample_table
+        if conn is None or sample_table is None:
+            raise RuntimeError("Converter not prepared for sampling.")
+        sql_sample = sql.replace("{{table_name}}", sample_table).replace(
+            "{table_name}", sample_table
+        )
+        t0 = time.perf_counter()
+        with self._profiled(check):
+            row = conn.execute(sql_sample).fetchone()
+        violations = int(row[0]) if row is not None else 0
+        if self.metrics is not None:
+            self.metrics.record_sql(
+                (time.perf_counter() - t0) * 1000.0,
+                self._last_rows_scanned(profiled=True),
+            )
+        lower, upper = wilson_interval(violations, self.sample_rows)
+        if self._or_child_sampling:
+            escalated = violations >= self.sample_rows
+        else:
+            escalated = violations > 0
+        return {
+            "rows": self.sample_rows,
+            "violations": violations,
+            "rate": violations / self.sample_rows,
+            "rate_lower": lower,
+            "rate_upper": upper,
+            "confidence": DEFAULT_CONFIDENCE,
+            "max_violations": int(math.ceil(upper * self.table_rows)),
+            "escalated": escalated,
+            "timing_ms": (time.perf_counter() - t0) * 1000.0,
+        }
+
+    @contextmanager
+    def _profiled(self, check: Any) -> Iterator[None]:
+        """Capture a DuckDB query profile for the leaf query, when enabled."""
+        if self.sql_profiler is None:
+            yield
+            return
+        with self.sql_profiler.capture(self.conn, getattr(check, "rule_id", None)):
+            yield
+        if self._rows_probe is not None:
+            # The capture switched profiling to its own file, then off
+            self._rows_probe.enable()
+
+    def _last_rows_scanned(self, profiled: bool) -> int:
+        """Rows read by the query just run; ``profiled`` if inside _profiled()."""
+        if profiled and self.sql_profiler is not None:
+            return self.sql_profiler.last_rows_scanned
+        if self._rows_probe is not None:
+            return self._rows_probe.last_query()
+        return 0
+
+    @contextmanager
+    def _child_metrics(self, child: Any) -> Iterator[None]:
+        """Open a nested metrics node around a composite's child check."""
+        if self.metrics is None:
+            yield
+            return
+        check_type = getattr(child, "checkType", None) or getattr(
+            child, "check_type", None
+        )
+        with self.metrics.node(
+            getattr(child, "rule_id", None), check_type=check_type
+        ) as node, self.metrics.timed(node, "exec_ms"):
+            yield
 
     def __requirement_for_rule__(self, rule: Any) -> dict:
         """
@@ -3463,6 +4211,79 @@ class FocusToDuckDBSchemaConverter:
             elif t == "skipped":
                 print(f"Skipped: {info.get('reason')}")
 
+    def record_row_violations(
+        self, rule_id: str, check: Any, ok: bool, details: Dict[str, Any]
+    ) -> None:
+        """
+        Add an evaluated rule to the violation matrix and, when it failed,
+        export its violating rows, if rows decide it.
+        """
+        if self.violation_matrix is None and self.export_violations is None:
+            return
+        if (
+            details.get("skipped")
+            or details.get("not_evaluated")
+            or _has_error(details)
+        ):
+            return
+        predicate = row_violation_predicate(check)
+        if predicate is None:
+            return
+        if self.violation_matrix is not None:
+            self._row_predicates[rule_id] = predicate
+        if self.export_violations is not None and not ok:
+            details["violations_file"] = self.export_violating_rows(rule_id, predicate)
+
+    def _numbered_rows(self) -> str:
+        return f"SELECT row_number() OVER () - 1 AS row_index, * FROM {self.table_name}"
+
+    def export_violating_rows(self, rule_id: str, predicate: str) -> str:
+        """
+        Copy the rows matching ``predicate``, with their ``row_index``, to
+        ``<export_violations>/<rule_id>.parquet``; returns the file's path.
+        """
+        export_dir = self.export_violations
+        if self.conn is None or export_dir is None:
+            raise RuntimeError("Converter not prepared for exporting violations.")
+        file_name = re.sub(r"[^A-Za-z0-9_.-]", "_", rule_id) + ".parquet"
+        path = os.path.join(export_dir, file_name)
+        select = f"SELECT * FROM ({self._numbered_rows()}) WHERE {predicate}"
+        if self.export_violations_limit is not None:
+            select += f" ORDER BY row_index LIMIT {int(self.export_violations_limit)}"
+        quoted_path = path.replace("'", "''")
+        self.conn.execute(f"COPY ({select}) TO '{quoted_path}' (FORMAT parquet)")
+        return path
+
+    def write_violation_matrix(self, path: str) -> None:
+        """
+        Write, for every row of the table, the ids of the recorded rules it
+        violates and their count, as Parquet keyed by ``row_index`` (0-based
+        input order). All rules are evaluated in one scan.
+        """
+        if self.conn is None:
+            raise RuntimeError("Converter not prepared. No DuckDB connection.")
+        if self._row_predicates:
+            cases = ", ".join(
+                f"CASE WHEN {predicate} THEN '{rule_id}' END"
+                for rule_id, predicate in self._row_predicates.items()
+            )
+            violated = f"list_filter([{cases}], r -> r IS NOT NULL)"
+        else:
+            violated = "[]::VARCHAR[]"
+        select = (
+            f"SELECT row_index, violated_rules, "
+            f"len(violated_rules)::INTEGER AS failure_count FROM ("
+            f"SELECT row_index, {violated} AS violated_rules "
+            f"FROM ({self._numbered_rows()}))"
+        )
+        quoted_path = path.replace("'", "''")
+        self.conn.execute(f"COPY ({select}) TO '{quoted_path}' (FORMAT parquet)")
+        self.log.info(
+            "Wrote violation matrix of %d rules to %s",
+            len(self._row_predicates),
+            path,
+        )
+
     def update_global_results(
         self, node_idx: int, ok: bool, details: Dict[str, Any]
     ) -> None:
@@ -0,0 +1,298 @@
+# incremental.py
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+from typing import Any, Dict, List, Optional, Set
+
+import pandas as pd
+
+from .focus_to_duckdb_converter import group_label_expr, grouped_violations_sql
+
+# Bump when the state layout or the counting SQL changes
+STATE_FORMAT_VERSION = 2
+DEFAULT_PARTITION_BY = "ChargePeriodStart"
+PARTITION_COLUMN = "__focus_partition"
+
+
+def partition_counts_sql(sql: str) -> Optional[str]:
+    """A row-local leaf query's violation count (and message) per partition."""
+    return grouped_violations_sql(sql, PARTITION_COLUMN, PARTITION_COLUMN)
+
+
+def _query_key(sql: str) -> str:
+    return hashlib.blake2b(sql.encode("utf-8"), digest_size=10).hexdigest()
+
+
+def _file_signature(data_filename: Optional[str]) -> Optional[List[Any]]:
+    """Path, size and modification time of a data file; None for stdin."""
+    if not data_filename or data_filename == "-":
+        return None
+    try:
+        stat = os.stat(data_filename)
+    except OSError:
+        return None
+    return [os.path.abspath(data_filename), stat.st_size, stat.st_mtime_ns]
+
+
+class PartitionStateStore:
+    """
+    Per-partition violation counts of row-local leaf queries, and
+    per-partition group states of distinct-count queries, kept in a local
+    JSON file between runs over a growing file.
+
+    Rows are partitioned by ``partition_by`` (by day for date and timestamp
+    columns). Each partition is fingerprinted by its row count and the sum
+    of its row hashes; partitions whose fingerprint changed, and new ones,
+    form a delta table, and only those rows are scanned. A leaf's total is
+    its stored counts for unchanged partitions plus the delta's counts.
+    The fingerprinting scan is skipped when the data file has the same
+    size and modification time as on the last run.
+
+    Counts are stored per query text, so rule or option changes that alter
+    a query start it from scratch; a query with no stored counts runs over
+    all partitions once.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        partition_by: str = DEFAULT_PARTITION_BY,
+        data_filename: Optional[str] = None,
+    ) -> None:
+        self.log = logging.getLogger(f"{__name__}.{self.__class__.__qualname__}")
+        self.path = path
+        self.partition_by = partition_by
+        self.data_filename = data_filename
+        # partition -> {"fingerprint", "rows", "violations": {query key: n},
+        #               "groups": {query key: {group: [distinct values]}}}
+        self.partitions: Dict[str, Dict[str, Any]] = {}
+        # Signature of the data file the fingerprints were computed on
+        self.source: Optional[List[Any]] = None
+        # query key -> error message of the last failing run
+        self.messages: Dict[str, Optional[str]] = {}
+        self.changed: Set[str] = set()
+        self.conn: Any = None
+        self.delta_table: Optional[str] = None
+        self.partitioned_view: Optional[str] = None
+        self.load()
+
+    def load(self) -> None:
+        try:
+            with open(self.path) as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError) as e:
+            self.log.warning(
+                "Ignoring unreadable incremental state %s: %s", self.path, e
+            )
+            return
+        if (
+            data.get("version") != STATE_FORMAT_VERSION
+            or data.get("partition_by") != self.partition_by
+        ):
+            self.log.warning(
+                "Incremental state %s was built for another format or partition column; starting over",
+                self.path,
+            )
+            return
+        self.partitions = data.get("partitions", {})
+        self.messages = data.get("messages", {})
+        self.source = data.get("source")
+
+    def save(self) -> None:
+        directory = os.path.dirname(os.path.abspath(self.path))
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump(
+                    {
+                        "version": STATE_FORMAT_VERSION,
+                        "partition_by": self.partition_by,
+                        "partitions": self.partitions,
+                        "messages": self.messages,
+                        "source": self.source,
+                    },
+                    f,
+                )
+            os.replace(tmp_path, self.path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+    def _partition_expr(self, conn: Any, table_name: str) -> str:
+        types = dict(
+            conn.execute(
+                "SELECT column_name, data_type FROM information_schema.columns "
+                "WHERE table_name = ?",
+                [table_name],
+            ).fetchall()
+        )
+        if self.partition_by not in types:
+            raise ValueError(
+                f"Partition column '{self.partition_by}' is not in the data. "
+                f"Choose one of: {', '.join(types)}"
+            )
+        column = f'"{self.partition_by}"'
+        data_type = types[self.partition_by].upper()
+        if data_type.startswith(("TIMESTAMP", "DATE")):
+            column = f"CAST({column} AS DATE)"
+        return group_label_expr(column)
+
+    def prepare(self, conn: Any, table_name: str) -> None:
+        """Fingerprint the partitions of ``table_name`` and build the delta table."""
+        self.conn = conn
+        expr = self._partition_expr(conn, table_name)
+        self.partitioned_view = f"{table_name}_partitioned"
+        self.delta_table = f"{table_name}_delta"
+        conn.execute(
+            f"CREATE OR REPLACE TEMP VIEW {self.partitioned_view} AS "
+            f"SELECT *, {expr} AS {PARTITION_COLUMN} FROM {table_name}"
+        )
+        self.changed = set()
+        source = _file_signature(self.data_filename)
+        if source is not None and source == self.source:
+            # Same file as last time: every stored partition still holds
+            conn.execute(
+                f"CREATE OR REPLACE TEMP TABLE {self.delta_table} AS "
+                f"SELECT * FROM {self.partitioned_view} LIMIT 0"
+            )
+            self.log.info(
+                "Incremental validation: %s is unchanged, reusing all %d partitions",
+                self.data_filename,
+                len(self.partitions),
+            )
+            return
+
+        rows = conn.execute(
+            f"SELECT {expr} AS p, COUNT(*), CAST(SUM(hash(t)::HUGEINT) AS VARCHAR) "
+            f"FROM {table_name} AS t GROUP BY p"
+        ).fetchall()
+
+        current = {p: (count, f"{count}:{digest}") for p, count, digest in rows}
+        for removed in set(self.partitions) - set(current):
+            del self.partitions[removed]
+        for partition, (count, fingerprint) in current.items():
+            stored = self.partitions.get(partition)
+            if stored is None or stored.get("fingerprint") != fingerprint:
+                self.changed.add(partition)
+                self.partitions[partition] = {
+                    "fingerprint": fingerprint,
+                    "rows": count,
+                    "violations": {},
+                    "groups": {},
+                }
+        self.source = source
+
+        conn.execute(
+            f"CREATE OR REPLACE TEMP TABLE {self.delta_table} AS "
+            f"SELECT * FROM {self.partitioned_view} "
+            f"WHERE {PARTITION_COLUMN} IN (SELECT unnest(?::VARCHAR[]))",
+            [sorted(self.changed)],
+        )
+        delta_rows = sum(current[p][0] for p in self.changed)
+        total_rows = sum(count for count, _ in current.values())
+        self.log.info(
+            "Incremental validation: %d of %d partitions new or changed (%d of %d rows)",
+            len(self.changed),
+            len(current),
+            delta_rows,
+            total_rows,
+        )
+
+    def _missing(self, key: str, kind: str = "violations") -> List[str]:
+        return [p for p, state in self.partitions.items() if key not in state[kind]]
+
+    def _source_for(self, missing: List[str]) -> Optional[str]:
+        # Usually only the changed partitions; a query first seen here
+        # (new rule or option) scans every partition once
+        return (
+            self.delta_table if set(missing) <= self.changed else self.partitioned_view
+        )
+
+    def leaf_result(self, sql: str) -> Optional[pd.DataFrame]:
+        """
+        The one-row ``violations`` / ``error_message`` result of a leaf query
+        from stored counts plus a count over the partitions that need one, or
+        None when the query cannot be counted per partition.
+        """
+        counts_sql = partition_counts_sql(sql)
+        if counts_sql is None:
+            return None
+        key = _query_key(sql)
+        missing = self._missing(key)
+        if missing:
+            source = self._source_for(missing)
+            if source is None:
+                return None
+            counts_sql = counts_sql.replace("{{table_name}}", source).replace(
+                "{table_name}", source
+            )
+            cursor = self.conn.execute(counts_sql)
+            columns = [d[0] for d in cursor.description]
+            found = {}
+            for values in cursor.fetchall():
+                row = dict(zip(columns, values))
+                found[row[PARTITION_COLUMN]] = int(row["violations"])
+                message = row.get("error_message")
+                if message is not None and str(message).strip():
+                    self.messages[key] = str(message)
+            for partition in missing:
+                self.partitions[partition]["violations"][key] = found.get(partition, 0)
+
+        violations = sum(state["violations"][key] for state in self.partitions.values())
+        return pd.DataFrame(
+            {
+                "violations": [violations],
+                "error_message": [self.messages.get(key) if violations else None],
+            }
+        )
+
+    def distinct_count_result(
+        self, sql: str, distinct_count: Dict[str, Any]
+    ) -> Optional[pd.DataFrame]:
+        """
+        The one-row result of a distinct-count query (every value of the
+        ``group`` column has exactly ``expected`` distinct ``values``), merged
+        from per-partition group states. A partition keeps each group's
+        distinct values, at most ``expected + 1`` of them: a group with more
+        violates whatever the other partitions hold, and smaller sets merge
+        exactly by union.
+        """
+        key = _query_key(sql)
+        expected = int(distinct_count["expected"])
+        missing = self._missing(key, "groups")
+        if missing:
+            source = self._source_for(missing)
+            if source is None:
+                return None
+            values = f"CAST({distinct_count['values']} AS VARCHAR)"
+            rows = self.conn.execute(
+                f"SELECT {PARTITION_COLUMN}, "
+                f"{group_label_expr(distinct_count['group'])} AS grp, "
+                f"list_slice(list(DISTINCT {values}) FILTER "
+                f"(WHERE {values} IS NOT NULL), 1, {expected + 1}) "
+                f"FROM {source} GROUP BY ALL"
+            ).fetchall()
+            found: Dict[str, Dict[str, List[str]]] = {}
+            for partition, group, distinct in rows:
+                found.setdefault(partition, {})[group] = sorted(distinct or [])
+            for partition in missing:
+                self.partitions[partition]["groups"][key] = found.get(partition, {})
+
+        merged: Dict[str, Set[str]] = {}
+        for state in self.partitions.values():
+            for group, distinct in state["groups"][key].items():
+                merged.setdefault(group, set()).update(distinct)
+        violations = sum(1 for distinct in merged.values() if len(distinct) != expected)
+        return pd.DataFrame(
+            {
+                "violations": [violations],
+                "error_message": [distinct_count["message"] if violations else None],
+            }
+        )
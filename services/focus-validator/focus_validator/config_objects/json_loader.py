@@ -8,6 +8,8 @@ from focus_validator.config_objects.rule_dependency_resolver import (
     RuleDependencyResolver,
 )
 
+from focus_validator.utils.tracing import traced
+
 from .plan_builder import ValidationPlan
 
 
@@ -124,6 +126,14 @@ class JsonLoader:
         return val_plan
 
     @staticmethod
+    @traced(
+        "json_loader.load_json_rules_with_dependencies_and_types",
+        attributes=lambda json_rule_file, focus_dataset="", **_: {
+            "json_rule_file": json_rule_file,
+            "focus_dataset": focus_dataset,
+        },
+        result_attributes=lambda result: {"plan_nodes": len(result[0].nodes)},
+    )
     def load_json_rules_with_dependencies_and_types(
         json_rule_file: str,
         focus_dataset: Optional[str] = "",
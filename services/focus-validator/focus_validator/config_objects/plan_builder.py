@@ -7,6 +7,8 @@ from collections import defaultdict
 from dataclasses import dataclass, field
 from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
 
+from focus_validator.utils.tracing import traced
+
 from .rule import ModelRule
 
 Predicate = Callable[[dict], bool]
@@ -250,6 +252,13 @@ class ValidationPlan:
     checkfunctions: Dict[str, Any]  # original check functions map
 
 
+@traced(
+    "plan_builder.compile_validation_plan",
+    result_attributes=lambda plan: {
+        "nodes": len(plan.nodes),
+        "layers": len(plan.layers),
+    },
+)
 def compile_validation_plan(
     *,
     plan_graph: PlanGraph,
@@ -0,0 +1,199 @@
+# result_cache.py
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import re
+import tempfile
+import time
+from typing import Any, Dict, Iterator, Optional, Set, Tuple
+
+from focus_validator.utils.result_details import (
+    FRAME_SUFFIX,
+    FRAME_TAG,
+    decode_details,
+    encode_details,
+)
+
+# Bump when result details or the key material change shape
+CACHE_FORMAT_VERSION = 2
+DEFAULT_MAX_ENTRIES = 20000
+CACHE_FILE = "results.json"
+FRAME_DIR = "frames"
+_IDENTIFIER = re.compile(r"[A-Za-z_][A-Za-z0-9_]*")
+
+
+class ResultCache:
+    """
+    On-disk cache of leaf check results across runs on the same data.
+
+    A result is keyed by the hash of the executed SQL plus fingerprints of
+    only the columns that SQL mentions, so re-running with other rule
+    filters or applicability criteria reuses every unchanged rule, and
+    editing one column only invalidates the rules that read it. Column
+    fingerprints are the sum of ``hash(row number, value)`` over the
+    table, computed for all columns in one scan; they change when a
+    column's values, or their row order, change.
+
+    Entries are kept in a JSON file; the DataFrames of violation samples
+    (``--show-violations``) in their details are kept as Arrow IPC files
+    in ``frames/``. Neither can run code when read back. The least recently
+    used entries beyond ``max_entries`` are dropped on save.
+    """
+
+    def __init__(self, cache_dir: str, max_entries: int = DEFAULT_MAX_ENTRIES) -> None:
+        self.log = logging.getLogger(f"{__name__}.{self.__class__.__qualname__}")
+        self.cache_dir = os.path.abspath(os.path.expanduser(cache_dir))
+        self.path = os.path.join(self.cache_dir, CACHE_FILE)
+        self.frame_dir = os.path.join(self.cache_dir, FRAME_DIR)
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        # key -> {"ok", "details" (JSON-safe, see encode_details), "used"}
+        self.entries: Dict[str, Dict[str, Any]] = {}
+        # column name (case-folded) -> fingerprint for the current table
+        self.column_fingerprints: Dict[str, str] = {}
+        os.makedirs(self.cache_dir, exist_ok=True)
+        self.load()
+
+    def load(self) -> None:
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return
+        except Exception as e:
+            self.log.warning("Ignoring unreadable result cache %s: %s", self.path, e)
+            return
+        if isinstance(data, dict) and data.get("version") == CACHE_FORMAT_VERSION:
+            self.entries = {
+                key: entry
+                for key, entry in (data.get("entries") or {}).items()
+                if isinstance(entry, dict)
+                and isinstance(entry.get("details"), dict)
+                and isinstance(entry.get("used"), (int, float))
+            }
+
+    def save(self) -> None:
+        if len(self.entries) > self.max_entries:
+            newest = sorted(
+                self.entries.items(), key=lambda item: item[1]["used"], reverse=True
+            )
+            self.entries = dict(newest[: self.max_entries])
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump({"version": CACHE_FORMAT_VERSION, "entries": self.entries}, f)
+            os.replace(tmp_path, self.path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+        self._remove_unused_frames()
+        self.log.info(
+            "Result cache: %d hits, %d misses, %d entries",
+            self.hits,
+            self.misses,
+            len(self.entries),
+        )
+
+    def fingerprint_columns(self, conn: Any, table_name: str) -> None:
+        """Fingerprint every column of ``table_name`` in a single scan."""
+        columns = [
+            row[0]
+            for row in conn.execute(
+                "SELECT column_name FROM information_schema.columns "
+                "WHERE table_name = ? ORDER BY ordinal_position",
+                [table_name],
+            ).fetchall()
+        ]
+        if not columns:
+            self.column_fingerprints = {}
+            return
+        aggregates = ", ".join(
+            f'CAST(SUM(hash(__row, "{column}")::HUGEINT) AS VARCHAR)'
+            for column in columns
+        )
+        row = conn.execute(
+            f"SELECT COUNT(*), {aggregates} FROM "
+            f"(SELECT *, row_number() OVER () AS __row FROM {table_name})"
+        ).fetchone()
+        self.column_fingerprints = {
+            column.casefold(): f"{row[0]}:{digest}"
+            for column, digest in zip(columns, row[1:])
+        }
+
+    def key(self, sql: str, options: Dict[str, Any]) -> str:
+        """Key for an executed query: its text, the columns it reads and options."""
+        columns = {
+            name
+            for name in (token.casefold() for token in _IDENTIFIER.findall(sql))
+            if name in self.column_fingerprints
+        }
+        key_material = json.dumps(
+            {
+                "sql": sql,
+                "columns": {
+                    name: self.column_fingerprints[name] for name in sorted(columns)
+                },
+                "options": options,
+            },
+            sort_keys=True,
+            default=str,
+        )
+        return hashlib.blake2b(key_material.encode("utf-8"), digest_size=20).hexdigest()
+
+    def get(self, key: str) -> Optional[Tuple[bool, Dict[str, Any]]]:
+        entry = self.entries.get(key)
+        details: Optional[Dict[str, Any]] = None
+        if entry is not None:
+            try:
+                details = decode_details(entry["details"], self.frame_dir)
+            except Exception as e:
+                self.log.warning(
+                    "Ignoring unreadable result cache entry %s: %s", key, e
+                )
+                del self.entries[key]
+        if entry is None or details is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        entry["used"] = time.time()
+        # Decoding builds a fresh copy, which callers may annotate
+        return bool(entry["ok"]), {**details, "cached": True}
+
+    def put(self, key: str, ok: bool, details: Dict[str, Any]) -> None:
+        self.entries[key] = {
+            "ok": ok,
+            "details": encode_details(details, self.frame_dir, key),
+            "used": time.time(),
+        }
+
+    def _remove_unused_frames(self) -> None:
+        """Delete the sample files of evicted or overwritten entries."""
+        try:
+            names = os.listdir(self.frame_dir)
+        except FileNotFoundError:
+            return
+        referenced: Set[str] = set()
+        for entry in self.entries.values():
+            referenced.update(_frame_names(entry["details"]))
+        for name in names:
+            if name.endswith(FRAME_SUFFIX) and name not in referenced:
+                try:
+                    os.unlink(os.path.join(self.frame_dir, name))
+                except OSError:
+                    pass
+
+
+def _frame_names(value: Any) -> Iterator[str]:
+    if isinstance(value, dict):
+        name = value.get(FRAME_TAG)
+        if isinstance(name, str):
+            yield name
+        for child in value.values():
+            yield from _frame_names(child)
+    elif isinstance(value, list):
+        for child in value:
+            yield from _frame_names(child)
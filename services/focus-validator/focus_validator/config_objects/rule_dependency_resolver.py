@@ -8,6 +8,8 @@ from .plan_builder import (
     compile_validation_plan,
     default_key_fn,
 )
+from focus_validator.utils.tracing import traced
+
 from .rule import ModelRule
 
 log = logging.getLogger(__name__)
@@ -255,6 +257,10 @@ class RuleDependencyResolver:
             int
         )  # rule_id -> number of dependencies
 
+    @traced(
+        "rule_dependency_resolver.collectDatasetRules",
+        result_attributes=lambda rules: {"rules": len(rules)},
+    )
     def collectDatasetRules(self, raw_rules_data: Dict[str, Any]) -> Dict[str, Any]:
         """Collect rules relevant to the specified dataset."""
         if not self.dataset_rules:
@@ -0,0 +1,225 @@
+# scheduler.py
+from __future__ import annotations
+
+import json
+import logging
+import os
+import statistics
+import tempfile
+from dataclasses import asdict, dataclass
+from typing import Any, Dict, List, Optional
+
+from .plan_builder import ValidationPlan
+
+SCHEDULES = ("default", "cost")
+
+# Relative per-row cost of each check function, for rules without timing
+# history or an EXPLAIN estimate. Regex formats and grouping checks are the
+# expensive ones; ColumnPresent only reads the schema.
+CHECK_WEIGHTS: Dict[str, float] = {
+    "ColumnPresent": 0.0,
+    "TypeString": 0.5,
+    "TypeDecimal": 0.5,
+    "TypeDateTime": 0.5,
+    "CheckValue": 1.0,
+    "CheckNotValue": 1.0,
+    "CheckGreaterOrEqualThanValue": 1.0,
+    "CheckDecimalValue": 1.0,
+    "ColumnByColumnEqualsColumnValue": 1.5,
+    "CheckSameValue": 2.0,
+    "CheckNationalCurrency": 2.0,
+    "FormatNumeric": 3.0,
+    "FormatDateTime": 3.0,
+    "FormatCurrency": 3.0,
+    "FormatUnit": 3.0,
+    "FormatString": 3.0,
+    "FormatKeyValue": 3.0,
+    "CheckDistinctCount": 4.0,
+}
+DEFAULT_CHECK_WEIGHT = 1.0
+# Fraction of rows assumed to pass a rule's Condition
+CONDITION_SELECTIVITY = 0.5
+# Fixed per-query overhead, in rows, so schema-only checks still rank
+QUERY_OVERHEAD_ROWS = 1000
+# Weight of the latest run in the per-rule moving average
+HISTORY_ALPHA = 0.3
+
+log = logging.getLogger(__name__)
+
+
+@dataclass
+class RuleHistory:
+    runs: int = 0
+    failures: int = 0
+    # Exponential moving average of seconds per input row
+    seconds_per_row: float = 0.0
+
+
+class ScheduleHistory:
+    """
+    Per-rule timings and failure counts kept in a local JSON file between
+    runs. Timings are stored per input row so runs on different dataset
+    sizes stay comparable.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self.rules: Dict[str, RuleHistory] = {}
+        self.load()
+
+    def load(self) -> None:
+        try:
+            with open(self.path) as f:
+                data = json.load(f)
+            self.rules = {
+                rule_id: RuleHistory(**entry)
+                for rule_id, entry in data.get("rules", {}).items()
+            }
+        except FileNotFoundError:
+            self.rules = {}
+        except (OSError, ValueError, TypeError) as e:
+            log.warning("Ignoring unreadable schedule history %s: %s", self.path, e)
+            self.rules = {}
+
+    def save(self) -> None:
+        directory = os.path.dirname(os.path.abspath(self.path))
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump(
+                    {"rules": {k: asdict(v) for k, v in sorted(self.rules.items())}},
+                    f,
+                    indent=1,
+                )
+            os.replace(tmp_path, self.path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+    def record(self, rule_id: str, seconds: float, row_count: int, ok: bool) -> None:
+        entry = self.rules.setdefault(rule_id, RuleHistory())
+        per_row = seconds / max(row_count, 1)
+        if entry.runs:
+            entry.seconds_per_row += HISTORY_ALPHA * (per_row - entry.seconds_per_row)
+        else:
+            entry.seconds_per_row = per_row
+        entry.runs += 1
+        entry.failures += 0 if ok else 1
+
+
+def _requirement_weight(requirement: Dict[str, Any]) -> float:
+    function = requirement.get("CheckFunction")
+    if function in ("AND", "OR"):
+        return sum(_requirement_weight(item) for item in requirement.get("Items") or [])
+    if function == "CheckModelRule" or not function:
+        # Referenced rules run (and are costed) as their own plan nodes
+        return 0.0
+    return CHECK_WEIGHTS.get(function, DEFAULT_CHECK_WEIGHT)
+
+
+def static_cost(rule: Any, row_count: int) -> float:
+    """Estimated rows of work for a rule from its check functions and condition."""
+    criteria = getattr(rule, "validation_criteria", None)
+    if criteria is None:
+        return 0.0
+    weight = _requirement_weight(criteria.requirement or {})
+    if weight == 0.0:
+        return 0.0
+    if criteria.condition:
+        weight *= CONDITION_SELECTIVITY
+    return weight * row_count + QUERY_OVERHEAD_ROWS
+
+
+class CostScheduler:
+    """
+    Orders the rules of each plan layer by estimated cost. Rules within a
+    layer are independent, so any order is valid.
+
+    A rule's cost is its measured time from ``history`` when there is one,
+    otherwise the EXPLAIN estimate from ``cost_estimates``, otherwise a
+    static estimate from its check functions and condition. Static
+    estimates are scaled to seconds by the median ratio of measured time to
+    static estimate over rules that have both.
+
+    By default the longest rules run first, the order that minimises
+    makespan when a layer is spread over workers. With
+    ``stop_on_first_error``, rules run by failure probability per unit of
+    cost, which minimises the expected time to the first failure.
+    """
+
+    def __init__(
+        self,
+        history: Optional[ScheduleHistory] = None,
+        cost_estimates: Optional[Any] = None,
+    ) -> None:
+        self.log = logging.getLogger(f"{__name__}.{self.__class__.__qualname__}")
+        self.history = history
+        self.cost_estimates = cost_estimates
+
+    def _static(self, plan: ValidationPlan, idx: int, row_count: int) -> float:
+        node = plan.nodes[idx]
+        if self.cost_estimates is not None:
+            estimated = self.cost_estimates.estimated_cost(node.rule_id)
+            if estimated is not None:
+                return float(estimated)
+        return static_cost(node.rule, row_count)
+
+    def estimate(self, plan: ValidationPlan, row_count: int) -> Dict[int, float]:
+        """Estimated seconds (or unscaled static units) for every plan node."""
+        static = {
+            idx: self._static(plan, idx, row_count) for idx in range(len(plan.nodes))
+        }
+        measured: Dict[int, float] = {}
+        if self.history is not None:
+            for idx, node in enumerate(plan.nodes):
+                entry = self.history.rules.get(node.rule_id)
+                if entry is not None and entry.runs:
+                    measured[idx] = entry.seconds_per_row * max(row_count, 1)
+
+        ratios = [measured[i] / static[i] for i in measured if static[i] > 0]
+        scale = statistics.median(ratios) if ratios else 1.0
+        return {
+            idx: measured[idx] if idx in measured else static[idx] * scale
+            for idx in static
+        }
+
+    def failure_probability(self, rule_id: str) -> float:
+        """Laplace-smoothed failure rate from history (0.5 when unknown)."""
+        entry = self.history.rules.get(rule_id) if self.history is not None else None
+        if entry is None:
+            return 0.5
+        return (entry.failures + 1) / (entry.runs + 2)
+
+    def order_layers(
+        self,
+        plan: ValidationPlan,
+        row_count: int,
+        stop_on_first_error: bool = False,
+    ) -> List[List[int]]:
+        costs = self.estimate(plan, row_count)
+        if stop_on_first_error:
+            # Smallest positive cost keeps free checks from dividing by zero
+            floor = min((c for c in costs.values() if c > 0), default=1.0)
+
+            def key(idx: int) -> float:
+                probability = self.failure_probability(plan.nodes[idx].rule_id)
+                return -probability / max(costs[idx], floor)
+
+        else:
+
+            def key(idx: int) -> float:
+                return -costs[idx]
+
+        # sorted() is stable, so equal costs keep the plan's default order
+        layers = [sorted(layer, key=key) for layer in plan.layers]
+        self.log.debug(
+            "Scheduled %d layers by cost (stop_on_first_error=%s)",
+            len(layers),
+            stop_on_first_error,
+        )
+        return layers
+
+    def record(self, rule_id: str, seconds: float, row_count: int, ok: bool) -> None:
+        if self.history is not None:
+            self.history.record(rule_id, seconds, row_count, ok)
@@ -0,0 +1,112 @@
+import logging
+
+import polars as pl
+import pyarrow as pa  # type: ignore[import-untyped]
+import pyarrow.feather as feather  # type: ignore[import-untyped]
+
+from focus_validator.data_loaders.input_streams import spooled_stdin
+from focus_validator.data_loaders.parquet_data_loader import ParquetDataLoader
+
+
+# Target type -> test for Arrow types that already satisfy it
+_SATISFIED_BY = {
+    "string": lambda t: (
+        pa.types.is_string(t)
+        or pa.types.is_large_string(t)
+        or pa.types.is_string_view(t)
+    ),
+    "float64": lambda t: t == pa.float64(),
+    "int64": lambda t: t == pa.int64(),
+    "Int64": lambda t: t == pa.int64(),
+}
+
+
+class ArrowIPCDataLoader(ParquetDataLoader):
+    """
+    Load Arrow IPC / Feather data (``.arrow``, ``.feather``, ``.ipc``).
+
+    Files are memory-mapped and returned as a pyarrow Table, which DuckDB
+    scans in place: load time is independent of file size and concurrent
+    validator processes share the same physical pages. A Polars frame would
+    copy every string column. Only the columns whose type differs from the
+    rule-derived target type (and datetimes, which are normalized to UTC)
+    go through ParquetDataLoader's conversions, and replace their mapped
+    originals.
+    """
+
+    def __init__(self, data_filename, column_types=None):
+        super().__init__(data_filename, column_types=column_types)
+        self.log = logging.getLogger(f"{__name__}.{self.__class__.__qualname__}")
+
+    def _read_table(self) -> pa.Table:
+        if self.data_filename == "-":
+            # A pipe cannot be mapped: spool the IPC stream to disk in bounded
+            # chunks and map the spool file. The mapping outlives the unlink,
+            # so the table stays page-cache backed like a file-based run.
+            with spooled_stdin(suffix=".arrow") as spool_path:
+                return self._read_mapped(spool_path)
+        return self._read_mapped(self.data_filename)
+
+    def _read_mapped(self, path: str) -> pa.Table:
+        try:
+            # Handles both the IPC file format (Feather V2) and Feather V1
+            table = feather.read_table(path, memory_map=True)
+        except pa.ArrowInvalid:
+            # Stdin and some producers carry the IPC stream format instead
+            self.log.debug("%s is not an IPC file, reading it as an IPC stream", path)
+            source = pa.memory_map(path, "r")
+            with pa.ipc.open_stream(source) as reader:
+                table = reader.read_all()
+
+        self.log.debug(
+            "Memory-mapped %s: %d rows, %d columns (%d bytes allocated)",
+            path,
+            table.num_rows,
+            table.num_columns,
+            pa.total_allocated_bytes(),
+        )
+        return table
+
+    def _apply_arrow_column_types(self, table: pa.Table) -> pa.Table:
+        convert = [
+            name
+            for name, target_type in self.column_types.items()
+            if name in table.column_names
+            and not _SATISFIED_BY.get(str(target_type), lambda t: False)(
+                table.schema.field(name).type
+            )
+        ]
+        if not convert:
+            return table
+
+        converted = pl.from_arrow(table.select(convert), rechunk=False)
+        if not isinstance(converted, pl.DataFrame):
+            converted = converted.to_frame()
+        converted = self._apply_column_types(converted)
+        for name in convert:
+            index = table.column_names.index(name)
+            if name in converted.columns:
+                table = table.set_column(index, name, converted[name].to_arrow())
+            else:
+                # Dropped by a failed datetime conversion
+                table = table.remove_column(index)
+        return table
+
+    def load(self) -> pa.Table:
+        try:
+            table = self._read_table()
+
+            # Apply column type conversions if specified
+            table = self._apply_arrow_column_types(table)
+
+            if self.failed_columns:
+                self.log.warning(
+                    f"Failed to apply specified types to {len(self.failed_columns)} Arrow columns "
+                    f"(using original types): {sorted(self.failed_columns)}"
+                )
+
+            return table
+
+        except Exception as e:
+            self.log.error(f"Failed to load Arrow IPC data: {e}")
+            raise
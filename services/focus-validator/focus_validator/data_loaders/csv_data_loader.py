@@ -1,15 +1,34 @@
-import io
 import logging
-import sys
 from typing import Any, Dict, Optional
 
 import polars as pl
 
+from focus_validator.data_loaders.csv_engines import (
+    CSVEngine,
+    CSVSource,
+    select_csv_engine,
+)
+from focus_validator.data_loaders.input_streams import (
+    POLARS_NATIVE_COMPRESSION,
+    detect_compression,
+    open_decompressed,
+    spooled_stdin,
+)
+
 
 class CSVDataLoader:
-    def __init__(self, data_filename, column_types=None):
+    def __init__(
+        self, data_filename, column_types=None, compression=None, engine="polars"
+    ):
         self.data_filename = data_filename
         self.column_types = column_types or {}
+        # Compression codec of the input ("gzip", "zstd", "bz2") or None.
+        # For stdin the codec is sniffed from the spooled payload's magic bytes.
+        self.compression = compression
+        # Loader engine name ("auto", "polars", "duckdb", "pyarrow"); resolved
+        # once the input size is known (after spooling for stdin)
+        self.engine_name = engine
+        self.engine: Optional[CSVEngine] = None
         self.log = logging.getLogger(f"{__name__}.{self.__class__.__qualname__}")
 
         # Track failed columns for reporting
@@ -95,6 +114,30 @@ class CSVDataLoader:
 
         return polars_dtypes
 
+    def _read_csv(self, source: CSVSource, **kwargs: Any) -> pl.DataFrame:
+        """
+        Read a CSV source with the selected loader engine. Callable sources
+        are opened fresh for every read and closed afterwards, which lets the
+        coercion fallbacks re-read decompressed or streamed input.
+        """
+        if self.engine is None:
+            self.engine = select_csv_engine(self.engine_name, self.data_filename)
+        return self.engine.read_csv(source, compression=self.compression, **kwargs)
+
+    def _open_source(self, filename: str) -> CSVSource:
+        """
+        Resolve a file on disk into a CSV source, wiring in streaming
+        decompression when the input is compressed. Compressed data is never
+        written back to disk in plain form.
+        """
+        if self.compression is None or self.compression in POLARS_NATIVE_COMPRESSION:
+            # Every engine reads gzip/zstd paths itself
+            return filename
+
+        codec = self.compression
+        self.log.info("Streaming %s-compressed CSV: %s", codec, filename)
+        return lambda: open_decompressed(filename, codec)
+
     def _try_load_with_types(self, filename_or_buffer, dtype_dict, parse_dates_list):
         """
         Attempt to load CSV with specified types using Polars, with retry logic for problematic columns.
@@ -109,7 +152,7 @@ class CSVDataLoader:
             self.log.debug(f"Attempting to load with Polars dtypes: {polars_dtypes}")
 
             # Use schema_overrides instead of deprecated dtypes parameter
-            df = pl.read_csv(
+            df = self._read_csv(
                 filename_or_buffer,
                 schema_overrides=polars_dtypes,
                 try_parse_dates=bool(parse_dates_list),
@@ -144,7 +187,7 @@ class CSVDataLoader:
 
         except Exception as e:
             self.log.warning(
-                "Initial Polars load with all column types failed: %s", str(e)
+                "Initial typed load with all column types failed: %s", str(e)
             )
             # Reset failed columns since we're trying a different approach
             self.failed_columns = set()
@@ -171,7 +214,7 @@ class CSVDataLoader:
             self.log.debug("Starting load with coercion for failed columns...")
 
             # Load CSV without any type specifications - let Polars infer
-            df = pl.read_csv(
+            df = self._read_csv(
                 filename_or_buffer,
                 infer_schema_length=10000,
                 null_values=[
@@ -279,7 +322,7 @@ class CSVDataLoader:
                 str(e),
             )
             # Last resort: basic CSV loading with resilience options
-            return pl.read_csv(
+            return self._read_csv(
                 filename_or_buffer,
                 null_values=[
                     "INVALID",
@@ -515,60 +558,49 @@ class CSVDataLoader:
 
         try:
             if self.data_filename == "-":
-                # Handle stdin
-                csv_content = sys.stdin.read()
-                filename_or_buffer = io.StringIO(csv_content)
-
-                if self.column_types or parse_dates_list:
-                    # For stdin, apply column types and parse_dates with retry logic
-                    return self._try_load_with_types(
-                        filename_or_buffer, self.column_types, parse_dates_list
-                    )
-                else:
-                    # Basic loading for stdin without column types
-                    return pl.read_csv(
-                        filename_or_buffer,
-                        truncate_ragged_lines=True,
-                        ignore_errors=True,
-                        null_values=[
-                            "",
-                            "INVALID",
-                            "INVALID_COST",
-                            "BAD_DATE",
-                            "INVALID_DECIMAL",
-                            "INVALID_INT",
-                            "NULL",
-                            "null",
-                        ],
-                    )
-            else:
-                # Handle file
-                if self.column_types or parse_dates_list:
-                    return self._try_load_with_types(
-                        self.data_filename, self.column_types, parse_dates_list
-                    )
-                else:
-                    # Basic file loading without column types
-                    return pl.read_csv(
-                        self.data_filename,
-                        truncate_ragged_lines=True,  # Handle inconsistent column counts
-                        ignore_errors=True,  # Skip problematic rows
-                        null_values=[
-                            "",
-                            "INVALID",
-                            "INVALID_COST",
-                            "BAD_DATE",
-                            "INVALID_DECIMAL",
-                            "INVALID_INT",
-                            "NULL",
-                            "null",
-                        ],
+                # Spool stdin to disk in bounded chunks, then parse it as a file
+                with spooled_stdin() as spool_path:
+                    self.engine = select_csv_engine(self.engine_name, spool_path)
+                    self.compression = detect_compression(spool_path)
+                    if self.compression:
+                        self.log.info(
+                            "Detected %s-compressed CSV on stdin", self.compression
+                        )
+                    return self._load_source(
+                        self._open_source(spool_path), parse_dates_list
                     )
 
+            return self._load_source(
+                self._open_source(self.data_filename), parse_dates_list
+            )
+
         except Exception as e:
             self.log.error(f"Failed to load CSV data: {e}")
             raise Exception(f"Failed to load CSV data: {e}") from e
 
+    def _load_source(self, source: CSVSource, parse_dates_list) -> pl.DataFrame:
+        if self.column_types or parse_dates_list:
+            return self._try_load_with_types(
+                source, self.column_types, parse_dates_list
+            )
+
+        # Basic loading without column types
+        return self._read_csv(
+            source,
+            truncate_ragged_lines=True,  # Handle inconsistent column counts
+            ignore_errors=True,  # Skip problematic rows
+            null_values=[
+                "",
+                "INVALID",
+                "INVALID_COST",
+                "BAD_DATE",
+                "INVALID_DECIMAL",
+                "INVALID_INT",
+                "NULL",
+                "null",
+            ],
+        )
+
     def get_failed_columns(self):
         """
         Get set of column names that failed type conversion.
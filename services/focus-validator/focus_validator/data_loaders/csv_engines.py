@@ -0,0 +1,338 @@
+import functools
+import logging
+import os
+from abc import ABC, abstractmethod
+from typing import Any, Callable, ClassVar, Dict, List, Optional, Sequence, Type, Union
+
+import duckdb  # type: ignore[import-untyped]
+import polars as pl
+import pyarrow as pa  # type: ignore[import-untyped]
+import pyarrow.csv as pa_csv  # type: ignore[import-untyped]
+
+from focus_validator.data_loaders.input_streams import open_decompressed
+
+log = logging.getLogger(__name__)
+
+# A CSV source is a path, an open buffer, or a zero-argument callable that
+# opens a fresh stream (so retries can re-read streamed/decompressed input).
+CSVSource = Union[str, Any, Callable[[], Any]]
+
+# ``auto`` uses pyarrow, which won every input size in
+# ``python -m focus_validator.benchmarks.csv_engines`` (Polars pays for date
+# inference on untyped columns), and switches to DuckDB's parallel reader for
+# files at least this large when enough cores are available to parallelize.
+AUTO_DUCKDB_MIN_BYTES = 256 * 1024 * 1024
+AUTO_DUCKDB_MIN_CORES = 4
+
+# Column type candidates used when dates must stay strings (try_parse_dates=False)
+_NON_TEMPORAL_CANDIDATES = ["BOOLEAN", "BIGINT", "DOUBLE", "VARCHAR"]
+
+# Never matches, which disables pyarrow's ISO-8601 timestamp inference
+_NO_TIMESTAMP_PARSERS = ["%Y-%m-%d#never"]
+
+
+class CSVEngine(ABC):
+    """
+    Raw CSV read step used by CSVDataLoader.
+
+    Engines accept the Polars ``read_csv`` options the loader uses and must
+    honour them with the same semantics: ``schema_overrides`` are strict (an
+    unparseable value raises, so the loader falls back to coercion), columns
+    named in ``schema_overrides`` that are absent from the file are ignored,
+    and ``null_values`` apply to every column. Type normalization and
+    ``failed_columns`` tracking stay in the loader, so they are shared by
+    every engine.
+    """
+
+    name: ClassVar[str]
+
+    def __init__(self) -> None:
+        self.log = logging.getLogger(f"{__name__}.{self.__class__.__qualname__}")
+
+    @abstractmethod
+    def read_csv(
+        self,
+        source: CSVSource,
+        *,
+        compression: Optional[str] = None,
+        schema_overrides: Optional[Dict[str, pl.DataType]] = None,
+        try_parse_dates: bool = False,
+        infer_schema_length: Optional[int] = 100,
+        null_values: Optional[List[str]] = None,
+        truncate_ragged_lines: bool = False,
+        ignore_errors: bool = False,
+    ) -> pl.DataFrame:
+        """Read ``source`` into a Polars DataFrame."""
+
+
+def _call_with_stream(source: Callable[[], Any], reader: Callable[[Any], Any]):
+    stream = source()
+    try:
+        return reader(stream)
+    finally:
+        try:
+            stream.close()
+        except Exception:
+            pass
+
+
+def _polars_read_csv(source: CSVSource, **kwargs: Any) -> pl.DataFrame:
+    # Polars decompresses gzip/zstd paths itself; other codecs arrive as
+    # callables opening a decompression stream, which Polars reads whole
+    if callable(source):
+        return _call_with_stream(source, lambda s: pl.read_csv(s, **kwargs))
+    return pl.read_csv(source, **kwargs)
+
+
+class PolarsCSVEngine(CSVEngine):
+    """
+    Polars' multithreaded reader. Polars would read a stream source (bz2
+    input) to the end into one buffer before parsing, so streams go to
+    pyarrow, which decompresses them block by block.
+    """
+
+    name = "polars"
+
+    def read_csv(self, source: CSVSource, *, compression=None, **kwargs: Any):
+        if callable(source):
+            self.log.debug("Reading the decompression stream with pyarrow")
+            return PyArrowCSVEngine().read_csv(source, **kwargs)
+        return _polars_read_csv(source, **kwargs)
+
+
+def _duckdb_type(dtype: pl.DataType) -> str:
+    if dtype == pl.Float64:
+        return "DOUBLE"
+    if dtype == pl.Int64:
+        return "BIGINT"
+    if isinstance(dtype, pl.Datetime):
+        return "TIMESTAMPTZ" if dtype.time_zone else "TIMESTAMP"
+    return "VARCHAR"
+
+
+def _sql_literal(value: Any) -> str:
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, int):
+        return str(value)
+    if isinstance(value, dict):
+        items = ", ".join(
+            f"{_sql_literal(k)}: {_sql_literal(v)}" for k, v in value.items()
+        )
+        return "{" + items + "}"
+    if isinstance(value, (list, tuple)):
+        return "[" + ", ".join(_sql_literal(v) for v in value) + "]"
+    return "'" + str(value).replace("'", "''") + "'"
+
+
+class DuckDBCSVEngine(CSVEngine):
+    """
+    DuckDB's parallel ``read_csv``. Reads paths (plain, gzip or zstd) on
+    all cores with a bounded memory footprint; stream sources fall back to
+    pyarrow, which decompresses them block by block.
+    """
+
+    name = "duckdb"
+
+    def read_csv(
+        self,
+        source: CSVSource,
+        *,
+        compression: Optional[str] = None,
+        schema_overrides: Optional[Dict[str, pl.DataType]] = None,
+        try_parse_dates: bool = False,
+        infer_schema_length: Optional[int] = 100,
+        null_values: Optional[List[str]] = None,
+        truncate_ragged_lines: bool = False,
+        ignore_errors: bool = False,
+    ) -> pl.DataFrame:
+        if not isinstance(source, str):
+            self.log.debug("DuckDB cannot read stream sources, using pyarrow")
+            return PyArrowCSVEngine().read_csv(
+                source,
+                schema_overrides=schema_overrides,
+                try_parse_dates=try_parse_dates,
+                infer_schema_length=infer_schema_length,
+                null_values=null_values,
+                truncate_ragged_lines=truncate_ragged_lines,
+                ignore_errors=ignore_errors,
+            )
+
+        # Polars pads short rows with nulls even without truncate_ragged_lines
+        options: Dict[str, Any] = {"header": True, "null_padding": True}
+        if compression:
+            options["compression"] = compression
+        if null_values:
+            options["nullstr"] = list(null_values)
+        if infer_schema_length:
+            options["sample_size"] = int(infer_schema_length)
+        if not try_parse_dates:
+            options["auto_type_candidates"] = _NON_TEMPORAL_CANDIDATES
+        if ignore_errors:
+            options["ignore_errors"] = True
+
+        conn = duckdb.connect()
+        try:
+            # Keep TIMESTAMPTZ results in UTC regardless of the host zone
+            conn.execute("SET TimeZone='UTC'")
+            if schema_overrides:
+                header = self._header(conn, source, compression)
+                types = {
+                    col: _duckdb_type(dtype)
+                    for col, dtype in schema_overrides.items()
+                    if col in header
+                }
+                if types:
+                    options["types"] = types
+
+            rendered = ", ".join(f"{k}={_sql_literal(v)}" for k, v in options.items())
+            sql = f"SELECT * FROM read_csv({_sql_literal(source)}, {rendered})"
+            self.log.debug("DuckDB CSV read: %s", sql)
+            return conn.sql(sql).pl()
+        finally:
+            conn.close()
+
+    def _header(self, conn, path: str, compression: Optional[str]) -> List[str]:
+        # Without padding, a short first row makes the sniffer give up on
+        # the delimiter and return the whole header line as one column
+        options = "header=true, all_varchar=true, sample_size=1, null_padding=true"
+        if compression:
+            options += f", compression={_sql_literal(compression)}"
+        rel = conn.sql(
+            f"SELECT * FROM read_csv({_sql_literal(path)}, {options}) LIMIT 0"
+        )
+        return list(rel.columns)
+
+
+def _arrow_type(dtype: pl.DataType) -> pa.DataType:
+    if dtype == pl.Float64:
+        return pa.float64()
+    if dtype == pl.Int64:
+        return pa.int64()
+    if isinstance(dtype, pl.Datetime):
+        return pa.timestamp(dtype.time_unit or "us", tz=dtype.time_zone)
+    return pa.string()
+
+
+class PyArrowCSVEngine(CSVEngine):
+    """
+    pyarrow's multithreaded block reader. Reads paths and streams.
+
+    pyarrow can only skip or reject rows with the wrong number of fields, so
+    input with ragged rows is re-read with Polars, which pads short rows with
+    nulls like DuckDB.
+    """
+
+    name = "pyarrow"
+
+    def read_csv(
+        self,
+        source: CSVSource,
+        *,
+        compression: Optional[str] = None,
+        schema_overrides: Optional[Dict[str, pl.DataType]] = None,
+        try_parse_dates: bool = False,
+        infer_schema_length: Optional[int] = 100,
+        null_values: Optional[List[str]] = None,
+        truncate_ragged_lines: bool = False,
+        ignore_errors: bool = False,
+    ) -> pl.DataFrame:
+        convert_kwargs: Dict[str, Any] = {
+            "column_types": {
+                col: _arrow_type(dtype)
+                for col, dtype in (schema_overrides or {}).items()
+            },
+            "strings_can_be_null": True,
+            "quoted_strings_can_be_null": True,
+        }
+        if null_values is not None:
+            convert_kwargs["null_values"] = list(null_values)
+        if not try_parse_dates:
+            convert_kwargs["timestamp_parsers"] = _NO_TIMESTAMP_PARSERS
+        ragged: List[Any] = []
+
+        def invalid_row(row) -> str:
+            ragged.append(row)
+            return "error"
+
+        parse_options = pa_csv.ParseOptions(invalid_row_handler=invalid_row)
+
+        def read(stream) -> pa.Table:
+            return pa_csv.read_csv(
+                stream,
+                parse_options=parse_options,
+                convert_options=pa_csv.ConvertOptions(**convert_kwargs),
+            )
+
+        if isinstance(source, str) and compression:
+            # Spooled stdin has no suffix to infer the codec from
+            source = functools.partial(open_decompressed, source, compression)
+        try:
+            if callable(source):
+                table = _call_with_stream(source, read)
+            else:
+                table = read(source)
+        except pa.ArrowInvalid:
+            if not ragged or not (callable(source) or isinstance(source, str)):
+                raise
+            self.log.debug(
+                "Ragged row at line %s, re-reading with Polars",
+                ragged[0].number,
+            )
+            return _polars_read_csv(
+                source,
+                schema_overrides=schema_overrides,
+                try_parse_dates=try_parse_dates,
+                infer_schema_length=infer_schema_length,
+                null_values=null_values,
+                truncate_ragged_lines=truncate_ragged_lines,
+                ignore_errors=ignore_errors,
+            )
+        df = pl.from_arrow(table)
+        if not isinstance(df, pl.DataFrame):
+            df = df.to_frame()
+        return df
+
+
+CSV_ENGINES: Dict[str, Type[CSVEngine]] = {
+    engine.name: engine
+    for engine in (PolarsCSVEngine, DuckDBCSVEngine, PyArrowCSVEngine)
+}
+LOADER_ENGINE_CHOICES: Sequence[str] = ("auto", *CSV_ENGINES)
+
+
+def select_csv_engine(
+    engine: str, data_filename: Optional[str] = None, cores: Optional[int] = None
+) -> CSVEngine:
+    """
+    Resolve an engine name (``auto``, ``polars``, ``duckdb``, ``pyarrow``).
+
+    ``auto`` uses DuckDB for large files on machines with enough cores and
+    pyarrow otherwise.
+    """
+    if engine != "auto":
+        if engine not in CSV_ENGINES:
+            raise ValueError(
+                f"Unknown loader engine '{engine}'. "
+                f"Choose one of: {', '.join(LOADER_ENGINE_CHOICES)}"
+            )
+        return CSV_ENGINES[engine]()
+
+    cores = cores or os.cpu_count() or 1
+    size = (
+        os.path.getsize(data_filename)
+        if data_filename and os.path.isfile(data_filename)
+        else 0
+    )
+    chosen = (
+        "duckdb"
+        if size >= AUTO_DUCKDB_MIN_BYTES and cores >= AUTO_DUCKDB_MIN_CORES
+        else "pyarrow"
+    )
+    log.info(
+        "Loader engine auto-selected: %s (%.1f MB, %d cores)",
+        chosen,
+        size / 1024 / 1024,
+        cores,
+    )
+    return CSV_ENGINES[chosen]()
@@ -1,14 +1,33 @@
 import logging
 import os
-from typing import Optional, Type, Union
+from typing import List, Optional, Type, Union
 
 import polars as pl
+import pyarrow as pa  # type: ignore[import-untyped]
 
+from focus_validator.data_loaders.arrow_ipc_data_loader import ArrowIPCDataLoader
 from focus_validator.data_loaders.csv_data_loader import CSVDataLoader
+from focus_validator.data_loaders.input_streams import (
+    detect_compression,
+    split_compression_suffix,
+)
+from focus_validator.data_loaders.load_cache import LoadCache
 from focus_validator.data_loaders.parquet_data_loader import ParquetDataLoader
 from focus_validator.exceptions import FocusNotImplementedError
 from focus_validator.utils.performance_logging import logPerformance
 
+ARROW_IPC_EXTENSIONS = (".arrow", ".feather", ".ipc")
+
+# What the loaders return: Arrow IPC input stays a memory-mapped pyarrow Table
+LoadedData = Union[pl.DataFrame, pa.Table]
+
+
+def column_names(data: LoadedData) -> List[str]:
+    """Column names of loaded data (a pyarrow Table's ``columns`` are arrays)."""
+    if isinstance(data, pa.Table):
+        return list(data.column_names)
+    return list(data.columns)
+
 
 class DataLoader:
     def __init__(
@@ -16,11 +35,17 @@ class DataLoader:
         data_filename: Optional[str],
         data_format: Optional[str] = None,
         column_types: Optional[dict] = None,
+        load_cache: Optional[LoadCache] = None,
+        loader_engine: str = "polars",
     ) -> None:
         self.log = logging.getLogger(f"{__name__}.{self.__class__.__qualname__}")
         self.data_filename = data_filename
         self.data_format = data_format
         self.column_types = column_types or {}
+        self.compression: Optional[str] = None
+        self.load_cache = load_cache
+        self.loader_engine = loader_engine
+        self.cache_hit = False
 
         if data_filename == "-":
             format_info = f" (format: {data_format})" if data_format else ""
@@ -37,11 +62,15 @@ class DataLoader:
                 )
 
         self.data_loader_class = self.find_data_loader()
-        self.data_loader = self.data_loader_class(
-            self.data_filename, column_types=self.column_types
-        )
+        loader_kwargs: dict = {"column_types": self.column_types}
+        if self.data_loader_class is CSVDataLoader:
+            loader_kwargs["compression"] = self.compression
+            loader_kwargs["engine"] = self.loader_engine
+        self.data_loader = self.data_loader_class(self.data_filename, **loader_kwargs)
 
-    def find_data_loader(self) -> Type[Union[CSVDataLoader, ParquetDataLoader]]:
+    def find_data_loader(
+        self,
+    ) -> Type[Union[CSVDataLoader, ParquetDataLoader, ArrowIPCDataLoader]]:
         self.log.debug("Determining data loader for file: %s", self.data_filename)
 
         if self.data_filename is None:
@@ -53,38 +82,85 @@ class DataLoader:
             if self.data_format == "parquet":
                 self.log.debug("Using Parquet data loader for stdin")
                 return ParquetDataLoader
-            else:  # Default to CSV for stdin
+            elif self.data_format == "arrow":
+                self.log.debug("Using Arrow IPC data loader for stdin")
+                return ArrowIPCDataLoader
+            else:  # Default to CSV for stdin (compression is sniffed on read)
                 self.log.debug("Using CSV data loader for stdin")
                 return CSVDataLoader
-        elif self.data_filename.endswith(".csv"):
-            self.log.debug("Using CSV data loader")
+
+        # Strip .gz/.zst/.bz2 so "export.csv.gz" is dispatched as CSV
+        base_filename, _ = split_compression_suffix(self.data_filename)
+        if base_filename.endswith(".csv"):
+            self.compression = (
+                detect_compression(self.data_filename)
+                if os.path.exists(self.data_filename)
+                else split_compression_suffix(self.data_filename)[1]
+            )
+            if self.compression:
+                self.log.debug(
+                    "Using CSV data loader with %s decompression", self.compression
+                )
+            else:
+                self.log.debug("Using CSV data loader")
             return CSVDataLoader
+        elif base_filename != self.data_filename:
+            self.log.error(
+                "Compressed input is only supported for CSV: %s", self.data_filename
+            )
+            raise FocusNotImplementedError(
+                "Compressed input is only supported for CSV files."
+            )
         elif self.data_filename.endswith(".parquet"):
             self.log.debug("Using Parquet data loader")
             return ParquetDataLoader
+        elif self.data_filename.lower().endswith(ARROW_IPC_EXTENSIONS):
+            self.log.debug("Using Arrow IPC data loader")
+            return ArrowIPCDataLoader
         else:
             self.log.error("Unsupported file type: %s", self.data_filename)
             raise FocusNotImplementedError("File type not implemented yet.")
 
+    def _is_cacheable(self) -> bool:
+        # Only CSV pays for parsing and coercion; stdin has no stable identity
+        return (
+            self.load_cache is not None
+            and self.data_loader_class is CSVDataLoader
+            and self.data_filename != "-"
+        )
+
+    def _load_via_cache(self) -> Optional[pl.DataFrame]:
+        load_cache, data_filename = self.load_cache, self.data_filename
+        assert load_cache is not None and data_filename is not None
+        cache_key = load_cache.key_for(data_filename, self.column_types)
+        cached = load_cache.get(cache_key)
+        if cached is not None:
+            self.cache_hit = True
+            return cached
+
+        result = self.data_loader.load()
+        if result is not None:
+            load_cache.put(cache_key, result)
+        return result
+
     @logPerformance("data_loader.load", includeArgs=True)
-    def load(self) -> Optional[pl.DataFrame]:
+    def load(self) -> Optional[LoadedData]:
         self.log.info("Loading data from file...")
-        result = self.data_loader.load()
+        if self._is_cacheable():
+            result = self._load_via_cache()
+        else:
+            result = self.data_loader.load()
 
         if result is not None:
             try:
                 row_count = len(result)
-                col_count = (
-                    len(result.columns) if hasattr(result, "columns") else "unknown"
-                )
+                columns = column_names(result)
                 self.log.info(
                     "Data loaded successfully: %d rows, %s columns",
                     row_count,
-                    col_count,
+                    len(columns),
                 )
-
-                if hasattr(result, "columns"):
-                    self.log.debug("Columns: %s", list(result.columns))
+                self.log.debug("Columns: %s", columns)
 
             except Exception as e:
                 self.log.warning("Could not determine data dimensions: %s", e)
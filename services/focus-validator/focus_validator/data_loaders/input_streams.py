@@ -0,0 +1,141 @@
+import io
+import logging
+import os
+import sys
+import tempfile
+from contextlib import contextmanager
+from typing import BinaryIO, Iterator, Optional, Tuple, Union
+
+import pyarrow as pa  # type: ignore[import-untyped]
+
+log = logging.getLogger(__name__)
+
+# Filename suffix -> codec name understood by pyarrow / Polars
+COMPRESSION_SUFFIXES = {
+    ".gz": "gzip",
+    ".gzip": "gzip",
+    ".zst": "zstd",
+    ".zstd": "zstd",
+    ".bz2": "bz2",
+}
+
+# Leading magic bytes -> codec name, used when the suffix does not tell us
+MAGIC_BYTES = (
+    (b"\x1f\x8b", "gzip"),
+    (b"\x28\xb5\x2f\xfd", "zstd"),
+    (b"BZh", "bz2"),
+)
+MAGIC_PEEK_SIZE = 4
+
+# Codecs that Polars and DuckDB decompress themselves when given a path.
+# Anything else is decompressed on the fly through a pyarrow input stream.
+POLARS_NATIVE_COMPRESSION = {"gzip", "zstd"}
+
+# Chunk size used when spooling stdin to disk; bounds peak Python memory
+SPOOL_CHUNK_SIZE = 4 * 1024 * 1024
+
+
+def split_compression_suffix(filename: str) -> Tuple[str, Optional[str]]:
+    """
+    Split a trailing compression suffix from a filename.
+
+    Returns:
+        (filename_without_suffix, codec) — codec is None if there is no suffix
+    """
+    base, ext = os.path.splitext(filename)
+    codec = COMPRESSION_SUFFIXES.get(ext.lower())
+    if codec is None:
+        return filename, None
+    return base, codec
+
+
+def sniff_compression(header: bytes) -> Optional[str]:
+    """Return the codec whose magic bytes start ``header``, or None."""
+    for magic, codec in MAGIC_BYTES:
+        if header.startswith(magic):
+            return codec
+    return None
+
+
+def detect_compression(filename: str) -> Optional[str]:
+    """
+    Detect the compression codec of a file, by suffix first and then by
+    magic bytes (so a gzip payload saved as ``.csv`` is still handled).
+    """
+    _, codec = split_compression_suffix(filename)
+    if codec is not None:
+        return codec
+    try:
+        with open(filename, "rb") as f:
+            return sniff_compression(f.read(MAGIC_PEEK_SIZE))
+    except OSError:
+        return None
+
+
+def open_decompressed(
+    source: Union[str, bytes, BinaryIO], compression: str
+) -> pa.NativeFile:
+    """
+    Open a streaming decompressor over a path, an in-memory payload or a
+    binary file object. The plain data is never written anywhere. pyarrow's
+    CSV reader consumes the stream block by block; Polars reads all of it
+    into memory first.
+    """
+    if isinstance(source, str):
+        raw = pa.OSFile(source, "rb")
+    elif isinstance(source, (bytes, bytearray, memoryview)):
+        raw = pa.BufferReader(source)
+    elif isinstance(source, io.BytesIO):
+        raw = pa.BufferReader(source.getbuffer())
+    else:
+        raw = pa.PythonFile(source, mode="r")
+    log.debug("Opening %s decompression stream", compression)
+    return pa.CompressedInputStream(raw, compression)
+
+
+def copy_stream(source, target: BinaryIO, chunk_size: int = SPOOL_CHUNK_SIZE) -> int:
+    """
+    Copy ``source`` into the binary ``target`` in chunks of at most
+    ``chunk_size``. Text sources are encoded as UTF-8. A short read from a
+    buffered stream means end of input, so the loop stops on it instead of
+    waiting for an extra empty read.
+
+    Returns:
+        Number of bytes written
+    """
+    written = 0
+    while True:
+        chunk = source.read(chunk_size)
+        if not chunk:
+            break
+        data = chunk.encode("utf-8") if isinstance(chunk, str) else chunk
+        target.write(data)
+        written += len(data)
+        if len(chunk) < chunk_size:
+            break
+    return written
+
+
+@contextmanager
+def spooled_stdin(suffix: str = "") -> Iterator[str]:
+    """
+    Spool stdin to a temporary file and yield its path.
+
+    The payload is copied in bounded chunks and never held in Python memory
+    as a whole, so loaders can read it like any other file (memory-mapped,
+    by row group, or through a streaming decompressor). Compressed input is
+    spooled as-is. The file is created under ``tempfile.gettempdir()``
+    (honours ``TMPDIR``) and removed when the context exits.
+    """
+    source = getattr(sys.stdin, "buffer", None) or sys.stdin
+    fd, path = tempfile.mkstemp(prefix="focus-stdin-", suffix=suffix)
+    try:
+        with os.fdopen(fd, "wb") as spool:
+            written = copy_stream(source, spool, SPOOL_CHUNK_SIZE)
+        log.debug("Spooled %d bytes from stdin to %s", written, path)
+        yield path
+    finally:
+        try:
+            os.remove(path)
+        except OSError as e:
+            log.debug("Could not remove stdin spool file %s: %s", path, e)
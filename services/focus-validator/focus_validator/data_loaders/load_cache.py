@@ -0,0 +1,180 @@
+import hashlib
+import json
+import logging
+import os
+import tempfile
+from typing import List, Optional, Tuple
+
+import polars as pl
+import pyarrow.feather as feather  # type: ignore[import-untyped]
+
+# Bump when the loader's normalization changes so stale entries are ignored
+CACHE_FORMAT_VERSION = 1
+CACHE_FORMATS = {"parquet": ".parquet", "arrow": ".arrow"}
+DEFAULT_MAX_SIZE_MB = 2048
+HASH_CHUNK_SIZE = 1024 * 1024
+
+
+def content_hash(path: str) -> str:
+    """blake2b digest of a file's bytes, read in chunks."""
+    hasher = hashlib.blake2b(digest_size=20)
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b""):
+            hasher.update(chunk)
+    return hasher.hexdigest()
+
+
+class LoadCache:
+    """
+    On-disk cache of typed, normalized DataFrames produced by the CSV loader.
+
+    Entries are keyed by the source file's size, mtime and content hash plus
+    the requested column types, so a cache hit is always equivalent to a
+    fresh parse. A hit replaces CSV parsing and datetime coercion with a
+    single columnar read (Parquet, or memory-mapped Arrow IPC). The cache
+    directory is bounded by ``max_size_mb``; least recently used entries are
+    evicted first.
+    """
+
+    def __init__(
+        self,
+        cache_dir: str,
+        max_size_mb: Optional[float] = DEFAULT_MAX_SIZE_MB,
+        cache_format: str = "parquet",
+    ) -> None:
+        self.log = logging.getLogger(f"{__name__}.{self.__class__.__qualname__}")
+        if cache_format not in CACHE_FORMATS:
+            raise ValueError(
+                f"Unsupported cache format '{cache_format}'. "
+                f"Choose one of: {', '.join(CACHE_FORMATS)}"
+            )
+        self.cache_dir = os.path.abspath(os.path.expanduser(cache_dir))
+        self.max_size_bytes = (
+            int(max_size_mb * 1024 * 1024) if max_size_mb is not None else None
+        )
+        self.cache_format = cache_format
+        self.hits = 0
+        self.misses = 0
+        os.makedirs(self.cache_dir, exist_ok=True)
+
+    def key_for(self, data_filename: str, column_types: Optional[dict]) -> str:
+        """Build the cache key for a source file and its requested column types."""
+        stat = os.stat(data_filename)
+        key_material = json.dumps(
+            {
+                "version": CACHE_FORMAT_VERSION,
+                "size": stat.st_size,
+                "mtime_ns": stat.st_mtime_ns,
+                "content": content_hash(data_filename),
+                "column_types": sorted((column_types or {}).items()),
+            },
+            sort_keys=True,
+        )
+        return hashlib.blake2b(key_material.encode("utf-8"), digest_size=20).hexdigest()
+
+    def _entry_path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, key + CACHE_FORMATS[self.cache_format])
+
+    def get(self, key: str) -> Optional[pl.DataFrame]:
+        """Return the cached frame for ``key``, or None on a miss."""
+        path = self._entry_path(key)
+        if not os.path.exists(path):
+            self.misses += 1
+            self.log.debug("Load cache miss: %s", key)
+            return None
+
+        try:
+            if self.cache_format == "arrow":
+                table = feather.read_table(path, memory_map=True)
+                loaded = pl.from_arrow(table, rechunk=False)
+                df = loaded if isinstance(loaded, pl.DataFrame) else loaded.to_frame()
+            else:
+                df = pl.read_parquet(path)
+        except Exception as e:
+            # A truncated or corrupt entry is treated as a miss and dropped
+            self.log.warning("Discarding unreadable cache entry %s: %s", path, e)
+            self._remove(path)
+            self.misses += 1
+            return None
+
+        # Touch the entry so eviction sees it as recently used
+        os.utime(path, None)
+        self.hits += 1
+        self.log.info("Load cache hit: %s (%d rows)", path, len(df))
+        return df
+
+    def put(self, key: str, df: pl.DataFrame) -> Optional[str]:
+        """Store ``df`` under ``key``. Failures are logged and never raised."""
+        path = self._entry_path(key)
+        fd, tmp_path = tempfile.mkstemp(
+            dir=self.cache_dir, prefix=".tmp-", suffix=CACHE_FORMATS[self.cache_format]
+        )
+        os.close(fd)
+        try:
+            if self.cache_format == "arrow":
+                df.write_ipc(tmp_path, compression="uncompressed")
+            else:
+                df.write_parquet(tmp_path)
+            # Atomic publish so concurrent runs never read a partial entry
+            os.replace(tmp_path, path)
+        except Exception as e:
+            self.log.warning("Failed to write load cache entry %s: %s", path, e)
+            self._remove(tmp_path)
+            return None
+
+        self.log.info(
+            "Stored load cache entry %s (%.2f MB)",
+            path,
+            os.path.getsize(path) / 1024 / 1024,
+        )
+        self.evict(keep=path)
+        return path
+
+    def _entries(self) -> List[Tuple[float, int, str]]:
+        entries = []
+        suffixes = tuple(CACHE_FORMATS.values())
+        for name in os.listdir(self.cache_dir):
+            if name.startswith(".tmp-") or not name.endswith(suffixes):
+                continue
+            path = os.path.join(self.cache_dir, name)
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        return entries
+
+    def evict(self, keep: Optional[str] = None) -> List[str]:
+        """
+        Remove least recently used entries until the cache fits in
+        ``max_size_mb``. The entry at ``keep`` is never evicted.
+        """
+        if self.max_size_bytes is None:
+            return []
+
+        entries = sorted(self._entries())
+        total = sum(size for _, size, _ in entries)
+        evicted = []
+        for _, size, path in entries:
+            if total <= self.max_size_bytes:
+                break
+            if path == keep:
+                continue
+            if self._remove(path):
+                total -= size
+                evicted.append(path)
+
+        if evicted:
+            self.log.info(
+                "Evicted %d load cache entries (%.2f MB now in use)",
+                len(evicted),
+                total / 1024 / 1024,
+            )
+        return evicted
+
+    def _remove(self, path: str) -> bool:
+        try:
+            os.remove(path)
+            return True
+        except OSError:
+            return False
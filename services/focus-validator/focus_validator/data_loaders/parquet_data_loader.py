@@ -1,10 +1,10 @@
-import io
 import logging
-import sys
 from typing import Any, Optional
 
 import polars as pl
 
+from focus_validator.data_loaders.input_streams import spooled_stdin
+
 
 class ParquetDataLoader:
     def __init__(self, data_filename, column_types=None):
@@ -260,12 +260,10 @@ class ParquetDataLoader:
         try:
             # Load Parquet data using Polars
             if self.data_filename == "-":
-                # Handle stdin input for Parquet files
-                # Read binary data from stdin into BytesIO buffer
-                # This allows Polars to properly parse the Parquet format
-                binary_data = sys.stdin.buffer.read()
-                buffer = io.BytesIO(binary_data)
-                df = pl.read_parquet(buffer)
+                # Parquet needs random access to its footer, so stdin is spooled
+                # to disk in bounded chunks and read by row group like a file
+                with spooled_stdin(suffix=".parquet") as spool_path:
+                    df = pl.read_parquet(spool_path)
             else:
                 df = pl.read_parquet(self.data_filename)
 
@@ -8,11 +8,22 @@ import os
 import subprocess
 import sys
 import time
+from contextlib import nullcontext
 from importlib import resources as ir
 from typing import Any, Dict
 
 import yaml
 
+from focus_validator.config_objects.focus_to_duckdb_converter import parse_count_mode
+from focus_validator.config_objects.incremental import DEFAULT_PARTITION_BY
+from focus_validator.data_loaders.csv_engines import LOADER_ENGINE_CHOICES
+from focus_validator.data_loaders.load_cache import DEFAULT_MAX_SIZE_MB
+from focus_validator.utils.cpu_profiler import (
+    PROFILERS,
+    CPUProfiler,
+    default_output_path,
+)
+from focus_validator.utils.sampling import sample_clause
 from focus_validator.validator import DEFAULT_VERSION_SETS_PATH, Validator
 
 from .outputter.outputter_validation_graph import build_validation_graph
@@ -101,14 +112,14 @@ def main() -> None:
     parser = argparse.ArgumentParser(description="FOCUS specification validator.")
     parser.add_argument(
         "--data-file",
-        help="Path to the data file (CSV/Parquet) or '-' for stdin (default: stdin)",
+        help="Path to the data file (CSV/Parquet/Arrow IPC, CSV may be .gz/.zst/.bz2 compressed) or '-' for stdin (default: stdin)",
         default="-",
         required=False,
     )
     parser.add_argument(
         "--data-format",
-        help="Data format when using stdin (default: csv)",
-        choices=["csv", "parquet"],
+        help="Data format when using stdin (default: csv). 'arrow' expects an Arrow IPC stream",
+        choices=["csv", "parquet", "arrow"],
         default="csv",
         required=False,
     )
@@ -233,12 +244,187 @@ def main() -> None:
         ],
         help="In explain mode, transpile SQL queries to the specified target dialect. Only works with --explain-mode.",
     )
+    parser.add_argument(
+        "--explain-cost",
+        action="store_true",
+        default=False,
+        help="In explain mode, run DuckDB EXPLAIN on every rule query and report estimated rows and operators per rule and layer, sized from --data-file without loading it",
+    )
+    parser.add_argument(
+        "--explain-rows",
+        type=int,
+        default=None,
+        metavar="N",
+        help="Row count to estimate costs for instead of reading it from --data-file; implies --explain-cost",
+    )
+    parser.add_argument(
+        "--count-mode",
+        default="exact",
+        metavar="{exact,exists,capped:N}",
+        help="How far to count each rule's violations: 'exact' (default), 'exists' (stop at the first violating row) or 'capped:N' (stop at N); early stops are reported as lower bounds",
+    )
+    parser.add_argument(
+        "--sample",
+        default=None,
+        metavar="SIZE",
+        help="Check row-level rules on a random sample first (a row count such as 100000, or a percentage such as 5%%); rules whose sample shows violations are rechecked on all rows, and passing rules report the violation rate bound at 95%% confidence",
+    )
+    parser.add_argument(
+        "--deadline",
+        type=float,
+        default=None,
+        metavar="SECONDS",
+        help="Time budget for the whole run; when it runs out the running query is cancelled and the remaining rules are reported as not evaluated",
+    )
+    parser.add_argument(
+        "--rule-timeout",
+        type=float,
+        default=None,
+        metavar="SECONDS",
+        help="Cancel any single rule that runs longer than this and report it, and the rules depending on it, as not evaluated",
+    )
+    parser.add_argument(
+        "--checkpoint",
+        default=None,
+        metavar="FILE",
+        help="Save the results of finished rules to FILE as the run goes, so an interrupted run can continue with --resume; removed when the run completes",
+    )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Continue from the --checkpoint file when it matches the data file, rules and options",
+    )
+    parser.add_argument(
+        "--incremental-state",
+        default=None,
+        metavar="FILE",
+        help="Keep per-partition violation counts in FILE so the next run over a grown or partly changed file only scans new or changed partitions",
+    )
+    parser.add_argument(
+        "--partition-by",
+        default=DEFAULT_PARTITION_BY,
+        metavar="COLUMN",
+        help=f"Column that partitions the data for --incremental-state; date and timestamp columns are partitioned by day (default: {DEFAULT_PARTITION_BY})",
+    )
+    parser.add_argument(
+        "--result-cache-dir",
+        default=None,
+        metavar="DIR",
+        help="Reuse rule results from earlier runs whose SQL and referenced columns are unchanged, e.g. when re-running with other --filter-rules or --applicability-criteria",
+    )
+    parser.add_argument(
+        "--group-by",
+        default=None,
+        metavar="COLUMN",
+        help="Also count each rule's violations per value of COLUMN (e.g. SubAccountId), in the same scan; shown in the report and in each result's details",
+    )
+    parser.add_argument(
+        "--violation-matrix",
+        default=None,
+        metavar="FILE",
+        help="Write a Parquet file with, for every row, the ids of the row-level rules it violates and their count, keyed by row_index",
+    )
+    parser.add_argument(
+        "--export-violations",
+        default=None,
+        metavar="DIR",
+        help="Write the violating rows of every failed row-level rule, with their row_index, to DIR/<rule_id>.parquet",
+    )
+    parser.add_argument(
+        "--export-violations-limit",
+        type=int,
+        default=None,
+        metavar="N",
+        help="Export at most N violating rows per rule (default: all)",
+    )
+    parser.add_argument(
+        "--schedule",
+        choices=["default", "cost"],
+        default="default",
+        help="Order of rules within each dependency layer: 'default' (rule id) or 'cost' (estimated cost, from timing history, EXPLAIN and check types)",
+    )
+    parser.add_argument(
+        "--schedule-history",
+        default=None,
+        metavar="FILE",
+        help="JSON file of per-rule timings and failures read and updated by --schedule cost",
+    )
+    parser.add_argument(
+        "--stop-on-first-error",
+        action="store_true",
+        default=False,
+        help="Stop at the first failing rule; with --schedule cost, likely failures run first",
+    )
     parser.add_argument(
         "--show-violations",
         action="store_true",
         default=False,
         help="Include up to 2 sample lines of violations in the console output",
     )
+    parser.add_argument(
+        "--metrics",
+        action="store_true",
+        default=False,
+        help="Collect per-rule build/SQL/Python time, rows scanned and peak memory, and print the 20 slowest rules",
+    )
+    parser.add_argument(
+        "--metrics-output",
+        default=None,
+        help="Write per-rule metrics to this file (CSV if it ends in .csv, JSON otherwise); implies --metrics",
+    )
+    parser.add_argument(
+        "--profile-sql",
+        default=None,
+        metavar="DIR",
+        help="Capture DuckDB's JSON query profile for every leaf rule query into a new bundle under DIR, with a summary of the most expensive operators (combine with --filter-rules to focus on specific rules)",
+    )
+    parser.add_argument(
+        "--trace-output",
+        default=None,
+        metavar="FILE",
+        help="Record spans for loading, planning, every rule build/run and output, and write them as a Chrome trace JSON file (open in chrome://tracing or Perfetto)",
+    )
+    parser.add_argument(
+        "--profile",
+        default=None,
+        choices=PROFILERS,
+        help="Profile CPU time of the validation (or explain) run with cProfile or a low-overhead stack sampler, write the profile and print the top functions by cumulative time",
+    )
+    parser.add_argument(
+        "--profile-output",
+        default=None,
+        metavar="FILE",
+        help="Where --profile writes its profile: pstats for cprofile, collapsed stacks for sampling (default: focus-validator-<mode>-<timestamp>.prof/.folded)",
+    )
+    parser.add_argument(
+        "--performance-report",
+        default=None,
+        metavar="FILE",
+        help="Write wall time, CPU time and peak RSS / Python / DuckDB memory of each validation phase to this JSON file",
+    )
+    parser.add_argument(
+        "--loader-engine",
+        default="polars",
+        choices=LOADER_ENGINE_CHOICES,
+        help="CSV parsing engine. 'auto' picks DuckDB for large files on multi-core machines and pyarrow otherwise (default: polars)",
+    )
+    parser.add_argument(
+        "--load-cache-dir",
+        default=None,
+        help="Cache the typed, normalized CSV data in this directory so repeated runs on an unchanged file skip CSV parsing",
+    )
+    parser.add_argument(
+        "--load-cache-max-size-mb",
+        type=float,
+        default=DEFAULT_MAX_SIZE_MB,
+        help=f"Maximum size of the load cache; least recently used entries are evicted (default: {DEFAULT_MAX_SIZE_MB})",
+    )
+    parser.add_argument(
+        "--load-cache-format",
+        default="parquet",
+        choices=["parquet", "arrow"],
+        help="On-disk format of load cache entries; 'arrow' is larger but memory-mapped on load (default: parquet)",
+    )
 
     args = parser.parse_args()
 
@@ -253,6 +439,9 @@ def main() -> None:
     log.info("  Transitional rules: %s", args.transitional)
     log.info("  Visualization: %s", args.visualize)
     log.info("  Explain mode: %s", args.explain_mode)
+    log.info("  Loader engine: %s", args.loader_engine)
+    if args.load_cache_dir:
+        log.info("  Load cache: %s", args.load_cache_dir)
     if args.filter_rules:
         log.info("  Filter rules: %s", args.filter_rules)
     if args.column_namespace:
@@ -275,6 +464,58 @@ def main() -> None:
         parser.error("--transpile requires --explain-mode")
         sys.exit(1)
 
+    try:
+        parse_count_mode(args.count_mode)
+    except ValueError as e:
+        parser.error(str(e))
+
+    if args.sample is not None:
+        try:
+            sample_clause(args.sample)
+        except ValueError as e:
+            parser.error(str(e))
+
+    for option, value in (
+        ("--deadline", args.deadline),
+        ("--rule-timeout", args.rule_timeout),
+    ):
+        if value is not None and value <= 0:
+            parser.error(f"{option} must be positive")
+
+    if args.resume and not args.checkpoint:
+        parser.error("--resume requires --checkpoint")
+    if args.checkpoint and args.data_file == "-":
+        parser.error("--checkpoint requires a data file; stdin cannot be resumed")
+
+    if args.incremental_state and (
+        args.sample is not None or args.count_mode != "exact"
+    ):
+        parser.error(
+            "--incremental-state cannot be combined with --sample or --count-mode"
+        )
+    if args.group_by and (
+        args.sample is not None or args.count_mode != "exact" or args.incremental_state
+    ):
+        parser.error(
+            "--group-by cannot be combined with --sample, --count-mode or --incremental-state"
+        )
+
+    if args.export_violations_limit is not None:
+        if not args.export_violations:
+            parser.error("--export-violations-limit requires --export-violations")
+        if args.export_violations_limit <= 0:
+            parser.error("--export-violations-limit must be positive")
+
+    if args.schedule_history and args.schedule != "cost":
+        parser.error("--schedule-history requires --schedule cost")
+
+    if (args.explain_cost or args.explain_rows is not None) and not args.explain_mode:
+        parser.error("--explain-cost and --explain-rows require --explain-mode")
+    if args.explain_rows is not None and args.explain_rows < 0:
+        parser.error("--explain-rows must be zero or more")
+    if args.explain_cost and args.explain_rows is None and args.data_file == "-":
+        parser.error("--explain-cost needs --data-file or --explain-rows")
+
     if args.output_type != "console" and args.output_destination is None:
         log.error("Output destination required for output type: %s", args.output_type)
         parser.error("--output-destination required {}".format(args.output_type))
@@ -297,8 +538,44 @@ def main() -> None:
         applicability_criteria=args.applicability_criteria,
         explain_mode=args.explain_mode,
         transpile_dialect=args.transpile,
+        explain_cost=args.explain_cost,
+        explain_rows=args.explain_rows,
+        schedule=args.schedule,
+        schedule_history=args.schedule_history,
+        stop_on_first_error=args.stop_on_first_error,
+        count_mode=args.count_mode,
+        sample=args.sample,
+        deadline_seconds=args.deadline,
+        rule_timeout_seconds=args.rule_timeout,
+        checkpoint_path=args.checkpoint,
+        resume=args.resume,
+        incremental_state=args.incremental_state,
+        partition_by=args.partition_by,
+        result_cache_dir=args.result_cache_dir,
+        group_by=args.group_by,
+        violation_matrix=args.violation_matrix,
+        export_violations=args.export_violations,
+        export_violations_limit=args.export_violations_limit,
         show_violations=args.show_violations,
+        load_cache_dir=args.load_cache_dir,
+        load_cache_max_size_mb=args.load_cache_max_size_mb,
+        load_cache_format=args.load_cache_format,
+        loader_engine=args.loader_engine,
+        collect_metrics=args.metrics,
+        metrics_output=args.metrics_output,
+        profile_sql_dir=args.profile_sql,
+        trace_output=args.trace_output,
+        performance_output=args.performance_report,
+    )
+    cpu_profiler = (
+        CPUProfiler(
+            args.profile, args.profile_output or default_output_path(args.profile)
+        )
+        if args.profile
+        else None
     )
+    profiled = cpu_profiler.profile if cpu_profiler else nullcontext
+
     if args.supported_versions:
         log.info("Retrieving supported versions...")
         local, remote = validator.get_supported_versions()
@@ -332,12 +609,15 @@ def main() -> None:
         log.info("Running in explain mode - generating SQL explanations...")
         startTime = time.time()
         try:
-            explain_results = validator.explain()
+            with profiled():
+                explain_results = validator.explain()
             duration = time.time() - startTime
             log.info("SQL explanation generation completed in %.3f seconds", duration)
 
             # Output the results
             validator.print_sql_explanations(explain_results, verbose=False)
+            if validator.cost_report is not None:
+                print(validator.cost_report.format_table())
 
         except Exception as e:
             duration = time.time() - startTime
@@ -347,7 +627,8 @@ def main() -> None:
         log.info("Starting validation process...")
         startTime = time.time()
         try:
-            results = validator.validate()
+            with profiled():
+                results = validator.validate()
             duration = time.time() - startTime
             log.info("Validation completed in %.3f seconds", duration)
 
@@ -386,6 +667,10 @@ def main() -> None:
                 log.error("Failed to generate visualization: %s", str(e))
                 print(f"Failed to generate visualization: {e}")
 
+    if cpu_profiler is not None and (cpu_profiler.stats or cpu_profiler.samples):
+        print(cpu_profiler.format_top())
+        print(f"Profile written to {cpu_profiler.output_path}")
+
     log.info("=== FOCUS Validator Finished ===")
 
 
@@ -5,6 +5,7 @@ from focus_validator.outputter.outputter_console import ConsoleOutputter
 from focus_validator.outputter.outputter_unittest import UnittestOutputter
 from focus_validator.outputter.outputter_web import WebOutputter
 from focus_validator.rules.spec_rules import ValidationResults
+from focus_validator.utils.tracing import traced
 
 
 class Outputter:
@@ -27,5 +28,12 @@ class Outputter:
         else:
             raise FocusNotImplementedError("Output type not supported")
 
+    @traced(
+        "outputter.write",
+        attributes=lambda self, result_set: {
+            "outputter": self.outputter.__class__.__name__,
+            "results": len(result_set.by_idx),
+        },
+    )
     def write(self, result_set: ValidationResults):
         self.outputter.write(result_set)
@@ -7,6 +7,8 @@ from typing import Any, Dict
 STATUS_PASS = "PASS"
 STATUS_FAIL = "FAIL"
 STATUS_SKIP = "SKIPPED"
+SLOWEST_RULES_LIMIT = 20
+GROUPS_SHOWN = 5
 
 
 def _get_safe_icons():
@@ -30,6 +32,14 @@ def _status_from_result(entry: Dict[str, Any]) -> str:
     return STATUS_PASS if entry.get("ok") else STATUS_FAIL
 
 
+def _violations_text(details: Dict[str, Any]) -> str:
+    """Violation count, shown as a lower bound when counting stopped early."""
+    violations = details.get("violations", "?")
+    if details.get("violations_lower_bound"):
+        return f">={violations}"
+    return f"={violations}"
+
+
 def _line_for_rule(rule_id: str, entry: Dict[str, Any]) -> str:
     status = _status_from_result(entry)
     details = entry.get("details") or {}
@@ -37,7 +47,7 @@ def _line_for_rule(rule_id: str, entry: Dict[str, Any]) -> str:
 
     # add useful extras if present
     if "violations" in details:
-        extra.append(f"violations={details['violations']}")
+        extra.append(f"violations{_violations_text(details)}")
     if details.get("reason"):
         extra.append(f"reason={details['reason']}")
     if details.get("message"):
@@ -95,6 +105,16 @@ class ConsoleOutputter:
             f"Total: {passed + failed + skipped} | "
             f"Pass: {passed} | Fail: {failed} | Skipped: {skipped}"
         )
+        if getattr(results, "partial", False) is True:
+            not_evaluated = sum(
+                1
+                for entry in results.by_rule_id.values()
+                if (entry.get("details") or {}).get("not_evaluated")
+            )
+            print(
+                f"Partial results: {not_evaluated} rules not evaluated "
+                "(deadline or rule timeout reached)"
+            )
         for line in lines:
             print(line)
 
@@ -106,14 +126,25 @@ class ConsoleOutputter:
                     continue
                 d = entry.get("details") or {}
                 msg = d.get("message") or d.get("reason") or f"{rule_id} failed"
-                vio = d.get("violations", "?")
 
                 # Access MustSatisfy from the rule object
                 rule = results.rules.get(rule_id)
                 must_satisfy = rule.validation_criteria.must_satisfy if rule else "N/A"
 
-                print(f"- {rule_id}: violations={vio}; {msg}")
+                print(f"- {rule_id}: violations{_violations_text(d)}; {msg}")
                 print(f"  MustSatisfy: {must_satisfy}")
+                groups = d.get("violations_by_group")
+                if groups:
+                    # Largest groups first; --group-by reports them all
+                    top = ", ".join(
+                        f"{group}={count}"
+                        for group, count in list(groups.items())[:GROUPS_SHOWN]
+                    )
+                    more = len(groups) - GROUPS_SHOWN
+                    suffix = f", ... {more} more" if more > 0 else ""
+                    print(f"  By {d.get('group_by')}: {top}{suffix}")
+                if d.get("violations_file"):
+                    print(f"  Violating rows: {d['violations_file']}")
 
                 # Show sample violation data if --show-violations is enabled and data exists
                 if self.show_violations and "failure_cases" in d:
@@ -130,3 +161,30 @@ class ConsoleOutputter:
                             print(f"    {', '.join(violation_values)}")
                 elif self.show_violations and "sample_error" in d:
                     print(f"  Sample violation error: {d['sample_error']}")
+                if self.show_violations and d.get("top_violating_values"):
+                    frequent = ", ".join(
+                        f"{entry['value']!r} x{entry['count']}"
+                        for entry in d["top_violating_values"]
+                    )
+                    print(f"  Most frequent: {frequent}")
+
+        metrics = getattr(results, "metrics", None)
+        if metrics is not None and metrics.nodes:
+            self._print_slowest_rules(metrics)
+
+    def _print_slowest_rules(self, metrics) -> None:
+        slowest = metrics.slowest(SLOWEST_RULES_LIMIT)
+        print(f"\n--- Top {len(slowest)} Slowest Rules ---")
+        header = (
+            f"{'Rule':<40} {'Total ms':>9} {'Build':>8} {'SQL':>8} "
+            f"{'Python':>8} {'Children':>9} {'Rows scanned':>13} {'Peak RSS +MB':>13}"
+        )
+        print(header)
+        print("-" * len(header))
+        for node in slowest:
+            print(
+                f"{(node.rule_id or '?')[:40]:<40} {node.total_ms:>9.1f} "
+                f"{node.build_ms:>8.1f} {node.sql_ms:>8.1f} {node.python_ms:>8.1f} "
+                f"{node.children_ms:>9.1f} {node.rows_scanned:>13,} "
+                f"{node.peak_rss_delta_bytes / 1024 / 1024:>13.1f}"
+            )
@@ -322,7 +322,10 @@ def build_validation_graph(
         msg = d.get("message") or d.get("reason") or ""
         if msg and len(msg) > 120:
             msg = msg[:117] + "…"
-        label = f"{rid}\n{status}" + (f"\nviolations={v}" if v is not None else "")
+        bound = ">=" if d.get("violations_lower_bound") else "="
+        label = f"{rid}\n{status}" + (
+            f"\nviolations{bound}{v}" if v is not None else ""
+        )
 
         name = rid if use_rule_ids else str(idx)
         g.node(name=name, label=label, shape=shape, fillcolor=color, tooltip=msg)
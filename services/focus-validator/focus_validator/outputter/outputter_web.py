@@ -547,6 +547,9 @@ class WebOutputter:
             "entityType": self._get_rule_entity_type(rule_obj),
             "ruleType": self._get_rule_type(rule_obj),
             "status": status,
+            # Per-group violation counts from --group-by, largest first
+            "groupBy": details.get("group_by"),
+            "violationsByGroup": details.get("violations_by_group") or {},
         }
 
     def _get_rule_entity(self, rule_obj) -> str:
@@ -602,8 +605,9 @@ class WebOutputter:
     def _generate_html(self, web_results: Dict[str, Any]) -> str:
         """Generate complete HTML page with embedded JavaScript data"""
 
-        # Convert results to JSON for embedding in JavaScript
-        results_json = json.dumps(web_results, indent=2)
+        # Convert results to JSON for embedding in JavaScript. Escape "</" so
+        # values from the data (e.g. group names) cannot close the script tag.
+        results_json = json.dumps(web_results, indent=2).replace("</", "<\\/")
 
         html_template = f"""<!DOCTYPE html>
 <html lang="en">
@@ -878,6 +882,22 @@ class WebOutputter:
             margin-top: 4px;
             font-style: italic;
         }}
+        .requirement-groups {{
+            margin-top: 4px;
+            font-size: 0.75rem;
+            color: #475569;
+        }}
+        .requirement-groups table {{
+            border-collapse: collapse;
+            margin-top: 2px;
+        }}
+        .requirement-groups td {{
+            padding: 1px 8px 1px 0;
+        }}
+        .requirement-groups td.group-count {{
+            color: #dc2626;
+            text-align: right;
+        }}
         .requirement-meta {{
             margin-top: 4px;
             display: flex;
@@ -1501,6 +1521,31 @@ class WebOutputter:
             document.getElementById('functionFilterRow').style.display = 'none';
         }}
 
+        function escapeHtml(value) {{
+            return String(value)
+                .replace(/&/g, '&amp;')
+                .replace(/</g, '&lt;')
+                .replace(/>/g, '&gt;')
+                .replace(/"/g, '&quot;')
+                .replace(/'/g, '&#39;');
+        }}
+
+        function renderViolationsByGroup(req) {{
+            const groups = Object.entries(req.violationsByGroup || {{}});
+            if (req.passed || groups.length === 0) return '';
+            const shown = groups.slice(0, 10);
+            const more = groups.length - shown.length;
+            return `
+                <div class="requirement-groups">
+                    Violations by ${{escapeHtml(req.groupBy)}}:
+                    <table>
+                        ${{shown.map(([group, count]) => `<tr><td>${{escapeHtml(group)}}</td><td class="group-count">${{count}}</td></tr>`).join('')}}
+                    </table>
+                    ${{more > 0 ? `<div>and ${{more}} more</div>` : ''}}
+                </div>
+            `;
+        }}
+
         function renderColumns(columns) {{
             // For backward compatibility, if columns array is provided, use legacy structure
             if (columns && columns.length > 0) {{
@@ -1543,6 +1588,7 @@ class WebOutputter:
                                             </div>
                                         ` : ''}}
                                         ${{!req.passed && req.errorMessage ? `<div class="requirement-error">${{req.errorMessage}}</div>` : ''}}
+                                        ${{renderViolationsByGroup(req)}}
                                     </div>
                                 </div>
                             `).join('')}}
@@ -1613,6 +1659,7 @@ class WebOutputter:
                                                         </div>
                                                     ` : ''}}
                                                     ${{!req.passed && req.errorMessage ? `<div class="requirement-error">${{req.errorMessage}}</div>` : ''}}
+                                                    ${{renderViolationsByGroup(req)}}
                                                 </div>
                                             </div>
                                         `).join('')}}
@@ -1668,6 +1715,7 @@ class WebOutputter:
                                     </div>
                                     <div class="rule-text">${{rule.requirement.text}}</div>
                                     ${{!rule.passed && (rule.requirement.errorMessage || rule.errorMessage) ? `<div class="requirement-error">${{rule.requirement.errorMessage || rule.errorMessage}}</div>` : ''}}
+                                    ${{renderViolationsByGroup(rule.requirement)}}
                                 </div>
                             `).join('')}}
                         </div>
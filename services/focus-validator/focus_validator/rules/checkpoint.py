@@ -0,0 +1,154 @@
+import hashlib
+import json
+import logging
+import os
+import shutil
+import tempfile
+import time
+from typing import Any, Dict, Optional
+
+from focus_validator.config_objects.plan_builder import ValidationPlan
+from focus_validator.data_loaders.load_cache import content_hash
+from focus_validator.utils.result_details import decode_details, encode_details
+
+# Bump when the checkpoint layout or result details change shape
+CHECKPOINT_FORMAT_VERSION = 2
+DEFAULT_SAVE_INTERVAL_SECONDS = 30.0
+
+
+def plan_fingerprint(plan: ValidationPlan) -> str:
+    """Hash of every rule definition, its parents and the layer structure."""
+    hasher = hashlib.blake2b(digest_size=20)
+    for node in plan.nodes:
+        hasher.update(node.rule_id.encode("utf-8"))
+        hasher.update(node.rule.model_dump_json().encode("utf-8"))
+        hasher.update(json.dumps(sorted(node.parent_idxs)).encode("utf-8"))
+    hasher.update(json.dumps([sorted(layer) for layer in plan.layers]).encode("utf-8"))
+    return hasher.hexdigest()
+
+
+def checkpoint_key(
+    data_filename: str, plan: ValidationPlan, options: Dict[str, Any]
+) -> str:
+    """
+    Key a checkpoint to the data file's contents, the plan and the options
+    that change results, so a resumed run only reuses equivalent results.
+    """
+    stat = os.stat(data_filename)
+    key_material = json.dumps(
+        {
+            "version": CHECKPOINT_FORMAT_VERSION,
+            "size": stat.st_size,
+            "content": content_hash(data_filename),
+            "plan": plan_fingerprint(plan),
+            "options": options,
+        },
+        sort_keys=True,
+        default=str,
+    )
+    return hashlib.blake2b(key_material.encode("utf-8"), digest_size=20).hexdigest()
+
+
+class ValidationCheckpoint:
+    """
+    Results of the rules finished so far, kept in a local JSON file so an
+    interrupted run can resume without evaluating them again. Violation
+    samples (``--show-violations``) are kept next to it, as Arrow IPC files
+    in ``<path>.frames``.
+
+    ``save`` writes every finished rule; ``maybe_save`` does so at most
+    once per ``save_interval_seconds``, so a run cut short in the middle of
+    a large plan layer only loses the rules since the last save.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        key: str,
+        save_interval_seconds: float = DEFAULT_SAVE_INTERVAL_SECONDS,
+    ) -> None:
+        self.log = logging.getLogger(f"{__name__}.{self.__class__.__qualname__}")
+        self.path = path
+        self.key = key
+        self.frame_dir = f"{path}.frames"
+        self.save_interval_seconds = save_interval_seconds
+        self._last_save = time.monotonic()
+        # plan index -> JSON-safe result; a finished rule is encoded once
+        self._encoded: Dict[int, Dict[str, Any]] = {}
+
+    def load(self) -> Optional[Dict[int, Dict[str, Any]]]:
+        """Return the saved results by plan index, or None to start over."""
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                state = json.load(f)
+        except FileNotFoundError:
+            self.log.info(
+                "No checkpoint at %s; starting from the first rule", self.path
+            )
+            return None
+        except Exception as e:
+            self.log.warning("Ignoring unreadable checkpoint %s: %s", self.path, e)
+            return None
+        if not isinstance(state, dict) or state.get("key") != self.key:
+            self.log.warning(
+                "Checkpoint %s is for different data, rules or options; starting over",
+                self.path,
+            )
+            return None
+        try:
+            encoded = {
+                int(idx): entry for idx, entry in state["results_by_idx"].items()
+            }
+            results = {
+                idx: decode_details(entry, self.frame_dir)
+                for idx, entry in encoded.items()
+            }
+        except Exception as e:
+            self.log.warning("Ignoring unreadable checkpoint %s: %s", self.path, e)
+            return None
+        self._encoded = encoded
+        self.log.info(
+            "Resuming from checkpoint %s with %d finished rules",
+            self.path,
+            len(results),
+        )
+        return results
+
+    def maybe_save(self, results_by_idx: Dict[int, Dict[str, Any]]) -> None:
+        if time.monotonic() - self._last_save >= self.save_interval_seconds:
+            self.save(results_by_idx)
+
+    def save(self, results_by_idx: Dict[int, Dict[str, Any]]) -> None:
+        """Write ``results_by_idx``, the rules that finished, to the checkpoint."""
+        directory = os.path.dirname(os.path.abspath(self.path))
+        for idx, entry in results_by_idx.items():
+            if idx not in self._encoded:
+                self._encoded[idx] = encode_details(entry, self.frame_dir, str(idx))
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(
+                    {
+                        "key": self.key,
+                        "results_by_idx": {
+                            str(idx): self._encoded[idx] for idx in results_by_idx
+                        },
+                    },
+                    f,
+                )
+            # Atomic publish, so a crash mid-write keeps the previous save
+            os.replace(tmp_path, self.path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+        self._last_save = time.monotonic()
+        self.log.debug(
+            "Checkpointed %d finished rules to %s", len(results_by_idx), self.path
+        )
+
+    def clear(self) -> None:
+        try:
+            os.unlink(self.path)
+        except FileNotFoundError:
+            pass
+        shutil.rmtree(self.frame_dir, ignore_errors=True)
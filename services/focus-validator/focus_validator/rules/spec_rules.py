@@ -1,7 +1,9 @@
 import logging
 import os
+import time
+from contextlib import contextmanager
 from dataclasses import dataclass
-from typing import Any, Callable, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
 
 import duckdb  # type: ignore[import-untyped]
 import requests
@@ -11,11 +13,32 @@ from focus_validator.config_objects.focus_to_duckdb_converter import (
     FocusToDuckDBSchemaConverter,
 )
 from focus_validator.config_objects.plan_builder import ExecNode, ValidationPlan
+from focus_validator.config_objects.incremental import PartitionStateStore
+from focus_validator.config_objects.result_cache import ResultCache
+from focus_validator.config_objects.scheduler import CostScheduler
+from focus_validator.rules.checkpoint import ValidationCheckpoint
 from focus_validator.exceptions import (
     FailedDownloadError,
     InvalidRuleException,
     UnsupportedVersion,
 )
+from focus_validator.utils import performance_logging
+from focus_validator.utils.deadline import (
+    DEADLINE,
+    DEPENDENCY,
+    QueryDeadline,
+    not_evaluated_details,
+)
+from focus_validator.utils.metrics import MetricsCollector, NodeMetrics
+from focus_validator.utils.query_cost import (
+    DEFAULT_DUCKDB_TYPE,
+    DUCKDB_TYPES,
+    CostReport,
+    QueryCostEstimator,
+    create_schema_relation,
+)
+from focus_validator.utils.sql_profiler import SQLProfiler
+from focus_validator.utils.tracing import traced
 
 log = logging.getLogger(__name__)
 BuildCheck = Callable[[Any, Dict[int, Dict[str, Any]], Tuple[Any, ...]], Any]
@@ -34,6 +57,8 @@ class ValidationResults:
     data_row_count: int  # Number of rows in the input data
     model_version: str  # Requirements model version from JSON Details section
     focus_dataset: str  # FOCUS dataset name being validated
+    metrics: Optional[MetricsCollector] = None  # Per-rule metrics, when collected
+    partial: bool = False  # Some rules were not evaluated (deadline / timeout)
 
 
 class SpecRules:
@@ -141,6 +166,8 @@ class SpecRules:
         self.json_checkfunctions = {}
         self.plan = None
         self.column_types = {}
+        # EXPLAIN estimates from estimate_costs(), for scheduling and reporting
+        self.cost_estimates: Optional[CostReport] = None
 
     def supported_local_versions(self) -> List[str]:
         """Return list of versions from files in rule_set_path."""
@@ -285,6 +312,10 @@ class SpecRules:
         }
         return val_plan
 
+    @traced(
+        "spec_rules.validate",
+        result_attributes=lambda results: {"rules": len(results.by_idx)},
+    )
     def validate(
         self,
         focus_data: Any,
@@ -294,6 +325,22 @@ class SpecRules:
         show_violations: bool = False,
         data_filename: str = "",
         data_row_count: int = 0,
+        metrics: Optional[MetricsCollector] = None,
+        sql_profiler: Optional[SQLProfiler] = None,
+        scheduler: Optional[CostScheduler] = None,
+        violation_limit: Optional[int] = None,
+        sample: Optional[str] = None,
+        deadline: Optional[float] = None,
+        rule_timeout_seconds: Optional[float] = None,
+        checkpoint: Optional[ValidationCheckpoint] = None,
+        resume: bool = False,
+        incremental: Optional[PartitionStateStore] = None,
+        result_cache: Optional[ResultCache] = None,
+        group_by: Optional[str] = None,
+        violation_matrix: Optional[str] = None,
+        export_violations: Optional[str] = None,
+        export_violations_limit: Optional[int] = None,
+        check_seconds: Optional[List[Tuple[str, float]]] = None,
     ) -> ValidationResults:
         """
         Execute the loaded ValidationPlan using DuckDB.
@@ -303,6 +350,37 @@ class SpecRules:
           connection: an open duckdb connection
           converter: an instance configured to work with this plan + connection
           stop_on_first_error: abort early when a check fails
+          metrics: optional collector for per-node build/SQL/Python time,
+            rows scanned and peak memory; attached to the results
+          sql_profiler: optional DuckDB query-profile capture for leaf queries
+          scheduler: optional cost-based ordering of each layer's rules; it
+            also records every rule's time and outcome into its history
+          violation_limit: stop counting each leaf's violations after this
+            many rows (None = exact counts)
+          sample: sample size (row count or "N%"); row-local rules run on
+            the sample and rerun on all rows only when it shows violations
+          deadline: time.monotonic() by which the run must finish; the
+            running query is cancelled and the remaining rules are reported
+            as not evaluated, in a partial result
+          rule_timeout_seconds: cancel any single rule running longer than
+            this; it and the rules depending on it are not evaluated
+          checkpoint: save the finished rules' results periodically, after
+            each layer and before returning a partial result; removed once
+            the run completes
+          resume: skip the rules whose results are saved in ``checkpoint``
+          incremental: per-partition counts from earlier runs; row-local
+            rules only scan new or changed partitions
+          result_cache: leaf results from earlier runs, reused when the SQL
+            and the columns it reads are unchanged
+          group_by: also count each row-local rule's violations per value
+            of this column, in the same scan
+          violation_matrix: write the rules each row violates to this
+            Parquet file, in one scan after the rules have run
+          export_violations: directory that gets the violating rows of each
+            failed row-level rule as ``<rule_id>.parquet``
+          export_violations_limit: export at most this many rows per rule
+          check_seconds: gets the check type and run time of every rule
+            that runs
 
         Returns:
           ValidationResults keyed by index and by rule_id.
@@ -318,50 +396,126 @@ class SpecRules:
             transpile_dialect=self.transpile_dialect,
             show_violations=show_violations,
             rules_version=self.rules_version,
+            metrics=metrics,
+            sql_profiler=sql_profiler,
+            violation_limit=violation_limit,
+            sample=sample,
+            incremental=incremental,
+            result_cache=result_cache,
+            group_by=group_by,
+            violation_matrix=violation_matrix,
+            export_violations=export_violations,
+            export_violations_limit=export_violations_limit,
         )
         # 1) Let the converter prepare schemas, UDFs, temp views, etc.
         if connection is None:
             connection = duckdb.connect(":memory:")
         converter.prepare(conn=connection, plan=plan)
+        performance_logging.watch_duckdb(connection)
 
         # Track if we created the connection so we can close it
         connection_created_here = connection is None
 
+        layers = (
+            scheduler.order_layers(plan, data_row_count, stop_on_first_error)
+            if scheduler is not None
+            else plan.layers
+        )
+        query_deadline = (
+            QueryDeadline(connection, deadline, rule_timeout_seconds)
+            if deadline is not None or rule_timeout_seconds is not None
+            else None
+        )
+        not_evaluated: set[int] = set()
+
+        restored: Dict[int, Dict[str, Any]] = {}
+        if checkpoint is not None and resume:
+            restored = checkpoint.load() or {}
+            results_by_idx.update(restored)
+            # Reference and composite rules look their parents up here
+            for idx, entry in restored.items():
+                converter.update_global_results(idx, entry["ok"], entry["details"])
+
+        def save_checkpoint(force: bool) -> None:
+            if checkpoint is None:
+                return
+            # Rules cut off by a deadline or timeout run again on resume
+            finished = {
+                idx: entry
+                for idx, entry in results_by_idx.items()
+                if idx not in not_evaluated
+            }
+            if force:
+                checkpoint.save(finished)
+            else:
+                checkpoint.maybe_save(finished)
+
         try:
             # 2) Walk layers (easy to parallelize later)
-            for layer in plan.layers:
+            for layer in layers:
                 for idx in layer:
                     node: ExecNode = plan.nodes[idx]
-                    setattr(
-                        node.rule,
-                        "_plan_parents_",
-                        {
-                            plan.nodes[p].rule_id: results_by_idx[p]
-                            for p in node.parent_idxs
-                        },
-                    )
-                    # Collect parents' outputs by index (already executed)
-                    parent_results = {
-                        pidx: results_by_idx[pidx] for pidx in node.parent_idxs
-                    }
-
-                    # 3) Ask converter to build the runnable check for this rule
-                    try:
-                        check = converter.build_check(
-                            rule=node.rule,
-                            parent_results_by_idx=parent_results,
-                            parent_edges=node.parent_edges,
-                            rule_id=node.rule_id,
-                            node_idx=idx,
+                    if idx in restored:
+                        if violation_matrix is not None or export_violations:
+                            # Restored rules still go into the matrix and the
+                            # exports; rebuilding the check runs no query
+                            entry = restored[idx]
+                            check = self._build_check(
+                                converter, plan, node, idx, results_by_idx
+                            )
+                            converter.record_row_violations(
+                                node.rule_id, check, entry["ok"], entry["details"]
+                            )
+                        continue
+                    cause = None
+                    if query_deadline is not None and query_deadline.expired():
+                        cause = DEADLINE
+                    elif not_evaluated.intersection(node.parent_idxs):
+                        cause = DEPENDENCY
+                    if cause is not None:
+                        not_evaluated.add(idx)
+                        details = not_evaluated_details(cause)
+                        results_by_idx[idx] = {
+                            "ok": True,
+                            "details": details,
+                            "rule_id": node.rule_id,
+                        }
+                        converter.update_global_results(idx, True, details)
+                        continue
+
+                    started = time.perf_counter() if scheduler is not None else 0.0
+
+                    with self._node_metrics(metrics, node, idx) as node_metrics:
+                        # 3) Ask converter to build the runnable check for this rule
+                        with self._timed(metrics, node_metrics, "build_ms"):
+                            check = self._build_check(
+                                converter, plan, node, idx, results_by_idx
+                            )
+
+                        # 4) Execute it via converter (runs SQL/relations inside DuckDB)
+                        with self._timed(metrics, node_metrics, "exec_ms"):
+                            check_started = time.perf_counter()
+                            ok, details = self._run_guarded(
+                                converter, check, query_deadline
+                            )
+                            check_elapsed = time.perf_counter() - check_started
+                        if check_seconds is not None:
+                            check_seconds.append(
+                                (details.get("check_type") or "unknown", check_elapsed)
+                            )
+                        if node_metrics is not None and not node_metrics.check_type:
+                            node_metrics.check_type = details.get("check_type")
+
+                    converter.record_row_violations(node.rule_id, check, ok, details)
+                    if details.get("not_evaluated"):
+                        not_evaluated.add(idx)
+                    elif scheduler is not None:
+                        scheduler.record(
+                            node.rule_id,
+                            time.perf_counter() - started,
+                            data_row_count,
+                            ok,
                         )
-                    except InvalidRuleException as e:
-                        # Make sure the exception mentions this node explicitly
-                        raise InvalidRuleException(
-                            f"[{node.rule_id} @ idx={idx}] {e}"
-                        ) from e
-
-                    # 4) Execute it via converter (runs SQL/relations inside DuckDB)
-                    ok, details = converter.run_check(check)
 
                     # 5) Stash result (index-keyed for speed; include rule_id for convenience)
                     results_by_idx[idx] = {
@@ -372,10 +526,12 @@ class SpecRules:
 
                     # Update converter's global results for dependency propagation
                     converter.update_global_results(idx, ok, details)
+                    save_checkpoint(force=False)
 
                     if stop_on_first_error and not ok:
                         # Allow converter to cleanup if it needs to
                         converter.finalize(success=False, results_by_idx=results_by_idx)
+                        results_by_idx = dict(sorted(results_by_idx.items()))
                         rules_dict = {
                             self.plan.nodes[i].rule_id: self.plan.nodes[i].rule
                             for i in results_by_idx.keys()
@@ -389,13 +545,23 @@ class SpecRules:
                             data_row_count,
                             self.model_version,
                             self.focus_dataset,
+                            metrics,
+                            partial=bool(not_evaluated),
                         )
 
+                save_checkpoint(force=True)
+
             # 6) Normal finalization (e.g., drop temps, flush logs)
             converter.finalize(success=True, results_by_idx=results_by_idx)
+            if checkpoint is not None and not not_evaluated:
+                checkpoint.clear()
 
         except Exception:
             # Ensure cleanup on error, then re-raise
+            try:
+                save_checkpoint(force=True)
+            except Exception:
+                self.log.warning("Could not save checkpoint", exc_info=True)
             try:
                 converter.finalize(success=False, results_by_idx=results_by_idx)
             finally:
@@ -408,6 +574,14 @@ class SpecRules:
                 except Exception:
                     # Ignore errors during cleanup
                     pass
+        if not_evaluated:
+            self.log.warning(
+                "Returning partial results: %d of %d rules not evaluated",
+                len(not_evaluated),
+                len(results_by_idx),
+            )
+        # Report in plan order whatever order the scheduler ran the rules in
+        results_by_idx = dict(sorted(results_by_idx.items()))
         rules_dict = {
             self.plan.nodes[i].rule_id: self.plan.nodes[i].rule
             for i in results_by_idx.keys()
@@ -421,8 +595,83 @@ class SpecRules:
             data_row_count,
             self.model_version,
             self.focus_dataset,
+            metrics,
+            partial=bool(not_evaluated),
         )
 
+    @staticmethod
+    def _build_check(
+        converter: FocusToDuckDBSchemaConverter,
+        plan: ValidationPlan,
+        node: ExecNode,
+        idx: int,
+        results_by_idx: Dict[int, Dict[str, Any]],
+    ) -> Any:
+        setattr(
+            node.rule,
+            "_plan_parents_",
+            {plan.nodes[p].rule_id: results_by_idx[p] for p in node.parent_idxs},
+        )
+        # Collect parents' outputs by index (already executed)
+        parent_results = {pidx: results_by_idx[pidx] for pidx in node.parent_idxs}
+        try:
+            return converter.build_check(
+                rule=node.rule,
+                parent_results_by_idx=parent_results,
+                parent_edges=node.parent_edges,
+                rule_id=node.rule_id,
+                node_idx=idx,
+            )
+        except InvalidRuleException as e:
+            # Make sure the exception mentions this node explicitly
+            raise InvalidRuleException(f"[{node.rule_id} @ idx={idx}] {e}") from e
+
+    @staticmethod
+    def _run_guarded(
+        converter: FocusToDuckDBSchemaConverter,
+        check: Any,
+        query_deadline: Optional[QueryDeadline],
+    ) -> Tuple[bool, Dict[str, Any]]:
+        if query_deadline is None:
+            return converter.run_check(check)
+        t0 = time.perf_counter()
+        try:
+            with query_deadline.guard():
+                ok, details = converter.run_check(check)
+        except duckdb.InterruptException:
+            if query_deadline.interrupted is None:
+                raise
+        # Also covers interrupts swallowed inside run_check's own handlers
+        if query_deadline.interrupted is not None:
+            return True, not_evaluated_details(
+                query_deadline.interrupted, (time.perf_counter() - t0) * 1000.0
+            )
+        return ok, details
+
+    @staticmethod
+    @contextmanager
+    def _node_metrics(
+        metrics: Optional[MetricsCollector], node: ExecNode, idx: int
+    ) -> Iterator[Optional[NodeMetrics]]:
+        if metrics is None:
+            yield None
+            return
+        with metrics.node(node.rule_id, node_idx=idx) as node_metrics:
+            yield node_metrics
+
+    @staticmethod
+    @contextmanager
+    def _timed(
+        metrics: Optional[MetricsCollector],
+        node_metrics: Optional[NodeMetrics],
+        attr: str,
+    ) -> Iterator[None]:
+        if metrics is None or node_metrics is None:
+            yield
+            return
+        with metrics.timed(node_metrics, attr):
+            yield
+
     def explain(self) -> Dict[str, Dict[str, Any]]:
         """
         Generate SQL explanations for all validation rules without executing them.
@@ -477,6 +726,71 @@ class SpecRules:
             except Exception:
                 pass
 
+    def model_columns(self) -> List[str]:
+        """Every column the loaded plan checks or types."""
+        columns = set(self.column_types)
+        if self.plan is not None:
+            columns.update(
+                node.rule.reference
+                for node in self.plan.nodes
+                if getattr(node.rule, "entity_type", None) == "Column"
+            )
+        return sorted(columns)
+
+    def estimate_costs(
+        self,
+        row_count: int,
+        columns: Optional[List[str]] = None,
+        sql_map: Optional[Dict[str, Dict[str, Any]]] = None,
+    ) -> CostReport:
+        """
+        Estimate every rule's cost with DuckDB ``EXPLAIN`` against a table of
+        ``row_count`` rows, without reading any data.
+
+        Args:
+          row_count: rows of the dataset to estimate for
+          columns: dataset columns (default: every model column); each gets
+            the type the loaders would give it
+          sql_map: output of ``explain()`` to reuse instead of rebuilding it
+
+        Returns:
+          CostReport with per-rule and per-layer estimates, also kept on
+          ``cost_estimates``.
+        """
+        if self.plan is None:
+            raise RuntimeError("SpecRules.estimate_costs() called before load_rules().")
+
+        converter = FocusToDuckDBSchemaConverter(
+            focus_data=None,
+            explain_mode=True,
+            validated_applicability_criteria=self.applicability_criteria_list,
+            show_violations=False,
+            rules_version=self.rules_version,
+        )
+        connection = duckdb.connect(":memory:")
+        try:
+            converter.prepare(conn=connection, plan=self.plan)
+            if sql_map is None:
+                sql_map = converter.emit_sql_map()
+            column_types = {
+                name: DUCKDB_TYPES.get(
+                    str(self.column_types.get(name)), DEFAULT_DUCKDB_TYPE
+                )
+                for name in (columns if columns is not None else self.model_columns())
+            }
+            create_schema_relation(
+                connection, converter.table_name, column_types, row_count
+            )
+            self.cost_estimates = QueryCostEstimator(connection).estimate(
+                self.plan, sql_map, row_count
+            )
+            return self.cost_estimates
+        finally:
+            try:
+                connection.close()
+            except Exception:
+                pass
+
     # Optional helper(s)
     def _results_by_rule_id(
         self, by_idx: Dict[int, Dict[str, Any]]
@@ -0,0 +1,175 @@
+import cProfile
+import logging
+import os
+import pstats
+import sys
+import threading
+import time
+from collections import Counter, defaultdict
+from contextlib import contextmanager
+from typing import Any, DefaultDict, Dict, Iterator, List, Optional, Tuple
+
+from tabulate import tabulate
+
+PROFILERS = ("cprofile", "sampling")
+PROFILE_SUFFIXES = {"cprofile": ".prof", "sampling": ".folded"}
+DEFAULT_TOP = 25
+DEFAULT_SAMPLING_INTERVAL = 0.005
+
+# (filename, first line, qualified name), as used by pstats
+FunctionKey = Tuple[str, int, str]
+
+
+def default_output_path(mode: str) -> str:
+    stamp = time.strftime("%Y%m%d-%H%M%S")
+    return f"focus-validator-{mode}-{stamp}{PROFILE_SUFFIXES[mode]}"
+
+
+def _short_path(filename: str) -> str:
+    for marker in ("site-packages" + os.sep, os.getcwd() + os.sep):
+        _, found, rest = filename.rpartition(marker)
+        if found:
+            return rest
+    return filename
+
+
+def _label(key: FunctionKey) -> str:
+    filename, line, name = key
+    if filename == "~":
+        # cProfile's key for C functions
+        return name
+    return f"{_short_path(filename)}:{line}({name})"
+
+
+class CPUProfiler:
+    """
+    Profiles the CPU time of a block with cProfile or a sampling profiler.
+
+    ``cprofile`` is deterministic and counts calls, but its per-call hook
+    inflates the cost of small, hot functions; the profile is written in
+    pstats format (``snakeviz``, ``python -m pstats``). ``sampling`` walks
+    the profiled thread's stack every ``interval`` seconds from a background
+    thread, so overhead stays flat; it writes collapsed stacks that
+    ``flamegraph.pl`` and speedscope load directly.
+    """
+
+    def __init__(
+        self,
+        mode: str,
+        output_path: Optional[str] = None,
+        top: int = DEFAULT_TOP,
+        interval: float = DEFAULT_SAMPLING_INTERVAL,
+    ) -> None:
+        if mode not in PROFILERS:
+            raise ValueError(
+                f"Unsupported profiler '{mode}'. Choose one of: {', '.join(PROFILERS)}"
+            )
+        self.log = logging.getLogger(f"{__name__}.{self.__class__.__qualname__}")
+        self.mode = mode
+        self.output_path = output_path
+        self.top = top
+        self.interval = interval
+        self.stats: Optional[pstats.Stats] = None
+        self.stacks: Counter = Counter()
+        self.self_seconds: DefaultDict[FunctionKey, float] = defaultdict(float)
+        self.cumulative_seconds: DefaultDict[FunctionKey, float] = defaultdict(float)
+        self.samples = 0
+
+    @contextmanager
+    def profile(self) -> Iterator["CPUProfiler"]:
+        """Profile the calling thread for the duration of the block."""
+        if self.mode == "cprofile":
+            profiler = cProfile.Profile()
+            profiler.enable()
+            try:
+                yield self
+            finally:
+                profiler.disable()
+                self.stats = pstats.Stats(profiler)
+        else:
+            stop = threading.Event()
+            sampler = threading.Thread(
+                target=self._sample,
+                args=(threading.get_ident(), stop),
+                name="cpu-profiler-sampler",
+                daemon=True,
+            )
+            sampler.start()
+            try:
+                yield self
+            finally:
+                stop.set()
+                sampler.join()
+
+        if self.output_path is not None:
+            self.write(self.output_path)
+
+    def _sample(self, thread_id: int, stop: threading.Event) -> None:
+        last = time.perf_counter()
+        while not stop.wait(self.interval):
+            now = time.perf_counter()
+            elapsed, last = now - last, now
+            frame = sys._current_frames().get(thread_id)
+            if frame is None:
+                continue
+            stack: List[FunctionKey] = []
+            while frame is not None:
+                code = frame.f_code
+                stack.append((code.co_filename, code.co_firstlineno, code.co_qualname))
+                frame = frame.f_back
+            self.samples += 1
+            self.stacks[tuple(reversed(stack))] += 1
+            self.self_seconds[stack[0]] += elapsed
+            for key in set(stack):
+                self.cumulative_seconds[key] += elapsed
+
+    def write(self, path: str) -> None:
+        if self.mode == "cprofile":
+            if self.stats is not None:
+                self.stats.dump_stats(path)
+        else:
+            with open(path, "w") as f:
+                for stack, count in self.stacks.most_common():
+                    f.write(";".join(_label(key) for key in stack) + f" {count}\n")
+        self.log.info("Wrote %s profile to %s", self.mode, path)
+
+    def top_functions(self, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Functions by cumulative time, most expensive first."""
+        limit = limit or self.top
+        if self.mode == "cprofile":
+            if self.stats is None:
+                return []
+            rows = [
+                {
+                    "function": _label(key),
+                    "calls": nc,
+                    "self_s": tt,
+                    "cumulative_s": ct,
+                }
+                for key, (cc, nc, tt, ct, callers) in self.stats.stats.items()  # type: ignore[attr-defined]
+            ]
+        else:
+            rows = [
+                {
+                    "function": _label(key),
+                    "calls": None,
+                    "self_s": self.self_seconds.get(key, 0.0),
+                    "cumulative_s": seconds,
+                }
+                for key, seconds in self.cumulative_seconds.items()
+            ]
+        rows.sort(key=lambda r: r["cumulative_s"], reverse=True)
+        return rows[:limit]
+
+    def format_top(self, limit: Optional[int] = None) -> str:
+        rows = self.top_functions(limit)
+        if self.mode == "sampling":
+            title = f"Top functions by cumulative time ({self.samples} samples)"
+        else:
+            title = "Top functions by cumulative time"
+        table = tabulate(
+            [(r["cumulative_s"], r["self_s"], r["calls"], r["function"]) for r in rows],
+            headers=["Cumulative s", "Self s", "Calls", "Function"],
+            floatfmt=".3f",
+        )
+        return f"{title}\n{table}"
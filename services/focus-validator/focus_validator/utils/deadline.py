@@ -0,0 +1,101 @@
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, Optional
+
+# Why a rule was not evaluated
+DEADLINE = "deadline"
+TIMEOUT = "timeout"
+DEPENDENCY = "dependency"
+
+_REASONS = {
+    DEADLINE: "not evaluated (deadline)",
+    TIMEOUT: "not evaluated (rule timeout)",
+    DEPENDENCY: "not evaluated (depends on a rule that was not evaluated)",
+}
+
+
+def not_evaluated_details(cause: str, elapsed_ms: float = 0.0) -> Dict[str, Any]:
+    """Result details for a rule cut off by a deadline, timeout or dependency."""
+    reason = _REASONS[cause]
+    return {
+        "skipped": True,
+        "not_evaluated": cause,
+        "reason": reason,
+        "message": reason,
+        "timing_ms": elapsed_ms,
+    }
+
+
+class QueryDeadline:
+    """
+    Time budget for a validation run plus an optional per-rule timeout.
+
+    ``guard()`` arms a timer for the rule about to run; when it fires, the
+    running DuckDB query is cancelled with ``connection.interrupt()``.
+    ``deadline`` is an absolute ``time.monotonic()`` value, so time spent
+    loading data before the rules run counts against the budget.
+    """
+
+    def __init__(
+        self,
+        connection: Any,
+        deadline: Optional[float] = None,
+        rule_timeout_seconds: Optional[float] = None,
+    ) -> None:
+        self.log = logging.getLogger(f"{__name__}.{self.__class__.__qualname__}")
+        self.connection = connection
+        self.deadline = deadline
+        self.rule_timeout_seconds = rule_timeout_seconds
+        # Cause of the last interrupt (DEADLINE / TIMEOUT), None if none fired
+        self.interrupted: Optional[str] = None
+        self._lock = threading.Lock()
+        self._armed = False
+
+    def remaining(self) -> Optional[float]:
+        if self.deadline is None:
+            return None
+        return self.deadline - time.monotonic()
+
+    def expired(self) -> bool:
+        remaining = self.remaining()
+        return remaining is not None and remaining <= 0
+
+    def _fire(self, cause: str) -> None:
+        # Holding the lock keeps an interrupt from landing on the next
+        # rule's query after guard() has already exited
+        with self._lock:
+            if not self._armed:
+                return
+            self.interrupted = cause
+            self.log.warning("Cancelling running query (%s)", cause)
+            self.connection.interrupt()
+
+    @contextmanager
+    def guard(self) -> Iterator[None]:
+        """Cancel the queries run inside the block once a limit is reached."""
+        self.interrupted = None
+        remaining = self.remaining()
+        timeout = self.rule_timeout_seconds
+        if remaining is None and timeout is None:
+            yield
+            return
+        if timeout is None or (remaining is not None and remaining <= timeout):
+            limit, cause = remaining, DEADLINE
+        else:
+            limit, cause = timeout, TIMEOUT
+        # Both None returned above
+        assert limit is not None
+
+        timer = threading.Timer(max(limit, 0.0), self._fire, args=(cause,))
+        timer.daemon = True
+        with self._lock:
+            self._armed = True
+        timer.start()
+        try:
+            yield
+        finally:
+            with self._lock:
+                self._armed = False
+            timer.cancel()
@@ -0,0 +1,249 @@
+import csv
+import json
+import os
+import sys
+import tempfile
+import time
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
+from typing import Any, Dict, Iterator, List, Optional
+
+from focus_validator.utils.sql_profiler import profile_rows_scanned
+
+try:
+    import resource
+
+    HAS_RESOURCE = True
+except ImportError:  # pragma: no cover - Windows
+    HAS_RESOURCE = False
+
+# ru_maxrss is reported in bytes on macOS and in kilobytes elsewhere
+_MAXRSS_SCALE = 1 if sys.platform == "darwin" else 1024
+
+CSV_FIELDS = (
+    "rule_id",
+    "node_idx",
+    "parent_rule_id",
+    "depth",
+    "kind",
+    "check_type",
+    "build_ms",
+    "exec_ms",
+    "sql_ms",
+    "children_ms",
+    "python_ms",
+    "sql_queries",
+    "rows_scanned",
+    "peak_rss_delta_bytes",
+)
+
+
+def peak_rss_bytes() -> int:
+    if not HAS_RESOURCE:
+        return 0
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * _MAXRSS_SCALE
+
+
+@dataclass
+class NodeMetrics:
+    """
+    Cost of one plan node (a rule) or one nested check of a composite.
+
+    ``exec_ms`` is the wall time of ``run_check`` for this node and splits
+    into ``sql_ms`` (DuckDB queries issued by the node itself),
+    ``children_ms`` (nested checks) and ``python_ms`` (everything else).
+    ``rows_scanned`` is what DuckDB's query profiles report the node's
+    queries read, so ``LIMIT``/``EXISTS`` probes and samples count only the
+    rows they reached. ``sql_queries`` and ``rows_scanned`` include nested
+    checks. Because
+    peak RSS is a high-water mark, ``peak_rss_delta_bytes`` is non-zero only
+    for nodes that pushed the process to a new peak.
+    """
+
+    rule_id: Optional[str]
+    node_idx: Optional[int] = None
+    kind: str = "leaf"
+    check_type: Optional[str] = None
+    build_ms: float = 0.0
+    exec_ms: float = 0.0
+    sql_ms: float = 0.0
+    children_ms: float = 0.0
+    python_ms: float = 0.0
+    sql_queries: int = 0
+    rows_scanned: int = 0
+    peak_rss_delta_bytes: int = 0
+    children: List["NodeMetrics"] = field(default_factory=list)
+
+    @property
+    def total_ms(self) -> float:
+        return self.build_ms + self.exec_ms
+
+    def to_dict(self) -> Dict[str, Any]:
+        data = asdict(self)
+        data["total_ms"] = self.total_ms
+        return data
+
+
+class RowsScannedProbe:
+    """
+    Rows the last DuckDB query read, from its JSON query profile (see
+    ``profile_rows_scanned``). DuckDB rewrites the profile file after every
+    query, so read it before running the next one.
+    """
+
+    def __init__(self, conn: Any) -> None:
+        self.conn = conn
+        fd, self.path = tempfile.mkstemp(prefix="focus-rows-", suffix=".json")
+        os.close(fd)
+        self.enable()
+
+    def enable(self) -> None:
+        """(Re-)point profiling at the probe's file, e.g. after --profile-sql."""
+        # The output format must be set before a .json output path is accepted
+        self.conn.execute("PRAGMA enable_profiling='json'")
+        quoted = self.path.replace("'", "''")
+        self.conn.execute(f"SET profiling_output='{quoted}'")
+
+    def last_query(self) -> int:
+        try:
+            with open(self.path) as f:
+                profile = json.load(f)
+        except (OSError, ValueError):
+            return 0
+        return profile_rows_scanned(profile)
+
+    def close(self) -> None:
+        try:
+            self.conn.execute("PRAGMA disable_profiling")
+        except Exception:
+            pass
+        try:
+            os.unlink(self.path)
+        except OSError:
+            pass
+
+
+class MetricsCollector:
+    """
+    Collects per-node metrics during ``SpecRules.validate``.
+
+    SpecRules opens a top-level node per plan node; the converter opens a
+    nested node for each child of a composite and reports every DuckDB
+    query it runs through ``record_sql``, which is attributed to the
+    innermost open node.
+    """
+
+    def __init__(self, table_row_count: int = 0) -> None:
+        # Reported alongside rows_scanned for scale
+        self.table_row_count = table_row_count
+        self.nodes: List[NodeMetrics] = []
+        self._stack: List[NodeMetrics] = []
+
+    @contextmanager
+    def node(
+        self,
+        rule_id: Optional[str],
+        node_idx: Optional[int] = None,
+        check_type: Optional[str] = None,
+    ) -> Iterator[NodeMetrics]:
+        metrics = NodeMetrics(rule_id=rule_id, node_idx=node_idx, check_type=check_type)
+        parent = self._stack[-1] if self._stack else None
+        (parent.children if parent else self.nodes).append(metrics)
+        self._stack.append(metrics)
+        rss_before = peak_rss_bytes()
+        try:
+            yield metrics
+        finally:
+            self._stack.pop()
+            metrics.peak_rss_delta_bytes = max(0, peak_rss_bytes() - rss_before)
+            metrics.children_ms = sum(c.exec_ms for c in metrics.children)
+            metrics.python_ms = max(
+                0.0, metrics.exec_ms - metrics.sql_ms - metrics.children_ms
+            )
+            if metrics.children:
+                metrics.kind = "composite"
+                metrics.sql_queries += sum(c.sql_queries for c in metrics.children)
+                metrics.rows_scanned += sum(c.rows_scanned for c in metrics.children)
+
+    @contextmanager
+    def timed(self, metrics: NodeMetrics, attr: str) -> Iterator[None]:
+        """Add the wall time of the block (ms) to ``metrics.<attr>``."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = (time.perf_counter() - start) * 1000.0
+            setattr(metrics, attr, getattr(metrics, attr) + elapsed)
+
+    def record_sql(self, elapsed_ms: float, rows_scanned: int = 0) -> None:
+        if not self._stack:
+            return
+        current = self._stack[-1]
+        current.sql_ms += elapsed_ms
+        current.sql_queries += 1
+        current.rows_scanned += rows_scanned
+
+    def set_kind(self, kind: str, check_type: Optional[str] = None) -> None:
+        if self._stack:
+            self._stack[-1].kind = kind
+            if check_type and not self._stack[-1].check_type:
+                self._stack[-1].check_type = check_type
+
+    def slowest(self, limit: int = 20) -> List[NodeMetrics]:
+        return sorted(self.nodes, key=lambda m: m.total_ms, reverse=True)[:limit]
+
+    def flatten(self) -> List[Dict[str, Any]]:
+        rows: List[Dict[str, Any]] = []
+
+        def walk(node: NodeMetrics, parent: Optional[str], depth: int) -> None:
+            row = {k: v for k, v in node.to_dict().items() if k in CSV_FIELDS}
+            row.update(parent_rule_id=parent, depth=depth)
+            rows.append(row)
+            for child in node.children:
+                walk(child, node.rule_id, depth + 1)
+
+        for node in self.nodes:
+            walk(node, None, 0)
+        return rows
+
+    def summary(self) -> Dict[str, Any]:
+        return {
+            "rules": len(self.nodes),
+            "build_ms": sum(n.build_ms for n in self.nodes),
+            "exec_ms": sum(n.exec_ms for n in self.nodes),
+            "sql_ms": sum(n.sql_ms for n in self._all_nodes()),
+            "sql_queries": sum(n.sql_queries for n in self.nodes),
+            "rows_scanned": sum(n.rows_scanned for n in self.nodes),
+            "table_row_count": self.table_row_count,
+        }
+
+    def _all_nodes(self) -> Iterator[NodeMetrics]:
+        pending = list(self.nodes)
+        while pending:
+            node = pending.pop()
+            yield node
+            pending.extend(node.children)
+
+    def to_json(self, path: str) -> None:
+        with open(path, "w") as f:
+            json.dump(
+                {
+                    "summary": self.summary(),
+                    "nodes": [n.to_dict() for n in self.nodes],
+                },
+                f,
+                indent=2,
+            )
+
+    def to_csv(self, path: str) -> None:
+        with open(path, "w", newline="") as f:
+            writer = csv.DictWriter(f, fieldnames=CSV_FIELDS)
+            writer.writeheader()
+            writer.writerows(self.flatten())
+
+    def export(self, path: str) -> None:
+        """Write metrics as CSV when ``path`` ends in .csv, JSON otherwise."""
+        if path.lower().endswith(".csv"):
+            self.to_csv(path)
+        else:
+            self.to_json(path)
@@ -1,111 +1,392 @@
 import functools
+import json
 import logging
-import os
+import threading
 import time
-from typing import Any, Callable, Dict, Optional
+import tracemalloc
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
+from typing import Any, Callable, Dict, Iterator, List, Optional
 
-try:
-    import psutil  # type: ignore[import-untyped]
+from tabulate import tabulate
 
-    HAS_PSUTIL = True
-except ImportError:
-    HAS_PSUTIL = False
+from focus_validator.utils import tracing
+from focus_validator.utils.metrics import peak_rss_bytes
 
 perfLogger = logging.getLogger("performance")
 
+_MB = 1024 * 1024
 
-class PerformanceTracker:
-    def __init__(self):
-        self.startTime = None
-        self.operation = None
-        self.context = {}
+DUCKDB_MEMORY_SQL = "SELECT coalesce(sum(memory_usage_bytes), 0) FROM duckdb_memory()"
+DUCKDB_SAMPLE_INTERVAL_SECONDS = 0.05
 
-    def start(self, operation: str, context: Optional[Dict[str, Any]] = None):
-        self.operation = operation
-        self.context = context or {}
-        self.startTime = time.time()
 
-        # Log operation start with context
-        contextStr = (
-            ", ".join(f"{k}={v}" for k, v in self.context.items())
-            if self.context
-            else "no context"
-        )
-        perfLogger.info(f"Started {operation} ({contextStr})")
+def _format_context(context: Dict[str, Any]) -> str:
+    return ", ".join(f"{k}={v}" for k, v in context.items())
 
-    def finish(self, additionalContext: Optional[Dict[str, Any]] = None):
-        if self.startTime is None:
-            return
 
-        duration = time.time() - self.startTime
+@dataclass
+class PhaseRecord:
+    """
+    Cost of one tracked phase.
+
+    ``peak_python_bytes`` is the highest tracemalloc total seen while the
+    phase ran and ``peak_duckdb_bytes`` the highest memory DuckDB reported
+    (sampled every 50 ms from a background cursor). The process RSS is only
+    known as a high-water mark, so ``peak_rss_delta_bytes`` is how far the
+    phase raised it: zero for phases that stayed below an earlier peak. The
+    run's peak is in the report summary.
+    """
+
+    operation: str
+    depth: int = 0
+    context: Dict[str, Any] = field(default_factory=dict)
+    status: str = "ok"
+    wall_ms: float = 0.0
+    cpu_ms: float = 0.0
+    peak_rss_delta_bytes: int = 0
+    peak_python_bytes: int = 0
+    peak_duckdb_bytes: int = 0
+
+
+class PerformanceReport:
+    """
+    Per-run aggregate of every phase tracked while it is active.
+
+    Python allocations are traced with tracemalloc for the lifetime of the
+    report (when ``trace_python_memory`` is set), which slows allocation-heavy
+    code; leave it off when only timings are needed.
+    """
+
+    def __init__(self, trace_python_memory: bool = True) -> None:
+        self.phases: List[PhaseRecord] = []
+        self.trace_python_memory = trace_python_memory
+        self._open: List[PhaseRecord] = []
+        # id(record) -> process RSS high-water mark when the phase opened
+        self._rss_at_open: Dict[int, int] = {}
+        self._lock = threading.Lock()
+        self._sampler: Optional[threading.Thread] = None
+        self._sampler_stop = threading.Event()
 
-        # Get memory usage if psutil is available
-        memoryMb = 0
-        if HAS_PSUTIL:
+    # -- phase bookkeeping ------------------------------------------------------
+    def _python_peak(self) -> int:
+        if not self.trace_python_memory or not tracemalloc.is_tracing():
+            return 0
+        return tracemalloc.get_traced_memory()[1]
+
+    def open(self, record: PhaseRecord) -> None:
+        # Fold the peak so far into the enclosing phases before resetting it
+        # for the new one
+        peak = self._python_peak()
+        for parent in self._open:
+            parent.peak_python_bytes = max(parent.peak_python_bytes, peak)
+        if self.trace_python_memory and tracemalloc.is_tracing():
+            tracemalloc.reset_peak()
+        self._rss_at_open[id(record)] = peak_rss_bytes()
+        with self._lock:
+            record.depth = len(self._open)
+            self._open.append(record)
+            self.phases.append(record)
+
+    def close(self, record: PhaseRecord) -> None:
+        record.peak_python_bytes = max(record.peak_python_bytes, self._python_peak())
+        rss_before = self._rss_at_open.pop(id(record), 0)
+        record.peak_rss_delta_bytes = max(0, peak_rss_bytes() - rss_before)
+        with self._lock:
+            self._open = [r for r in self._open if r is not record]
+        for parent in self._open:
+            parent.peak_python_bytes = max(
+                parent.peak_python_bytes, record.peak_python_bytes
+            )
+
+    # -- DuckDB memory ----------------------------------------------------------
+    def watch_duckdb(self, conn: Any) -> None:
+        """
+        Poll DuckDB's memory usage on a separate cursor of ``conn`` until
+        ``stop`` so that usage during long queries is seen, not just between
+        them.
+        """
+        self.stop()
+        try:
+            cursor = conn.cursor()
+        except Exception:
+            return
+        self._sampler_stop = threading.Event()
+        self._sampler = threading.Thread(
+            target=self._sample_duckdb_memory,
+            args=(cursor, self._sampler_stop),
+            name="duckdb-memory-sampler",
+            daemon=True,
+        )
+        self._sampler.start()
+
+    def _sample_duckdb_memory(self, cursor: Any, stop: threading.Event) -> None:
+        try:
+            while True:
+                try:
+                    used = cursor.execute(DUCKDB_MEMORY_SQL).fetchone()[0]
+                except Exception:
+                    # Closed connection or a DuckDB without duckdb_memory()
+                    return
+                if not isinstance(used, int):
+                    return
+                with self._lock:
+                    for record in self._open:
+                        record.peak_duckdb_bytes = max(record.peak_duckdb_bytes, used)
+                if stop.wait(DUCKDB_SAMPLE_INTERVAL_SECONDS):
+                    return
+        finally:
             try:
-                process = psutil.Process(os.getpid())
-                memoryMb = process.memory_info().rss / 1024 / 1024
+                cursor.close()
             except Exception:
                 pass
 
-        # Combine context
-        fullContext = {**self.context, **(additionalContext or {})}
-        contextStr = (
-            ", ".join(f"{k}={v}" for k, v in fullContext.items()) if fullContext else ""
+    def stop(self) -> None:
+        """Stop the DuckDB memory sampler, if one is running."""
+        if self._sampler is not None:
+            self._sampler_stop.set()
+            self._sampler.join()
+            self._sampler = None
+
+    # -- reporting --------------------------------------------------------------
+    def summary(self) -> Dict[str, Any]:
+        roots = [p for p in self.phases if p.depth == 0]
+        return {
+            "phases": len(self.phases),
+            "wall_ms": sum(p.wall_ms for p in roots),
+            "cpu_ms": sum(p.cpu_ms for p in roots),
+            # Process-wide high-water mark, so it covers the whole run
+            "peak_rss_bytes": peak_rss_bytes(),
+            "peak_python_bytes": max(
+                (p.peak_python_bytes for p in self.phases), default=0
+            ),
+            "peak_duckdb_bytes": max(
+                (p.peak_duckdb_bytes for p in self.phases), default=0
+            ),
+        }
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "summary": self.summary(),
+            "phases": [asdict(p) for p in self.phases],
+        }
+
+    def export(self, path: str) -> None:
+        with open(path, "w") as f:
+            json.dump(self.to_dict(), f, indent=2, default=str)
+
+    def format_table(self) -> str:
+        return tabulate(
+            [
+                (
+                    "  " * p.depth + p.operation,
+                    p.wall_ms,
+                    p.cpu_ms,
+                    p.peak_rss_delta_bytes / _MB,
+                    p.peak_python_bytes / _MB,
+                    p.peak_duckdb_bytes / _MB,
+                )
+                for p in self.phases
+            ],
+            headers=[
+                "Phase",
+                "Wall ms",
+                "CPU ms",
+                "Peak RSS +MB",
+                "Python MB",
+                "DuckDB MB",
+            ],
+            floatfmt=".1f",
         )
 
-        if HAS_PSUTIL and memoryMb > 0:
+
+_active_report: Optional[PerformanceReport] = None
+
+
+def get_report() -> Optional[PerformanceReport]:
+    """The report phases are recorded into, or None when tracking is off."""
+    return _active_report
+
+
+def watch_duckdb(conn: Any) -> None:
+    """Sample ``conn``'s memory usage for the active report; no-op when off."""
+    if _active_report is not None:
+        _active_report.watch_duckdb(conn)
+
+
+@contextmanager
+def performance_session(
+    output_path: Optional[str] = None, trace_python_memory: bool = True
+) -> Iterator[PerformanceReport]:
+    """
+    Aggregate every phase tracked inside the block into one report, written
+    to ``output_path`` as JSON (also when the block raises) if given.
+    """
+    global _active_report
+    previous = _active_report
+    report = _active_report = PerformanceReport(trace_python_memory)
+    started_tracemalloc = trace_python_memory and not tracemalloc.is_tracing()
+    if started_tracemalloc:
+        tracemalloc.start()
+    try:
+        yield report
+    finally:
+        _active_report = previous
+        report.stop()
+        if started_tracemalloc:
+            tracemalloc.stop()
+        if output_path is not None:
+            report.export(output_path)
+            perfLogger.info("Wrote performance report to %s", output_path)
+
+
+class PerformanceTracker:
+    def __init__(self):
+        self.startTime: Optional[int] = None
+        self.startCpu: Optional[int] = None
+        self.operation: Optional[str] = None
+        self.context: Dict[str, Any] = {}
+        self.record: Optional[PhaseRecord] = None
+        self.report: Optional[PerformanceReport] = None
+
+    def start(self, operation: str, context: Optional[Dict[str, Any]] = None):
+        self.operation = operation
+        self.context = context or {}
+        self.report = _active_report
+        if self.report is not None:
+            self.record = PhaseRecord(operation=operation, context=dict(self.context))
+            self.report.open(self.record)
+
+        if perfLogger.isEnabledFor(logging.INFO):
             perfLogger.info(
-                f"Completed {self.operation} in {duration:.3f}s (memory: {memoryMb:.1f}MB) — {contextStr}"
+                "Started %s (%s)",
+                operation,
+                _format_context(self.context) or "no context",
             )
-        else:
+
+        self.startCpu = time.process_time_ns()
+        self.startTime = time.perf_counter_ns()
+
+    def finish(
+        self, additionalContext: Optional[Dict[str, Any]] = None
+    ) -> Optional[PhaseRecord]:
+        startTime, startCpu = self.startTime, self.startCpu
+        if startTime is None or startCpu is None:
+            return None
+
+        wallMs = (time.perf_counter_ns() - startTime) / 1e6
+        cpuMs = (time.process_time_ns() - startCpu) / 1e6
+        fullContext = {**self.context, **(additionalContext or {})}
+
+        record = self.record
+        if record is not None and self.report is not None:
+            record.wall_ms = wallMs
+            record.cpu_ms = cpuMs
+            record.context = fullContext
+            if "error" in fullContext:
+                record.status = "error"
+            self.report.close(record)
+
+        if perfLogger.isEnabledFor(logging.INFO):
+            peakMb = peak_rss_bytes() / _MB
             perfLogger.info(
-                f"Completed {self.operation} in {duration:.3f}s — {contextStr}"
+                "Completed %s in %.3fs (cpu: %.3fs, process peak RSS: %.1fMB) — %s",
+                self.operation,
+                wallMs / 1000,
+                cpuMs / 1000,
+                peakMb,
+                _format_context(fullContext),
             )
 
         # Reset
         self.startTime = None
+        self.startCpu = None
         self.operation = None
         self.context = {}
+        self.record = None
+        self.report = None
+        return record
+
+
+@contextmanager
+def trackPhase(operation: str, **context: Any) -> Iterator[None]:
+    """Track a block like a ``logPerformance``-decorated call."""
+    if (
+        _active_report is None
+        and tracing.get_tracer() is None
+        and not perfLogger.isEnabledFor(logging.INFO)
+    ):
+        yield
+        return
+    with tracing.span(operation, **context):
+        tracker = PerformanceTracker()
+        tracker.start(operation, context)
+        try:
+            yield
+        except Exception as e:
+            tracker.finish({"error": str(e)[:100]})
+            raise
+        tracker.finish()
+
+
+def _call_context(includeArgs: bool, args: tuple, kwargs: dict) -> Dict[str, Any]:
+    context: Dict[str, Any] = {}
+    if includeArgs and args:
+        if hasattr(args[0], "__class__"):
+            context["instance"] = args[0].__class__.__name__
+        if len(args) > 1:
+            context["args_count"] = len(args) - 1
+    if includeArgs and kwargs:
+        context.update({k: str(v)[:50] for k, v in kwargs.items()})
+    return context
+
+
+def _result_context(result: Any) -> Dict[str, Any]:
+    if hasattr(result, "__len__"):
+        try:
+            return {"result_size": len(result)}
+        except Exception:
+            pass
+    return {}
 
 
 def logPerformance(
     operation: str, includeArgs: bool = False, context: Optional[dict[str, Any]] = None
 ) -> Callable:
     def decorator(func: Callable) -> Callable:
+        operationName = operation or f"{func.__module__}.{func.__qualname__}"
+
         @functools.wraps(func)
         def wrapper(*args, **kwargs):
-            operationName = operation or f"{func.__module__}.{func.__qualname__}"
-
-            # Build context from args if requested
-            context = {}
-            if includeArgs and args:
-                if hasattr(args[0], "__class__"):
-                    context["instance"] = args[0].__class__.__name__
-                if len(args) > 1:
-                    context["args_count"] = len(args) - 1
-            if includeArgs and kwargs:
-                context.update({k: str(v)[:50] for k, v in kwargs.items()})
+            tracer = tracing.get_tracer()
+            report = _active_report
+            logging_on = perfLogger.isEnabledFor(logging.INFO)
+            # Nothing is listening: call straight through
+            if tracer is None and report is None and not logging_on:
+                return func(*args, **kwargs)
 
-            tracker = PerformanceTracker()
-            tracker.start(operationName, context)
+            callContext = _call_context(includeArgs, args, kwargs)
 
-            try:
-                result = func(*args, **kwargs)
+            # With only tracing on, the call is recorded as a span instead of
+            # start/finish log lines
+            with tracing.span(operationName, **callContext) as span:
+                tracker = None
+                if report is not None or tracer is None:
+                    tracker = PerformanceTracker()
+                    tracker.start(operationName, callContext)
+                try:
+                    result = func(*args, **kwargs)
+                except Exception as e:
+                    if tracker is not None:
+                        tracker.finish({"error": str(e)[:100]})
+                    raise
 
-                # Add result context if available
-                resultContext = {}
-                if hasattr(result, "__len__"):
-                    try:
-                        resultContext["result_size"] = len(result)
-                    except Exception:
-                        pass
-
-                tracker.finish(resultContext)
+                resultContext = _result_context(result)
+                if span is not None:
+                    span.attributes.update(resultContext)
+                if tracker is not None:
+                    tracker.finish(resultContext)
                 return result
-            except Exception as e:
-                tracker.finish({"error": str(e)[:100]})
-                raise
 
         return wrapper
 
@@ -116,15 +397,15 @@ def logTiming(logger: logging.Logger, operation: str):
     def decorator(func: Callable) -> Callable:
         @functools.wraps(func)
         def wrapper(*args, **kwargs):
-            startTime = time.time()
+            startTime = time.perf_counter()
             try:
                 result = func(*args, **kwargs)
-                duration = time.time() - startTime
-                logger.debug(f"{operation} completed in {duration:.3f}s")
+                duration = time.perf_counter() - startTime
+                logger.debug("%s completed in %.3fs", operation, duration)
                 return result
             except Exception as e:
-                duration = time.time() - startTime
-                logger.error(f"{operation} failed after {duration:.3f}s: {e}")
+                duration = time.perf_counter() - startTime
+                logger.error("%s failed after %.3fs: %s", operation, duration, e)
                 raise
 
         return wrapper
@@ -0,0 +1,263 @@
+import json
+import logging
+from collections import Counter
+from dataclasses import asdict, dataclass, field
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+import pyarrow as pa  # type: ignore[import-untyped]
+import pyarrow.parquet as pq  # type: ignore[import-untyped]
+from tabulate import tabulate
+
+from focus_validator.data_loaders.data_loader import ARROW_IPC_EXTENSIONS
+from focus_validator.data_loaders.input_streams import (
+    detect_compression,
+    open_decompressed,
+    split_compression_suffix,
+)
+from focus_validator.utils.sql_profiler import operator_label
+
+# Rule column types (as extracted from the model) -> DuckDB types the
+# loaders produce for them
+DUCKDB_TYPES = {
+    "float64": "DOUBLE",
+    "string": "VARCHAR",
+    "datetime64[ns]": "TIMESTAMP WITH TIME ZONE",
+}
+DEFAULT_DUCKDB_TYPE = "VARCHAR"
+COUNT_CHUNK_SIZE = 4 * 1024 * 1024
+
+log = logging.getLogger(__name__)
+
+
+def data_file_shape(path: str) -> Tuple[List[str], int]:
+    """
+    Column names and row count of a data file, without loading it: Parquet
+    and Arrow IPC files are read from their metadata, CSV files by counting
+    lines (so quoted newlines inflate the count slightly).
+    """
+    base, _ = split_compression_suffix(path)
+    if base.endswith(".parquet"):
+        metadata = pq.read_metadata(path)
+        return list(metadata.schema.names), metadata.num_rows
+    if base.lower().endswith(ARROW_IPC_EXTENSIONS):
+        source = pa.memory_map(path, "r")
+        try:
+            reader = pa.ipc.open_file(source)
+            rows = sum(
+                reader.get_batch(i).num_rows for i in range(reader.num_record_batches)
+            )
+            return list(reader.schema.names), rows
+        except pa.ArrowInvalid:
+            source.seek(0)
+            stream = pa.ipc.open_stream(source)
+            return list(stream.schema.names), sum(b.num_rows for b in stream)
+
+    compression = detect_compression(path)
+    stream = open_decompressed(path, compression) if compression else open(path, "rb")
+    with stream:
+        header = b""
+        lines = 0
+        last = b"\n"
+        while True:
+            chunk = stream.read(COUNT_CHUNK_SIZE)
+            if not chunk:
+                break
+            if not header:
+                header = chunk.split(b"\n", 1)[0]
+            lines += chunk.count(b"\n")
+            last = chunk[-1:]
+    if last != b"\n":
+        lines += 1
+    columns = [c.strip().strip('"') for c in header.decode("utf-8-sig").split(",")]
+    return columns, max(lines - 1, 0)
+
+
+def create_schema_relation(
+    conn: Any, table_name: str, columns: Dict[str, str], row_count: int
+) -> None:
+    """
+    Replace ``table_name`` with a view of ``row_count`` rows and the given
+    columns (name -> DuckDB type), so EXPLAIN estimates against the real
+    table size without any data. Columns are TRY_CASTs of the row number
+    rather than NULL literals, which the optimizer would constant-fold,
+    pruning the very filters being estimated.
+    """
+    conn.execute(f"DROP TABLE IF EXISTS {table_name}")
+    projections = ", ".join(
+        f'TRY_CAST(CAST(range AS VARCHAR) AS {duckdb_type}) AS "{name}"'
+        for name, duckdb_type in columns.items()
+    )
+    conn.execute(
+        f"CREATE OR REPLACE VIEW {table_name} AS "
+        f"SELECT {projections} FROM range({int(row_count)})"
+    )
+
+
+def _walk(nodes: List[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+    for node in nodes:
+        yield node
+        yield from _walk(node.get("children", []) or [])
+
+
+def _cardinality(node: Dict[str, Any]) -> int:
+    value = (node.get("extra_info") or {}).get("Estimated Cardinality")
+    if value is None:
+        return 0
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return 0
+
+
+@dataclass
+class RuleCost:
+    """
+    EXPLAIN estimates for one rule, including the queries of its nested
+    checks. ``estimated_rows`` sums the estimated cardinality of every
+    operator (rows flowing through the plan) and is the cost used for
+    ranking; ``scan_rows`` sums the estimated rows of the base scans.
+    """
+
+    rule_id: str
+    layer: int = 0
+    queries: int = 0
+    estimated_rows: int = 0
+    scan_rows: int = 0
+    operators: Dict[str, int] = field(default_factory=dict)
+    errors: List[str] = field(default_factory=list)
+
+    def add_plan(self, plan: List[Dict[str, Any]]) -> None:
+        self.queries += 1
+        operators: Counter = Counter(self.operators)
+        for node in _walk(plan):
+            rows = _cardinality(node)
+            self.estimated_rows += rows
+            if not node.get("children"):
+                self.scan_rows += rows
+            operators[operator_label(node)] += 1
+        self.operators = dict(operators)
+
+
+class CostReport:
+    """Per-rule and per-layer EXPLAIN estimates for a validation plan."""
+
+    def __init__(self, row_count: int, rules: Dict[str, RuleCost]) -> None:
+        self.row_count = row_count
+        self.rules = rules
+
+    def estimated_cost(self, rule_id: str) -> Optional[int]:
+        cost = self.rules.get(rule_id)
+        return cost.estimated_rows if cost is not None else None
+
+    def most_expensive(self, limit: int = 20) -> List[RuleCost]:
+        return sorted(
+            self.rules.values(), key=lambda c: c.estimated_rows, reverse=True
+        )[:limit]
+
+    def layers(self) -> List[Dict[str, Any]]:
+        totals: Dict[int, Dict[str, Any]] = {}
+        for cost in self.rules.values():
+            entry = totals.setdefault(
+                cost.layer,
+                {
+                    "layer": cost.layer,
+                    "rules": 0,
+                    "queries": 0,
+                    "estimated_rows": 0,
+                    "scan_rows": 0,
+                },
+            )
+            entry["rules"] += 1
+            entry["queries"] += cost.queries
+            entry["estimated_rows"] += cost.estimated_rows
+            entry["scan_rows"] += cost.scan_rows
+        return [totals[layer] for layer in sorted(totals)]
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "row_count": self.row_count,
+            "layers": self.layers(),
+            "rules": [asdict(c) for c in self.rules.values()],
+        }
+
+    def format_table(self, limit: int = 20) -> str:
+        layers = tabulate(
+            [
+                (
+                    e["layer"],
+                    e["rules"],
+                    e["queries"],
+                    e["estimated_rows"],
+                    e["scan_rows"],
+                )
+                for e in self.layers()
+            ],
+            headers=["Layer", "Rules", "Queries", "Est. rows", "Scan rows"],
+            intfmt=",",
+        )
+        rules = tabulate(
+            [
+                (
+                    c.rule_id,
+                    c.layer,
+                    c.queries,
+                    c.estimated_rows,
+                    ", ".join(
+                        f"{op}x{n}"
+                        for op, n in sorted(c.operators.items(), key=lambda i: -i[1])
+                    ),
+                )
+                for c in self.most_expensive(limit)
+            ],
+            headers=["Rule", "Layer", "Queries", "Est. rows", "Operators"],
+            intfmt=",",
+        )
+        report = (
+            f"Estimated cost per layer ({self.row_count:,} rows)\n{layers}\n\n"
+            f"Most expensive rules\n{rules}\n"
+        )
+        failed = sorted(c.rule_id for c in self.rules.values() if c.errors)
+        if failed:
+            report += f"\nCould not plan {len(failed)} rules: {', '.join(failed)}\n"
+        return report
+
+
+class QueryCostEstimator:
+    """Runs DuckDB ``EXPLAIN`` on every leaf query of an explained plan."""
+
+    def __init__(self, conn: Any) -> None:
+        self.conn = conn
+
+    def explain_plan(self, sql: str) -> List[Dict[str, Any]]:
+        rows = self.conn.execute(f"EXPLAIN (FORMAT JSON) {sql}").fetchall()
+        for kind, plan in rows:
+            if kind == "physical_plan":
+                return json.loads(plan)
+        return []
+
+    def _add_explanation(self, cost: RuleCost, explanation: Dict[str, Any]) -> None:
+        sql = explanation.get("duckdb_sql") or explanation.get("sql")
+        if explanation.get("type") == "leaf" and sql:
+            try:
+                cost.add_plan(self.explain_plan(sql))
+            except Exception as e:
+                # Typically a column the data does not have; the real run
+                # reports the same rule as failed without scanning
+                cost.errors.append(str(e).splitlines()[0][:200])
+        for child in explanation.get("children") or []:
+            self._add_explanation(cost, child)
+
+    def estimate(
+        self, plan: Any, sql_map: Dict[str, Dict[str, Any]], row_count: int
+    ) -> CostReport:
+        rules: Dict[str, RuleCost] = {}
+        for layer_idx, layer in enumerate(plan.layers):
+            for idx in layer:
+                rule_id = plan.nodes[idx].rule_id
+                cost = RuleCost(rule_id=rule_id, layer=layer_idx)
+                explanation = sql_map.get(rule_id)
+                if explanation:
+                    self._add_explanation(cost, explanation)
+                rules[rule_id] = cost
+        log.debug("Estimated query costs for %d rules", len(rules))
+        return CostReport(row_count, rules)
@@ -0,0 +1,64 @@
+import itertools
+import os
+from typing import Any
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa  # type: ignore[import-untyped]
+import pyarrow.feather as feather  # type: ignore[import-untyped]
+
+# JSON stand-in for a DataFrame kept in its own Arrow IPC file
+FRAME_TAG = "__frame__"
+FRAME_SUFFIX = ".arrow"
+
+
+def encode_details(value: Any, frame_dir: str, prefix: str) -> Any:
+    """
+    JSON-safe copy of rule result details. DataFrames (violation samples)
+    are written to ``frame_dir`` as ``<prefix>-<n>.arrow`` and replaced by
+    a reference; numpy scalars become Python scalars and other values their
+    string form. Nothing in the output can run code when read back.
+    """
+    counter = itertools.count()
+
+    def encode(item: Any) -> Any:
+        if isinstance(item, pd.DataFrame):
+            name = f"{prefix}-{next(counter)}{FRAME_SUFFIX}"
+            _write_frame(item, os.path.join(frame_dir, name))
+            return {FRAME_TAG: name}
+        if isinstance(item, dict):
+            return {str(key): encode(child) for key, child in item.items()}
+        if isinstance(item, (list, tuple)):
+            return [encode(child) for child in item]
+        if isinstance(item, np.generic):
+            return item.item()
+        if item is None or isinstance(item, (bool, int, float, str)):
+            return item
+        return str(item)
+
+    return encode(value)
+
+
+def decode_details(value: Any, frame_dir: str) -> Any:
+    """Inverse of :func:`encode_details`, reading referenced frames back."""
+    if isinstance(value, dict):
+        name = value.get(FRAME_TAG)
+        if len(value) == 1 and isinstance(name, str):
+            if os.path.basename(name) != name:
+                raise ValueError(f"Invalid frame reference {name!r}")
+            return feather.read_table(
+                os.path.join(frame_dir, name), memory_map=False
+            ).to_pandas()
+        return {key: decode_details(child, frame_dir) for key, child in value.items()}
+    if isinstance(value, list):
+        return [decode_details(child, frame_dir) for child in value]
+    return value
+
+
+def _write_frame(df: pd.DataFrame, path: str) -> None:
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    try:
+        feather.write_feather(df, path)
+    except (pa.ArrowException, TypeError, ValueError):
+        # Mixed-type object columns; samples are only ever displayed
+        feather.write_feather(df.astype(str), path)
@@ -0,0 +1,54 @@
+import math
+import re
+from typing import Tuple
+
+# Fixed so repeated runs over the same data probe the same rows
+SAMPLE_SEED = 42
+DEFAULT_CONFIDENCE = 0.95
+_Z_SCORES = {0.9: 1.6449, 0.95: 1.96, 0.99: 2.5758}
+_SAMPLE_SIZE = re.compile(r"^\s*(\d+(?:\.\d+)?)\s*(%?)\s*$")
+
+
+def sample_clause(size: str) -> str:
+    """
+    DuckDB ``USING SAMPLE`` clause for a sample size: a row count
+    (``"100000"``, reservoir sampling) or a percentage (``"5%"``, Bernoulli
+    sampling of each row).
+    """
+    match = _SAMPLE_SIZE.match(size)
+    if match is None:
+        raise ValueError(
+            f"Unsupported sample size '{size}'. Choose one of: a row count (e.g. 100000), a percentage (e.g. 5%)"
+        )
+    value, percent = match.groups()
+    if percent:
+        if not 0 < float(value) <= 100:
+            raise ValueError(f"Sample percentage must be in (0, 100], got {value}")
+        return f"USING SAMPLE {float(value)} PERCENT (bernoulli, {SAMPLE_SEED})"
+    if "." in value or int(value) <= 0:
+        raise ValueError(f"Sample row count must be a positive integer, got {value}")
+    return f"USING SAMPLE reservoir({int(value)} ROWS) REPEATABLE ({SAMPLE_SEED})"
+
+
+def wilson_interval(
+    successes: int, trials: int, confidence: float = DEFAULT_CONFIDENCE
+) -> Tuple[float, float]:
+    """
+    Wilson score interval for a binomial proportion. Unlike the normal
+    approximation it stays inside [0, 1] and gives a useful upper bound
+    when no successes were observed.
+    """
+    if trials <= 0:
+        return 0.0, 1.0
+    z = _Z_SCORES.get(confidence)
+    if z is None:
+        raise ValueError(
+            f"Unsupported confidence {confidence}. Choose one of: {', '.join(map(str, _Z_SCORES))}"
+        )
+    p = successes / trials
+    denominator = 1 + z * z / trials
+    centre = (p + z * z / (2 * trials)) / denominator
+    margin = (
+        z * math.sqrt(p * (1 - p) / trials + z * z / (4 * trials * trials))
+    ) / denominator
+    return max(0.0, centre - margin), min(1.0, centre + margin)
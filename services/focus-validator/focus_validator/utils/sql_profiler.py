@@ -0,0 +1,211 @@
+import json
+import logging
+import os
+import re
+import tempfile
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional
+
+from tabulate import tabulate
+
+TOP_OPERATORS_LIMIT = 20
+SUMMARY_JSON = "summary.json"
+SUMMARY_TEXT = "summary.txt"
+
+_UNSAFE_FILENAME_CHARS = re.compile(r"[^A-Za-z0-9._-]+")
+
+
+def _walk_operators(node: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+    for child in node.get("children", []) or []:
+        yield child
+        yield from _walk_operators(child)
+
+
+def profile_rows_scanned(profile: Dict[str, Any]) -> int:
+    """
+    Rows the table scans of a JSON query profile read. DuckDB leaves
+    ``operator_rows_scanned`` at 0 for Arrow scans (how polars data is
+    registered), so those count the rows they produced instead, which with
+    filters pushed into the scan is a lower bound. Catalog scans
+    (``duckdb_columns()`` behind ``information_schema``) are not data reads
+    and are left out.
+    """
+    rows = 0
+    for operator in _walk_operators(profile):
+        if operator.get("operator_type") == "TABLE_SCAN" and not str(
+            operator.get("operator_name") or ""
+        ).startswith("DUCKDB_"):
+            rows += int(
+                operator.get("operator_rows_scanned")
+                or operator.get("operator_cardinality")
+                or 0
+            )
+    return rows
+
+
+def operator_label(operator: Dict[str, Any]) -> str:
+    """Operator name, tagged when its expressions evaluate a regex."""
+    name = (
+        operator.get("operator_name")
+        or operator.get("operator_type")
+        or operator.get("name")  # EXPLAIN (FORMAT JSON) plans
+        or "?"
+    )
+    extra = json.dumps(operator.get("extra_info") or {})
+    if "regexp_" in extra:
+        return f"{name} [regex]"
+    return name
+
+
+class SQLProfiler:
+    """
+    Captures DuckDB's JSON query profile for every leaf check query.
+
+    Each profiled query gets its own file in ``<bundle>/rules/`` holding the
+    operator tree with per-operator timings and cardinalities; ``finish``
+    writes ``summary.json`` and ``summary.txt`` ranking rules by latency and
+    operators by time across the whole run. Every run creates a new bundle
+    directory under ``output_dir``.
+    """
+
+    def __init__(self, output_dir: str, top_operators: int = TOP_OPERATORS_LIMIT):
+        self.log = logging.getLogger(f"{__name__}.{self.__class__.__qualname__}")
+        os.makedirs(output_dir, exist_ok=True)
+        self.bundle_dir = tempfile.mkdtemp(
+            prefix=time.strftime("profile-%Y%m%d-%H%M%S-"), dir=output_dir
+        )
+        self.rules_dir = os.path.join(self.bundle_dir, "rules")
+        os.makedirs(self.rules_dir)
+        self.top_operators = top_operators
+        self.queries: List[Dict[str, Any]] = []
+        self.operators: List[Dict[str, Any]] = []
+        # Rows read by the last profiled query (0 when it left no profile)
+        self.last_rows_scanned = 0
+        self._seq = 0
+
+    @contextmanager
+    def capture(self, conn: Any, rule_id: Optional[str]) -> Iterator[None]:
+        """Profile the queries ``conn`` executes inside the block."""
+        self._seq += 1
+        seq = self._seq
+        safe_id = _UNSAFE_FILENAME_CHARS.sub("_", rule_id or "rule")
+        path = os.path.join(self.rules_dir, f"{seq:04d}-{safe_id}.json")
+        # The output format must be set before a .json output path is accepted
+        conn.execute("PRAGMA enable_profiling='json'")
+        quoted = path.replace("'", "''")
+        conn.execute(f"SET profiling_output='{quoted}'")
+        try:
+            yield
+        finally:
+            conn.execute("PRAGMA disable_profiling")
+            self._record(seq, rule_id, path)
+
+    def _record(self, seq: int, rule_id: Optional[str], path: str) -> None:
+        self.last_rows_scanned = 0
+        try:
+            with open(path) as f:
+                profile = json.load(f)
+        except (OSError, ValueError):
+            # Queries that fail to bind never produce a profile
+            self.log.debug("No query profile written for %s", rule_id)
+            return
+
+        self.last_rows_scanned = profile_rows_scanned(profile)
+        self.queries.append(
+            {
+                "seq": seq,
+                "rule_id": rule_id,
+                "latency_ms": (profile.get("latency") or 0.0) * 1000.0,
+                "cpu_ms": (profile.get("cpu_time") or 0.0) * 1000.0,
+                "rows_scanned": self.last_rows_scanned,
+                "peak_buffer_memory": profile.get("system_peak_buffer_memory") or 0,
+                "profile": os.path.relpath(path, self.bundle_dir),
+            }
+        )
+        for operator in _walk_operators(profile):
+            self.operators.append(
+                {
+                    "rule_id": rule_id,
+                    "operator": operator_label(operator),
+                    "timing_ms": (operator.get("operator_timing") or 0.0) * 1000.0,
+                    "cardinality": operator.get("operator_cardinality") or 0,
+                    "rows_scanned": operator.get("operator_rows_scanned") or 0,
+                    "extra_info": operator.get("extra_info") or {},
+                }
+            )
+
+    def summary(self) -> Dict[str, Any]:
+        by_type: Dict[str, Dict[str, Any]] = {}
+        for op in self.operators:
+            entry = by_type.setdefault(
+                op["operator"],
+                {
+                    "operator": op["operator"],
+                    "count": 0,
+                    "total_ms": 0.0,
+                    "max_ms": 0.0,
+                },
+            )
+            entry["count"] += 1
+            entry["total_ms"] += op["timing_ms"]
+            entry["max_ms"] = max(entry["max_ms"], op["timing_ms"])
+
+        return {
+            "queries": len(self.queries),
+            "total_latency_ms": sum(q["latency_ms"] for q in self.queries),
+            "rules": sorted(self.queries, key=lambda q: q["latency_ms"], reverse=True),
+            "operators_by_type": sorted(
+                by_type.values(), key=lambda e: e["total_ms"], reverse=True
+            ),
+            "top_operators": sorted(
+                self.operators, key=lambda o: o["timing_ms"], reverse=True
+            )[: self.top_operators],
+        }
+
+    def finish(self) -> str:
+        """Write the run summary into the bundle and return the bundle path."""
+        summary = self.summary()
+        with open(os.path.join(self.bundle_dir, SUMMARY_JSON), "w") as f:
+            json.dump(summary, f, indent=2, default=str)
+        with open(os.path.join(self.bundle_dir, SUMMARY_TEXT), "w") as f:
+            f.write(self.format_summary(summary))
+        self.log.info(
+            "Wrote %d query profiles to %s", len(self.queries), self.bundle_dir
+        )
+        return self.bundle_dir
+
+    def format_summary(self, summary: Optional[Dict[str, Any]] = None) -> str:
+        summary = summary or self.summary()
+        limit = self.top_operators
+        by_type = tabulate(
+            [
+                (e["operator"], e["count"], e["total_ms"], e["max_ms"])
+                for e in summary["operators_by_type"][:limit]
+            ],
+            headers=["Operator", "Count", "Total ms", "Max ms"],
+            floatfmt=".2f",
+        )
+        top = tabulate(
+            [
+                (o["operator"], o["rule_id"], o["timing_ms"], o["cardinality"])
+                for o in summary["top_operators"]
+            ],
+            headers=["Operator", "Rule", "ms", "Rows out"],
+            floatfmt=".2f",
+        )
+        rules = tabulate(
+            [
+                (q["rule_id"], q["latency_ms"], q["rows_scanned"], q["profile"])
+                for q in summary["rules"][:limit]
+            ],
+            headers=["Rule", "Latency ms", "Rows scanned", "Profile"],
+            floatfmt=".2f",
+        )
+        return (
+            f"Profiled queries: {summary['queries']} "
+            f"({summary['total_latency_ms']:.2f} ms)\n\n"
+            f"Operators by total time\n{by_type}\n\n"
+            f"Most expensive operators\n{top}\n\n"
+            f"Slowest rule queries\n{rules}\n"
+        )
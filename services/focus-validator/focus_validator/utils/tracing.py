@@ -0,0 +1,201 @@
+import functools
+import json
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+log = logging.getLogger(__name__)
+
+
+@dataclass
+class Span:
+    """A timed operation with attributes and an optional parent span."""
+
+    name: str
+    span_id: int
+    parent_id: Optional[int]
+    thread_id: int
+    start_ns: int
+    end_ns: Optional[int] = None
+    attributes: Dict[str, Any] = field(default_factory=dict)
+    status: str = "ok"
+
+    @property
+    def duration_ms(self) -> float:
+        end = self.end_ns if self.end_ns is not None else time.perf_counter_ns()
+        return (end - self.start_ns) / 1e6
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        self.attributes[key] = value
+
+
+class Tracer:
+    """
+    Records nested spans in memory and exports them as a Chrome trace.
+
+    Spans nest per thread: a span opened while another is active on the same
+    thread becomes its child. The exported file loads in ``chrome://tracing``
+    or Perfetto.
+    """
+
+    def __init__(self) -> None:
+        self.spans: List[Span] = []
+        self._origin_ns = time.perf_counter_ns()
+        self._next_id = 0
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    def _stack(self) -> List[Span]:
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    @contextmanager
+    def span(self, name: str, **attributes: Any) -> Iterator[Span]:
+        stack = self._stack()
+        with self._lock:
+            self._next_id += 1
+            span = Span(
+                name=name,
+                span_id=self._next_id,
+                parent_id=stack[-1].span_id if stack else None,
+                thread_id=threading.get_ident(),
+                start_ns=time.perf_counter_ns(),
+                attributes=attributes,
+            )
+            self.spans.append(span)
+        stack.append(span)
+        try:
+            yield span
+        except BaseException as e:
+            span.status = "error"
+            span.attributes["error"] = str(e)[:200]
+            raise
+        finally:
+            span.end_ns = time.perf_counter_ns()
+            stack.pop()
+
+    def critical_path(self) -> List[Span]:
+        """Longest root span, then its longest child at every level."""
+        children: Dict[Optional[int], List[Span]] = {}
+        for span in self.spans:
+            children.setdefault(span.parent_id, []).append(span)
+        path: List[Span] = []
+        candidates = children.get(None, [])
+        while candidates:
+            longest = max(candidates, key=lambda s: s.duration_ms)
+            path.append(longest)
+            candidates = children.get(longest.span_id, [])
+        return path
+
+    def to_chrome_trace(self) -> Dict[str, Any]:
+        pid = os.getpid()
+        events: List[Dict[str, Any]] = [
+            {
+                "name": "process_name",
+                "ph": "M",
+                "pid": pid,
+                "args": {"name": "focus-validator"},
+            }
+        ]
+        for span in self.spans:
+            end_ns = span.end_ns if span.end_ns is not None else span.start_ns
+            events.append(
+                {
+                    "name": span.name,
+                    "cat": span.name.split(".", 1)[0],
+                    "ph": "X",
+                    "ts": (span.start_ns - self._origin_ns) / 1000.0,
+                    "dur": (end_ns - span.start_ns) / 1000.0,
+                    "pid": pid,
+                    "tid": span.thread_id,
+                    "args": {
+                        **span.attributes,
+                        "span_id": span.span_id,
+                        "parent_id": span.parent_id,
+                        "status": span.status,
+                    },
+                }
+            )
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def export(self, path: str) -> None:
+        with open(path, "w") as f:
+            json.dump(self.to_chrome_trace(), f, default=str)
+
+
+_active_tracer: Optional[Tracer] = None
+
+
+def get_tracer() -> Optional[Tracer]:
+    """The tracer spans are recorded into, or None when tracing is off."""
+    return _active_tracer
+
+
+@contextmanager
+def span(name: str, **attributes: Any) -> Iterator[Optional[Span]]:
+    """Open a span on the active tracer; a no-op yielding None when off."""
+    tracer = _active_tracer
+    if tracer is None:
+        yield None
+        return
+    with tracer.span(name, **attributes) as s:
+        yield s
+
+
+def traced(
+    name: str,
+    attributes: Optional[Callable[..., Dict[str, Any]]] = None,
+    result_attributes: Optional[Callable[[Any], Dict[str, Any]]] = None,
+) -> Callable:
+    """
+    Decorator recording each call as a span named ``name``.
+
+    ``attributes`` receives the call's arguments and ``result_attributes``
+    its return value; both return extra span attributes.
+    """
+
+    def decorator(func: Callable) -> Callable:
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            tracer = _active_tracer
+            if tracer is None:
+                return func(*args, **kwargs)
+            attrs = attributes(*args, **kwargs) if attributes else {}
+            with tracer.span(name, **attrs) as s:
+                result = func(*args, **kwargs)
+                if result_attributes:
+                    s.attributes.update(result_attributes(result))
+                return result
+
+        return wrapper
+
+    return decorator
+
+
+@contextmanager
+def trace_session(output_path: Optional[str] = None) -> Iterator[Tracer]:
+    """
+    Record spans for the duration of the block and write them to
+    ``output_path`` as a Chrome trace, also when the block raises. Without a
+    path the spans are only kept on the yielded tracer.
+    """
+    global _active_tracer
+    previous = _active_tracer
+    tracer = _active_tracer = Tracer()
+    try:
+        yield tracer
+    finally:
+        _active_tracer = previous
+        if output_path is not None:
+            tracer.export(output_path)
+            critical = " > ".join(
+                f"{s.name} ({s.duration_ms:.1f}ms)" for s in tracer.critical_path()
+            )
+            log.info("Wrote %d trace spans to %s", len(tracer.spans), output_path)
+            log.info("Critical path: %s", critical or "n/a")
@@ -1,14 +1,41 @@
 import importlib.resources
 import logging
 import os
-from typing import Any, Dict, List, Optional, Tuple
+import time
+from contextlib import ExitStack, contextmanager
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
 import sqlglot
 
+from focus_validator.config_objects.focus_to_duckdb_converter import (
+    parse_count_mode,
+)
+from focus_validator.config_objects.incremental import (
+    DEFAULT_PARTITION_BY,
+    PartitionStateStore,
+)
+from focus_validator.config_objects.result_cache import ResultCache
+from focus_validator.config_objects.scheduler import (
+    SCHEDULES,
+    CostScheduler,
+    ScheduleHistory,
+)
 from focus_validator.data_loaders import data_loader
+from focus_validator.data_loaders.load_cache import DEFAULT_MAX_SIZE_MB, LoadCache
 from focus_validator.outputter.outputter import Outputter
+from focus_validator.rules.checkpoint import ValidationCheckpoint, checkpoint_key
 from focus_validator.rules.spec_rules import SpecRules, ValidationResults
-from focus_validator.utils.performance_logging import logPerformance
+from focus_validator.utils.metrics import MetricsCollector
+from focus_validator.utils.performance_logging import (
+    PerformanceReport,
+    logPerformance,
+    performance_session,
+    trackPhase,
+)
+from focus_validator.utils.query_cost import CostReport, data_file_shape
+from focus_validator.utils.sampling import sample_clause
+from focus_validator.utils.sql_profiler import SQLProfiler
+from focus_validator.utils.tracing import trace_session
 
 DEFAULT_VERSION_SETS_PATH = str(
     importlib.resources.files("focus_validator").joinpath("rules")
@@ -37,6 +64,33 @@ class Validator:
         explain_mode: bool = False,
         transpile_dialect: Optional[str] = None,
         show_violations: bool = False,
+        load_cache_dir: Optional[str] = None,
+        load_cache_max_size_mb: Optional[float] = DEFAULT_MAX_SIZE_MB,
+        load_cache_format: str = "parquet",
+        loader_engine: str = "polars",
+        collect_metrics: bool = False,
+        metrics_output: Optional[str] = None,
+        profile_sql_dir: Optional[str] = None,
+        trace_output: Optional[str] = None,
+        performance_output: Optional[str] = None,
+        explain_cost: bool = False,
+        explain_rows: Optional[int] = None,
+        schedule: str = "default",
+        schedule_history: Optional[str] = None,
+        stop_on_first_error: bool = False,
+        count_mode: str = "exact",
+        sample: Optional[str] = None,
+        deadline_seconds: Optional[float] = None,
+        rule_timeout_seconds: Optional[float] = None,
+        checkpoint_path: Optional[str] = None,
+        resume: bool = False,
+        incremental_state: Optional[str] = None,
+        partition_by: str = DEFAULT_PARTITION_BY,
+        result_cache_dir: Optional[str] = None,
+        group_by: Optional[str] = None,
+        violation_matrix: Optional[str] = None,
+        export_violations: Optional[str] = None,
+        export_violations_limit: Optional[int] = None,
     ) -> None:
         self.log = logging.getLogger(f"{__name__}.{self.__class__.__qualname__}")
         self.data_filename = data_filename
@@ -46,7 +100,83 @@ class Validator:
         self.focus_dataset = focus_dataset
         self.explain_mode = explain_mode
         self.transpile_dialect = transpile_dialect
+        self.explain_cost = explain_cost or explain_rows is not None
+        self.explain_rows = explain_rows
+        self.cost_report: Optional[CostReport] = None
         self.show_violations = show_violations
+        if schedule not in SCHEDULES:
+            raise ValueError(
+                f"Unsupported schedule '{schedule}'. Choose one of: {', '.join(SCHEDULES)}"
+            )
+        self.schedule = schedule
+        self.schedule_history = schedule_history
+        self.stop_on_first_error = stop_on_first_error
+        self.count_mode = count_mode
+        # Leaf violation counts stop here; None counts exactly
+        self.violation_limit = parse_count_mode(count_mode)
+        if sample is not None:
+            sample_clause(sample)  # raises ValueError on a bad size
+        self.sample = sample
+        for name, value in (
+            ("deadline_seconds", deadline_seconds),
+            ("rule_timeout_seconds", rule_timeout_seconds),
+        ):
+            if value is not None and value <= 0:
+                raise ValueError(f"{name} must be positive, got {value}")
+        # Budget for a whole validate() call, loading included
+        self.deadline_seconds = deadline_seconds
+        self.rule_timeout_seconds = rule_timeout_seconds
+        if resume and not checkpoint_path:
+            raise ValueError("resume requires a checkpoint_path")
+        if checkpoint_path and data_filename == "-":
+            raise ValueError("Checkpoints need a data file; stdin cannot be resumed")
+        self.checkpoint_path = checkpoint_path
+        self.resume = resume
+        if incremental_state and (
+            sample is not None or self.violation_limit is not None
+        ):
+            raise ValueError(
+                "Incremental validation needs exact counts; it cannot be combined with sample or count_mode"
+            )
+        self.incremental_state = incremental_state
+        self.partition_by = partition_by
+        if group_by and (
+            sample is not None or self.violation_limit is not None or incremental_state
+        ):
+            raise ValueError(
+                "Grouped validation needs exact full-table counts; it cannot be combined with sample, count_mode or incremental_state"
+            )
+        self.group_by = group_by
+        self.violation_matrix = violation_matrix
+        if export_violations_limit is not None and export_violations_limit <= 0:
+            raise ValueError(
+                f"export_violations_limit must be positive, got {export_violations_limit}"
+            )
+        self.export_violations = export_violations
+        self.export_violations_limit = export_violations_limit
+        self.loader_engine = loader_engine
+        # Writing metrics implies collecting them
+        self.collect_metrics = collect_metrics or bool(metrics_output)
+        self.metrics_output = metrics_output
+        self.profile_sql_dir = profile_sql_dir
+        self.profile_bundle: Optional[str] = None
+        self.trace_output = trace_output
+        self.performance_output = performance_output
+        self.performance_report: Optional[PerformanceReport] = None
+        # Wall time of the plan / load / execute / output phases of the last run
+        self.phase_seconds: Dict[str, float] = {}
+        # (check type, seconds) of every rule's run_check in the last run
+        self.check_seconds: List[Tuple[str, float]] = []
+        self.result_cache = ResultCache(result_cache_dir) if result_cache_dir else None
+        self.load_cache = (
+            LoadCache(
+                load_cache_dir,
+                max_size_mb=load_cache_max_size_mb,
+                cache_format=load_cache_format,
+            )
+            if load_cache_dir
+            else None
+        )
 
         # Log validator initialization
         self.log.info("Initializing FOCUS Validator")
@@ -57,6 +187,8 @@ class Validator:
         self.log.debug(
             "Output type: %s, destination: %s", output_type, output_destination
         )
+        if self.load_cache:
+            self.log.info("Load cache enabled: %s", self.load_cache.cache_dir)
         if explain_mode:
             self.log.info(
                 "Explain mode enabled - will generate SQL explanations without validation"
@@ -139,13 +271,24 @@ class Validator:
     def get_spec_rules_path(self) -> str:
         return self.spec_rules.get_spec_rules_path()
 
+    @contextmanager
+    def _timed_phase(self, phase: str) -> Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phase_seconds[phase] = (
+                self.phase_seconds.get(phase, 0.0) + time.perf_counter() - start
+            )
+
     @logPerformance("validator.load", includeArgs=True)
     def load(self) -> None:
         self.log.info("Loading validation data and rules...")
 
         # Load rules first to extract column type information
         self.log.debug("Loading specification rules...")
-        self.spec_rules.load()
+        with self._timed_phase("plan"):
+            self.spec_rules.load()
 
         # Skip data loading in explain mode
         if self.explain_mode:
@@ -177,57 +320,168 @@ class Validator:
             data_filename=self.data_filename,
             data_format=self.data_format,
             column_types=column_types,
+            load_cache=self.load_cache,
+            loader_engine=self.loader_engine,
         )
-        self.focus_data = dataLoader.load()
+        with self._timed_phase("load"):
+            self.focus_data = dataLoader.load()
 
         if self.focus_data is not None:
             try:
                 row_count = len(self.focus_data)
                 self.data_row_count = row_count  # Store for use in validation results
-                col_count = (
-                    len(self.focus_data.columns)
-                    if hasattr(self.focus_data, "columns")
-                    else "unknown"
-                )
+                columns = data_loader.column_names(self.focus_data)
                 self.log.info(
                     "Data loaded successfully: %s rows, %s columns",
                     row_count,
-                    col_count,
-                )
-                self.log.debug(
-                    "Column names: %s",
-                    (
-                        list(self.focus_data.columns)
-                        if hasattr(self.focus_data, "columns")
-                        else "N/A"
-                    ),
+                    len(columns),
                 )
+                self.log.debug("Column names: %s", columns)
             except Exception as e:
                 self.log.warning("Could not determine data dimensions: %s", e)
 
         self.log.info("Data and rules loading completed")
 
-    @logPerformance("validator.validate", includeArgs=True)
     def validate(self) -> ValidationResults:
+        if not self.trace_output and not self.performance_output:
+            return self._validate()
+        with ExitStack() as stack:
+            if self.trace_output:
+                stack.enter_context(trace_session(self.trace_output))
+            if self.performance_output:
+                self.performance_report = stack.enter_context(
+                    performance_session(self.performance_output)
+                )
+            results = self._validate()
+        if self.performance_report is not None:
+            self.log.info(
+                "Phase timings and memory:\n%s", self.performance_report.format_table()
+            )
+        return results
+
+    @logPerformance("validator.validate", includeArgs=True)
+    def _validate(self) -> ValidationResults:
         self.log.info("Starting validation process...")
+        self.phase_seconds = {}
+        self.check_seconds = []
+        deadline = (
+            time.monotonic() + self.deadline_seconds
+            if self.deadline_seconds is not None
+            else None
+        )
         self.load()
 
         # Validate
         self.log.debug("Executing rule validation...")
-        results = self.spec_rules.validate(
-            self.focus_data,
-            show_violations=self.show_violations,
-            data_filename=self.data_filename or "unknown",
-            data_row_count=self.data_row_count,
+        metrics = (
+            MetricsCollector(table_row_count=self.data_row_count)
+            if self.collect_metrics
+            else None
+        )
+        sql_profiler = (
+            SQLProfiler(self.profile_sql_dir) if self.profile_sql_dir else None
+        )
+        scheduler = self._build_scheduler()
+        checkpoint = self._build_checkpoint()
+        incremental = (
+            PartitionStateStore(
+                self.incremental_state, self.partition_by, self.data_filename
+            )
+            if self.incremental_state
+            else None
         )
+        with self._timed_phase("execute"), trackPhase(
+            "validator.execute", rows=self.data_row_count
+        ):
+            results = self.spec_rules.validate(
+                self.focus_data,
+                show_violations=self.show_violations,
+                data_filename=self.data_filename or "unknown",
+                data_row_count=self.data_row_count,
+                metrics=metrics,
+                sql_profiler=sql_profiler,
+                stop_on_first_error=self.stop_on_first_error,
+                scheduler=scheduler,
+                violation_limit=self.violation_limit,
+                sample=self.sample,
+                deadline=deadline,
+                rule_timeout_seconds=self.rule_timeout_seconds,
+                checkpoint=checkpoint,
+                resume=self.resume,
+                incremental=incremental,
+                result_cache=self.result_cache,
+                group_by=self.group_by,
+                violation_matrix=self.violation_matrix,
+                export_violations=self.export_violations,
+                export_violations_limit=self.export_violations_limit,
+                check_seconds=self.check_seconds,
+            )
+        if incremental is not None:
+            incremental.save()
+        if self.result_cache is not None:
+            self.result_cache.save()
+        if scheduler is not None and scheduler.history is not None:
+            scheduler.history.save()
 
         # Output results
         self.log.debug("Writing validation results...")
-        self.outputter = self.outputter.write(results)
+        with self._timed_phase("output"), trackPhase("validator.output"):
+            self.outputter = self.outputter.write(results)
+
+        if metrics is not None and self.metrics_output:
+            metrics.export(self.metrics_output)
+            self.log.info("Wrote per-rule metrics to %s", self.metrics_output)
+
+        if sql_profiler is not None:
+            self.profile_bundle = sql_profiler.finish()
 
         self.log.info("Validation process completed")
         return results
 
+    def _build_scheduler(self) -> Optional[CostScheduler]:
+        if self.schedule != "cost":
+            return None
+        history = (
+            ScheduleHistory(self.schedule_history) if self.schedule_history else None
+        )
+        if self.spec_rules.cost_estimates is None and not (history and history.rules):
+            # Nothing measured yet: rank by EXPLAIN estimates for this data
+            columns = (
+                data_loader.column_names(self.focus_data)
+                if self.focus_data is not None
+                else None
+            )
+            try:
+                with self._timed_phase("plan"):
+                    self.spec_rules.estimate_costs(self.data_row_count, columns)
+            except Exception as e:
+                self.log.warning(
+                    "Query cost estimation failed, scheduling by check type: %s", e
+                )
+        return CostScheduler(
+            history=history, cost_estimates=self.spec_rules.cost_estimates
+        )
+
+    def _build_checkpoint(self) -> Optional[ValidationCheckpoint]:
+        data_filename = self.data_filename
+        if not self.checkpoint_path or data_filename is None:
+            return None
+        # Everything besides the data and the plan that changes the results
+        options = {
+            "rules_version": self.rules_version,
+            "focus_dataset": self.focus_dataset,
+            "applicability_criteria": self.applicability_criteria_list,
+            "transpile_dialect": self.transpile_dialect,
+            "show_violations": self.show_violations,
+            "count_mode": self.count_mode,
+            "sample": self.sample,
+            "group_by": self.group_by,
+            "loader_engine": self.loader_engine,
+        }
+        with self._timed_phase("plan"):
+            key = checkpoint_key(data_filename, self.spec_rules.plan, options)
+        return ValidationCheckpoint(self.checkpoint_path, key)
+
     @logPerformance("validator.explain", includeArgs=True)
     def explain(self) -> Dict[str, Dict[str, str]]:
         """Generate SQL explanations for validation rules without executing validation.
@@ -243,8 +497,25 @@ class Validator:
         sql_map = self.spec_rules.explain()
 
         self.log.info("SQL explanation generation completed for %d rules", len(sql_map))
+        if self.explain_cost:
+            self.cost_report = self._estimate_costs(sql_map)
         return sql_map
 
+    def _estimate_costs(self, sql_map: Dict[str, Dict[str, Any]]) -> CostReport:
+        """EXPLAIN every rule against the dataset's shape, without loading it."""
+        columns = None
+        row_count = self.explain_rows
+        if row_count is None:
+            if not self.data_filename or self.data_filename == "-":
+                raise ValueError(
+                    "Cost estimation needs a data file or an explicit row count"
+                )
+            columns, row_count = data_file_shape(self.data_filename)
+        self.log.info("Estimating query costs for %d rows", row_count)
+        return self.spec_rules.estimate_costs(
+            row_count, columns=columns, sql_map=sql_map
+        )
+
     def print_sql_explanations(
         self, sql_map: Dict[str, Dict[str, Any]], verbose: bool = False
     ) -> None:
@@ -284,6 +555,14 @@ class Validator:
             if condition:
                 print(f"   Condition: {condition}")
 
+            if self.cost_report is not None:
+                cost = self.cost_report.rules.get(rule_id)
+                if cost is not None and cost.queries:
+                    print(
+                        f"   Estimated cost: {cost.estimated_rows:,} rows over "
+                        f"{cost.queries} quer{'y' if cost.queries == 1 else 'ies'}"
+                    )
+
             # Show SQL for leaf rules
             sql = explanation.get("sql")
             if sql and sql != "None":
@@ -0,0 +1,185 @@
+"""Tests for cost-based scheduling of plan layers."""
+
+import os
+import shutil
+import tempfile
+import unittest
+from types import SimpleNamespace
+
+from focus_validator.benchmarks.synthetic import generate_frame
+from focus_validator.config_objects.scheduler import (
+    QUERY_OVERHEAD_ROWS,
+    CostScheduler,
+    ScheduleHistory,
+    static_cost,
+)
+from focus_validator.validator import Validator
+
+
+def make_rule(check_function, condition=None, items=None):
+    requirement = {"CheckFunction": check_function}
+    if items is not None:
+        requirement["Items"] = items
+    return SimpleNamespace(
+        validation_criteria=SimpleNamespace(
+            requirement=requirement, condition=condition or {}
+        )
+    )
+
+
+def make_plan(rules, layers):
+    nodes = [SimpleNamespace(rule_id=rule_id, rule=rule) for rule_id, rule in rules]
+    return SimpleNamespace(nodes=nodes, layers=layers)
+
+
+class TestStaticCost(unittest.TestCase):
+    def test_check_weights_and_condition(self):
+        self.assertEqual(static_cost(make_rule("ColumnPresent"), 1000), 0.0)
+        type_cost = static_cost(make_rule("TypeString"), 1000)
+        format_cost = static_cost(make_rule("FormatString"), 1000)
+        conditional = static_cost(
+            make_rule("FormatString", condition={"CheckFunction": "CheckValue"}), 1000
+        )
+        self.assertGreater(format_cost, type_cost)
+        self.assertEqual(
+            conditional - QUERY_OVERHEAD_ROWS, (format_cost - QUERY_OVERHEAD_ROWS) / 2
+        )
+
+    def test_composite_sums_inline_items_only(self):
+        rule = make_rule(
+            "AND",
+            items=[
+                {"CheckFunction": "CheckValue"},
+                {"CheckFunction": "CheckModelRule", "ModelRuleId": "X"},
+            ],
+        )
+        self.assertEqual(
+            static_cost(rule, 100), static_cost(make_rule("CheckValue"), 100)
+        )
+        references_only = make_rule(
+            "AND", items=[{"CheckFunction": "CheckModelRule", "ModelRuleId": "X"}]
+        )
+        self.assertEqual(static_cost(references_only, 100), 0.0)
+
+
+class TestScheduleHistory(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.temp_dir, "history.json")
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_round_trip_and_moving_average(self):
+        history = ScheduleHistory(self.path)
+        history.record("R-1", 1.0, 100, ok=True)
+        history.record("R-1", 2.0, 100, ok=False)
+        history.save()
+
+        entry = ScheduleHistory(self.path).rules["R-1"]
+        self.assertEqual((entry.runs, entry.failures), (2, 1))
+        self.assertAlmostEqual(entry.seconds_per_row, 0.01 + 0.3 * 0.01)
+
+    def test_unreadable_file_is_ignored(self):
+        with open(self.path, "w") as f:
+            f.write("{not json")
+        self.assertEqual(ScheduleHistory(self.path).rules, {})
+
+
+class TestCostScheduler(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.history = ScheduleHistory(os.path.join(self.temp_dir, "history.json"))
+        self.plan = make_plan(
+            [
+                ("cheap", make_rule("TypeString")),
+                ("regex", make_rule("FormatString")),
+                ("slow", make_rule("CheckValue")),
+                ("composite", make_rule("AND", items=[])),
+            ],
+            [[0, 1, 2], [3]],
+        )
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_longest_first_without_history(self):
+        layers = CostScheduler().order_layers(self.plan, 1000)
+        self.assertEqual(layers, [[1, 2, 0], [3]])
+
+    def test_history_overrides_static_estimate(self):
+        self.history.record("slow", 5.0, 1000, ok=True)
+        self.history.record("regex", 0.5, 1000, ok=True)
+        scheduler = CostScheduler(history=self.history)
+        costs = scheduler.estimate(self.plan, 1000)
+        self.assertAlmostEqual(costs[2], 5.0)
+        # The unmeasured rule is scaled by the measured-to-static ratio
+        self.assertLess(costs[0], costs[2])
+        self.assertGreater(costs[0], costs[1])
+        self.assertEqual(scheduler.order_layers(self.plan, 1000)[0], [2, 0, 1])
+
+    def test_likely_failures_first_when_stopping_early(self):
+        for _ in range(5):
+            self.history.record("cheap", 2.0, 1000, ok=True)
+            self.history.record("regex", 0.1, 1000, ok=False)
+            self.history.record("slow", 1.0, 1000, ok=False)
+        scheduler = CostScheduler(history=self.history)
+        layers = scheduler.order_layers(self.plan, 1000, stop_on_first_error=True)
+        self.assertEqual(layers[0], [1, 2, 0])
+
+    def test_cost_estimates_used_when_present(self):
+        estimates = SimpleNamespace(
+            estimated_cost=lambda rule_id: {"cheap": 10**9}.get(rule_id)
+        )
+        layers = CostScheduler(cost_estimates=estimates).order_layers(self.plan, 1000)
+        self.assertEqual(layers[0][0], 0)
+
+    def test_unknown_rules_get_even_failure_odds(self):
+        scheduler = CostScheduler(history=self.history)
+        self.assertEqual(scheduler.failure_probability("cheap"), 0.5)
+        self.history.record("cheap", 1.0, 10, ok=True)
+        self.assertAlmostEqual(scheduler.failure_probability("cheap"), 1 / 3)
+
+
+class TestScheduledValidation(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.data_path = os.path.join(self.temp_dir, "faulty.parquet")
+        df, _ = generate_frame(300, {"BillingCurrency-C-003-M": 0.2})
+        df.write_parquet(self.data_path)
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def _message(self, schedule, history_path=None):
+        validator = Validator(
+            data_filename=self.data_path,
+            output_type="unittest",
+            output_destination=os.path.join(self.temp_dir, "results.xml"),
+            rules_version="1.2",
+            focus_dataset="CostAndUsage",
+            rules_block_remote_download=True,
+            schedule=schedule,
+            schedule_history=history_path,
+        )
+        results = validator.validate()
+        return results.by_rule_id["BillingCurrency-C-000-M"]["details"]["message"]
+
+    def test_dependency_failure_message_does_not_depend_on_schedule(self):
+        history_path = os.path.join(self.temp_dir, "history.json")
+        history = ScheduleHistory(history_path)
+        # Longest first: run C-006 before C-003
+        history.record("BillingCurrency-C-006-M", 10.0, 300, ok=False)
+        history.record("BillingCurrency-C-003-M", 0.001, 300, ok=False)
+        history.save()
+
+        expected = self._message("default")
+        self.assertIn(
+            "conformance rules: ['BillingCurrency-C-003-M', 'BillingCurrency-C-006-M']",
+            expected,
+        )
+        self.assertEqual(self._message("cost", history_path), expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
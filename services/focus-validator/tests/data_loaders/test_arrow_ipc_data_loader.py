@@ -0,0 +1,134 @@
+"""Tests for the memory-mapped Arrow IPC / Feather data loader."""
+
+import io
+import os
+import shutil
+import tempfile
+import unittest
+from datetime import datetime, timezone
+from unittest.mock import patch
+
+import polars as pl
+import pyarrow as pa
+import pyarrow.feather as feather
+
+from focus_validator.data_loaders.arrow_ipc_data_loader import ArrowIPCDataLoader
+from focus_validator.data_loaders.data_loader import DataLoader
+
+COLUMN_TYPES = {
+    "BilledCost": "float64",
+    "ChargePeriodStart": "datetime64[ns, UTC]",
+    "ProviderName": "string",
+}
+
+
+def _sample_table() -> pa.Table:
+    return pa.table(
+        {
+            "BilledCost": pa.array([1.5, 2.5, 3.5], type=pa.float64()),
+            "ChargePeriodStart": pa.array(
+                [datetime(2024, 1, d, tzinfo=timezone.utc) for d in (1, 2, 3)],
+                type=pa.timestamp("us", tz="UTC"),
+            ),
+            "ProviderName": ["AWS", "AWS", "Azure"],
+        }
+    )
+
+
+def _ipc_stream_bytes(table: pa.Table) -> bytes:
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    return sink.getvalue().to_pybytes()
+
+
+class _FakeStdin:
+    """Minimal stand-in for sys.stdin exposing a binary buffer."""
+
+    def __init__(self, payload: bytes):
+        self.buffer = io.BufferedReader(io.BytesIO(payload))
+
+
+class TestArrowIPCDataLoader(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.table = _sample_table()
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def _assert_typed_frame(self, table: pa.Table):
+        self.assertIsInstance(table, pa.Table)
+        df = pl.from_arrow(table)
+        self.assertEqual(len(df), 3)
+        self.assertEqual(df["BilledCost"].dtype, pl.Float64)
+        self.assertIsInstance(df["ChargePeriodStart"].dtype, pl.Datetime)
+        self.assertEqual(df["ChargePeriodStart"].dtype.time_zone, "UTC")
+        self.assertEqual(df["ProviderName"].to_list(), ["AWS", "AWS", "Azure"])
+
+    def test_extension_dispatch(self):
+        for name in ("export.arrow", "export.feather", "export.ipc", "EXPORT.ARROW"):
+            path = os.path.join(self.temp_dir, name)
+            feather.write_feather(self.table, path, compression="uncompressed")
+            loader = DataLoader(path)
+            self.assertIs(loader.data_loader_class, ArrowIPCDataLoader)
+
+    def test_stdin_dispatch(self):
+        loader = DataLoader("-", data_format="arrow")
+        self.assertIs(loader.data_loader_class, ArrowIPCDataLoader)
+
+    def test_ipc_file_is_memory_mapped(self):
+        path = os.path.join(self.temp_dir, "export.arrow")
+        feather.write_feather(self.table, path, compression="uncompressed")
+
+        allocated_before = pa.total_allocated_bytes()
+        table = ArrowIPCDataLoader(path)._read_table()
+        # Column buffers live in the mapping, not in the Arrow memory pool
+        self.assertLess(pa.total_allocated_bytes() - allocated_before, 1024)
+        self.assertTrue(table.equals(self.table))
+
+    def test_load_with_column_types(self):
+        path = os.path.join(self.temp_dir, "export.feather")
+        feather.write_feather(self.table, path)
+        df = DataLoader(path, column_types=COLUMN_TYPES).load()
+        self._assert_typed_frame(df)
+
+    def test_load_keeps_matching_columns_mapped(self):
+        path = os.path.join(self.temp_dir, "export.arrow")
+        feather.write_feather(self.table, path, compression="uncompressed")
+
+        allocated_before = pa.total_allocated_bytes()
+        table = ArrowIPCDataLoader(
+            path, column_types={"BilledCost": "float64", "ProviderName": "string"}
+        ).load()
+        self.assertLess(pa.total_allocated_bytes() - allocated_before, 1024)
+        self.assertTrue(table.equals(self.table))
+
+    def test_load_converts_only_differing_columns(self):
+        path = os.path.join(self.temp_dir, "export.arrow")
+        table = self.table.set_column(
+            0, "BilledCost", pa.array([1, 2, 3], type=pa.int64())
+        )
+        feather.write_feather(table, path, compression="uncompressed")
+
+        loaded = ArrowIPCDataLoader(path, column_types=COLUMN_TYPES).load()
+        self.assertEqual(loaded.column_names, self.table.column_names)
+        self.assertEqual(loaded["BilledCost"].to_pylist(), [1.0, 2.0, 3.0])
+        self.assertEqual(loaded.schema.field("BilledCost").type, pa.float64())
+        self.assertTrue(loaded["ProviderName"].equals(self.table["ProviderName"]))
+
+    def test_stream_format_file(self):
+        path = os.path.join(self.temp_dir, "export.arrow")
+        with open(path, "wb") as f:
+            f.write(_ipc_stream_bytes(self.table))
+        df = ArrowIPCDataLoader(path, column_types=COLUMN_TYPES).load()
+        self._assert_typed_frame(df)
+
+    def test_stdin_stream(self):
+        with patch("sys.stdin", _FakeStdin(_ipc_stream_bytes(self.table))):
+            df = DataLoader("-", data_format="arrow", column_types=COLUMN_TYPES).load()
+        self._assert_typed_frame(df)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,152 @@
+"""Tests for compressed CSV input (gzip / zstd / bz2) on files and stdin."""
+
+import bz2
+import gzip
+import io
+import os
+import shutil
+import tempfile
+import unittest
+from unittest.mock import patch
+
+import polars as pl
+import pyarrow as pa
+
+from focus_validator.data_loaders.csv_data_loader import CSVDataLoader
+from focus_validator.data_loaders.data_loader import DataLoader
+from focus_validator.data_loaders.input_streams import (
+    detect_compression,
+    sniff_compression,
+    split_compression_suffix,
+)
+from focus_validator.exceptions import FocusNotImplementedError
+
+CSV_CONTENT = (
+    "BilledCost,ChargePeriodStart,ProviderName\n"
+    "1.5,2024-01-01T00:00:00Z,AWS\n"
+    "2.5,2024-01-02T00:00:00Z,AWS\n"
+    "3.5,2024-01-03T00:00:00Z,Azure\n"
+).encode("utf-8")
+
+COLUMN_TYPES = {
+    "BilledCost": "float64",
+    "ChargePeriodStart": "datetime64[ns, UTC]",
+    "ProviderName": "string",
+}
+
+
+def _zstd_compress(data: bytes) -> bytes:
+    sink = pa.BufferOutputStream()
+    with pa.CompressedOutputStream(sink, "zstd") as out:
+        out.write(data)
+    return sink.getvalue().to_pybytes()
+
+
+class _FakeStdin:
+    """Minimal stand-in for sys.stdin exposing a binary buffer."""
+
+    def __init__(self, payload: bytes):
+        self.buffer = io.BufferedReader(io.BytesIO(payload))
+
+    def read(self):
+        return self.buffer.read().decode("utf-8")
+
+
+class TestCompressionDetection(unittest.TestCase):
+    def test_split_compression_suffix(self):
+        self.assertEqual(split_compression_suffix("a.csv.gz"), ("a.csv", "gzip"))
+        self.assertEqual(split_compression_suffix("a.csv.ZST"), ("a.csv", "zstd"))
+        self.assertEqual(split_compression_suffix("a.csv.bz2"), ("a.csv", "bz2"))
+        self.assertEqual(split_compression_suffix("a.csv"), ("a.csv", None))
+
+    def test_sniff_compression(self):
+        self.assertEqual(sniff_compression(gzip.compress(b"x")[:4]), "gzip")
+        self.assertEqual(sniff_compression(bz2.compress(b"x")[:4]), "bz2")
+        self.assertEqual(sniff_compression(_zstd_compress(b"x")[:4]), "zstd")
+        self.assertIsNone(sniff_compression(b"col1,col2"))
+
+
+class TestCompressedFileLoading(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def _write(self, name: str, payload: bytes) -> str:
+        path = os.path.join(self.temp_dir, name)
+        with open(path, "wb") as f:
+            f.write(payload)
+        return path
+
+    def _assert_typed_frame(self, df: pl.DataFrame):
+        self.assertEqual(len(df), 3)
+        self.assertEqual(df["BilledCost"].dtype, pl.Float64)
+        self.assertIsInstance(df["ChargePeriodStart"].dtype, pl.Datetime)
+        self.assertEqual(df["ChargePeriodStart"].dtype.time_zone, "UTC")
+
+    def test_gzip_file(self):
+        path = self._write("export.csv.gz", gzip.compress(CSV_CONTENT))
+        loader = DataLoader(path, column_types=COLUMN_TYPES)
+        self.assertIs(loader.data_loader_class, CSVDataLoader)
+        self.assertEqual(loader.compression, "gzip")
+        self._assert_typed_frame(loader.load())
+
+    def test_zstd_file(self):
+        path = self._write("export.csv.zst", _zstd_compress(CSV_CONTENT))
+        loader = DataLoader(path, column_types=COLUMN_TYPES)
+        self.assertEqual(loader.compression, "zstd")
+        self._assert_typed_frame(loader.load())
+
+    def test_bz2_file_streams_through_decompressor(self):
+        path = self._write("export.csv.bz2", bz2.compress(CSV_CONTENT))
+        loader = DataLoader(path, column_types=COLUMN_TYPES)
+        self.assertEqual(loader.compression, "bz2")
+        self._assert_typed_frame(loader.load())
+
+    def test_bz2_retry_reopens_stream(self):
+        """The coercion fallback must re-read a fresh decompression stream."""
+        payload = b"Num,Other\n1,a\nnot-a-number,b\n3,c\n"
+        path = self._write("export.csv.bz2", bz2.compress(payload))
+        loader = CSVDataLoader(path, column_types={"Num": "int64"}, compression="bz2")
+        df = loader.load()
+        self.assertEqual(len(df), 3)
+        self.assertEqual(df["Num"].to_list(), [1, None, 3])
+
+    def test_mislabeled_gzip_detected_by_magic_bytes(self):
+        path = self._write("export.csv", gzip.compress(CSV_CONTENT))
+        self.assertEqual(detect_compression(path), "gzip")
+        loader = DataLoader(path, column_types=COLUMN_TYPES)
+        self._assert_typed_frame(loader.load())
+
+    def test_compressed_parquet_rejected(self):
+        path = self._write("export.parquet.gz", b"")
+        with self.assertRaises(FocusNotImplementedError):
+            DataLoader(path)
+
+
+class TestCompressedStdin(unittest.TestCase):
+    def test_gzip_stdin(self):
+        with patch("sys.stdin", _FakeStdin(gzip.compress(CSV_CONTENT))):
+            loader = CSVDataLoader("-", column_types=COLUMN_TYPES)
+            df = loader.load()
+        self.assertEqual(loader.compression, "gzip")
+        self.assertEqual(len(df), 3)
+
+    def test_bz2_stdin(self):
+        with patch("sys.stdin", _FakeStdin(bz2.compress(CSV_CONTENT))):
+            loader = CSVDataLoader("-")
+            df = loader.load()
+        self.assertEqual(loader.compression, "bz2")
+        self.assertEqual(list(df.columns), list(COLUMN_TYPES))
+
+    def test_plain_stdin_with_buffer(self):
+        with patch("sys.stdin", _FakeStdin(CSV_CONTENT)):
+            loader = CSVDataLoader("-", column_types=COLUMN_TYPES)
+            df = loader.load()
+        self.assertIsNone(loader.compression)
+        self.assertEqual(len(df), 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,189 @@
+"""Tests for the pluggable CSV loader engines."""
+
+import bz2
+import gzip
+import io
+import os
+import shutil
+import tempfile
+import unittest
+from unittest.mock import patch
+
+import polars as pl
+
+from focus_validator.benchmarks.csv_engines import generate_csv, run_benchmark
+from focus_validator.data_loaders.csv_data_loader import CSVDataLoader
+from focus_validator.data_loaders.csv_engines import (
+    AUTO_DUCKDB_MIN_BYTES,
+    AUTO_DUCKDB_MIN_CORES,
+    CSV_ENGINES,
+    DuckDBCSVEngine,
+    PolarsCSVEngine,
+    PyArrowCSVEngine,
+    select_csv_engine,
+)
+from focus_validator.data_loaders.data_loader import DataLoader
+
+CLEAN_CSV = (
+    "BilledCost,ChargePeriodStart,ProviderName,Qty,Flag\n"
+    "1.5,2024-01-01T00:00:00Z,AWS,3,true\n"
+    "2.5,2024-01-02T00:00:00Z,NULL,4,false\n"
+    ",2024-01-03T00:00:00Z,Azure,INVALID,true\n"
+)
+
+DIRTY_CSV = (
+    "BilledCost,ChargePeriodStart,ProviderName,Qty\n"
+    "1.5,2024-01-01T00:00:00Z,AWS,3\n"
+    "abc,not-a-date,AWS,x4\n"
+    "3.5,2024-01-03T00:00:00Z,Azure,5\n"
+)
+
+# Short rows are padded with nulls by every engine
+RAGGED_CSV = (
+    "BilledCost,ChargePeriodStart,ProviderName,Qty\n"
+    "1.5,2024-01-01T00:00:00Z,AWS,3\n"
+    "2.5,2024-01-02T00:00:00Z\n"
+    "3.5,2024-01-03T00:00:00Z,Azure,5\n"
+)
+
+COLUMN_TYPES = {
+    "BilledCost": "float64",
+    "ChargePeriodStart": "datetime64[ns, UTC]",
+    "ProviderName": "string",
+    "Qty": "int64",
+    "NotInFile": "string",
+}
+
+
+class TestEngineEquivalence(unittest.TestCase):
+    """Every engine must produce the same frame and failed_columns."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def _inputs(self, name, content):
+        path = os.path.join(self.temp_dir, f"{name}.csv")
+        with open(path, "w") as f:
+            f.write(content)
+        with open(path + ".gz", "wb") as f:
+            f.write(gzip.compress(content.encode("utf-8")))
+        with open(path + ".bz2", "wb") as f:
+            f.write(bz2.compress(content.encode("utf-8")))
+        return [(path, None), (path + ".gz", "gzip"), (path + ".bz2", "bz2")]
+
+    def _load(self, path, compression, column_types, engine):
+        loader = CSVDataLoader(
+            path, column_types=column_types, compression=compression, engine=engine
+        )
+        return loader.load(), loader.get_failed_columns()
+
+    def test_engines_agree(self):
+        for name, content in (
+            ("clean", CLEAN_CSV),
+            ("dirty", DIRTY_CSV),
+            ("ragged", RAGGED_CSV),
+        ):
+            for path, compression in self._inputs(name, content):
+                for column_types in (COLUMN_TYPES, {}):
+                    expected_df, expected_failed = self._load(
+                        path, compression, column_types, "polars"
+                    )
+                    for engine in ("duckdb", "pyarrow"):
+                        with self.subTest(
+                            input=name,
+                            compression=compression,
+                            typed=bool(column_types),
+                            engine=engine,
+                        ):
+                            df, failed = self._load(
+                                path, compression, column_types, engine
+                            )
+                            self.assertTrue(df.equals(expected_df))
+                            self.assertEqual(failed, expected_failed)
+
+    def test_dirty_input_reports_failed_datetime_column(self):
+        path, _ = self._inputs("dirty", DIRTY_CSV)[0]
+        for engine in CSV_ENGINES:
+            with self.subTest(engine=engine):
+                df, failed = self._load(path, None, COLUMN_TYPES, engine)
+                self.assertEqual(failed, {"ChargePeriodStart"})
+                self.assertEqual(df["BilledCost"].to_list(), [1.5, None, 3.5])
+
+    def test_ragged_rows_are_padded_not_dropped(self):
+        path, _ = self._inputs("ragged", RAGGED_CSV)[0]
+        for engine in CSV_ENGINES:
+            with self.subTest(engine=engine):
+                df, _ = self._load(path, None, COLUMN_TYPES, engine)
+                self.assertEqual(df["BilledCost"].to_list(), [1.5, 2.5, 3.5])
+                self.assertEqual(df["ProviderName"].to_list(), ["AWS", None, "Azure"])
+
+    def test_streams_are_not_buffered_by_polars(self):
+        path, compression = self._inputs("clean", CLEAN_CSV)[2]
+        for engine in CSV_ENGINES:
+            with self.subTest(engine=engine), patch.object(
+                pl, "read_csv", side_effect=AssertionError("stream read whole")
+            ):
+                df, _ = self._load(path, compression, COLUMN_TYPES, engine)
+                self.assertEqual(len(df), 3)
+
+    def test_stdin_uses_selected_engine(self):
+        class _Stdin:
+            def __init__(self, payload):
+                self.buffer = io.BufferedReader(io.BytesIO(payload))
+
+        with patch("sys.stdin", _Stdin(CLEAN_CSV.encode("utf-8"))):
+            loader = CSVDataLoader("-", column_types=COLUMN_TYPES, engine="duckdb")
+            df = loader.load()
+        self.assertIsInstance(loader.engine, DuckDBCSVEngine)
+        self.assertEqual(len(df), 3)
+
+
+class TestEngineSelection(unittest.TestCase):
+    def test_explicit_engines(self):
+        self.assertIsInstance(select_csv_engine("polars"), PolarsCSVEngine)
+        self.assertIsInstance(select_csv_engine("duckdb"), DuckDBCSVEngine)
+        self.assertIsInstance(select_csv_engine("pyarrow"), PyArrowCSVEngine)
+        with self.assertRaises(ValueError):
+            select_csv_engine("pandas")
+
+    def test_auto_by_size_and_cores(self):
+        with patch("os.path.isfile", return_value=True), patch(
+            "os.path.getsize", return_value=AUTO_DUCKDB_MIN_BYTES
+        ):
+            self.assertIsInstance(
+                select_csv_engine("auto", "big.csv", cores=AUTO_DUCKDB_MIN_CORES),
+                DuckDBCSVEngine,
+            )
+            self.assertIsInstance(
+                select_csv_engine("auto", "big.csv", cores=1), PyArrowCSVEngine
+            )
+        self.assertIsInstance(
+            select_csv_engine("auto", "missing.csv", cores=64), PyArrowCSVEngine
+        )
+
+    def test_data_loader_passes_engine(self):
+        loader = DataLoader("export.csv", loader_engine="pyarrow")
+        self.assertEqual(loader.data_loader.engine_name, "pyarrow")
+
+
+class TestCSVEngineBenchmark(unittest.TestCase):
+    def test_generate_and_compare(self):
+        temp_dir = tempfile.mkdtemp()
+        try:
+            path = generate_csv(os.path.join(temp_dir, "gen.csv"), 50, dirty=True)
+            self.assertTrue(os.path.getsize(path) > 0)
+            results = run_benchmark([200], repeat=1)
+        finally:
+            shutil.rmtree(temp_dir, ignore_errors=True)
+
+        self.assertEqual(len(results), 4)  # clean/dirty x plain/gzip
+        for record in results:
+            self.assertEqual(set(record["seconds"]), set(CSV_ENGINES))
+            self.assertIn(record["winner"], CSV_ENGINES)
+
+
+if __name__ == "__main__":
+    unittest.main()
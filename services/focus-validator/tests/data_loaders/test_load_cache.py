@@ -0,0 +1,114 @@
+"""Tests for the CSV normalization load cache."""
+
+import os
+import shutil
+import tempfile
+import time
+import unittest
+from unittest.mock import patch
+
+import polars as pl
+
+from focus_validator.data_loaders.data_loader import DataLoader
+from focus_validator.data_loaders.load_cache import LoadCache
+
+CSV_CONTENT = (
+    "BilledCost,ChargePeriodStart,ProviderName\n"
+    "1.5,2024-01-01T00:00:00Z,AWS\n"
+    "2.5,2024-01-02T00:00:00Z,AWS\n"
+    "3.5,2024-01-03T00:00:00Z,Azure\n"
+)
+
+COLUMN_TYPES = {
+    "BilledCost": "float64",
+    "ChargePeriodStart": "datetime64[ns, UTC]",
+    "ProviderName": "string",
+}
+
+
+class TestLoadCache(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.cache_dir = os.path.join(self.temp_dir, "cache")
+        self.csv_path = os.path.join(self.temp_dir, "export.csv")
+        with open(self.csv_path, "w") as f:
+            f.write(CSV_CONTENT)
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def _load(self, cache: LoadCache) -> DataLoader:
+        loader = DataLoader(self.csv_path, column_types=COLUMN_TYPES, load_cache=cache)
+        loader.result = loader.load()
+        return loader
+
+    def test_second_run_skips_csv_parsing(self):
+        for cache_format in ("parquet", "arrow"):
+            with self.subTest(cache_format=cache_format):
+                cache = LoadCache(
+                    os.path.join(self.cache_dir, cache_format),
+                    cache_format=cache_format,
+                )
+                first = self._load(cache)
+                self.assertFalse(first.cache_hit)
+
+                with patch(
+                    "focus_validator.data_loaders.csv_data_loader.pl.read_csv"
+                ) as mock_read_csv:
+                    second = self._load(cache)
+                mock_read_csv.assert_not_called()
+
+                self.assertTrue(second.cache_hit)
+                self.assertTrue(second.result.equals(first.result))
+                self.assertEqual(second.result["ChargePeriodStart"].dtype.time_zone, "UTC")
+                self.assertEqual((cache.hits, cache.misses), (1, 1))
+
+    def test_key_changes_with_content_and_column_types(self):
+        cache = LoadCache(self.cache_dir)
+        key = cache.key_for(self.csv_path, COLUMN_TYPES)
+        self.assertEqual(key, cache.key_for(self.csv_path, dict(COLUMN_TYPES)))
+        self.assertNotEqual(key, cache.key_for(self.csv_path, {}))
+
+        # Same size, new content
+        with open(self.csv_path, "w") as f:
+            f.write(CSV_CONTENT.replace("AWS", "GCP"))
+        self.assertNotEqual(key, cache.key_for(self.csv_path, COLUMN_TYPES))
+
+    def test_lru_eviction(self):
+        cache = LoadCache(self.cache_dir, max_size_mb=None)
+        df = pl.DataFrame({"a": list(range(1000))})
+        paths = [cache.put(f"key{i}", df) for i in range(3)]
+        for offset, path in enumerate(paths):
+            os.utime(path, (time.time() - 100 + offset, time.time() - 100 + offset))
+
+        # Reading key0 makes it the most recently used entry
+        self.assertIsNotNone(cache.get("key0"))
+        cache.max_size_bytes = os.path.getsize(paths[0]) * 2
+        evicted = cache.evict()
+
+        self.assertEqual(evicted, [paths[1]])
+        self.assertTrue(os.path.exists(paths[0]))
+        self.assertTrue(os.path.exists(paths[2]))
+
+    def test_corrupt_entry_is_a_miss(self):
+        cache = LoadCache(self.cache_dir)
+        path = cache.put("key", pl.DataFrame({"a": [1]}))
+        with open(path, "wb") as f:
+            f.write(b"not parquet")
+        self.assertIsNone(cache.get("key"))
+        self.assertFalse(os.path.exists(path))
+
+    def test_parquet_input_bypasses_cache(self):
+        parquet_path = os.path.join(self.temp_dir, "export.parquet")
+        pl.DataFrame({"a": [1, 2]}).write_parquet(parquet_path)
+        cache = LoadCache(self.cache_dir)
+        DataLoader(parquet_path, load_cache=cache).load()
+        self.assertEqual(os.listdir(self.cache_dir), [])
+
+    def test_invalid_format(self):
+        with self.assertRaises(ValueError):
+            LoadCache(self.cache_dir, cache_format="csv")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,83 @@
+"""Tests for bounded-memory stdin spooling used by the data loaders."""
+
+import io
+import os
+import sys
+import unittest
+from unittest.mock import patch
+
+import polars as pl
+
+from focus_validator.data_loaders import input_streams
+from focus_validator.data_loaders.csv_data_loader import CSVDataLoader
+from focus_validator.data_loaders.input_streams import copy_stream, spooled_stdin
+from focus_validator.data_loaders.parquet_data_loader import ParquetDataLoader
+
+
+class _RecordingReader(io.BufferedReader):
+    """BufferedReader that records the size of every read request."""
+
+    def __init__(self, payload: bytes):
+        super().__init__(io.BytesIO(payload))
+        self.requests = []
+
+    def read(self, size=-1):
+        self.requests.append(size)
+        return super().read(size)
+
+
+class _FakeStdin:
+    def __init__(self, payload: bytes):
+        self.buffer = _RecordingReader(payload)
+
+    def read(self, size=-1):
+        raise AssertionError("stdin must not be read as a whole")
+
+
+class TestCopyStream(unittest.TestCase):
+    def test_reads_in_bounded_chunks(self):
+        payload = os.urandom(10_000)
+        reader = _RecordingReader(payload)
+        target = io.BytesIO()
+
+        written = copy_stream(reader, target, chunk_size=4096)
+
+        self.assertEqual(written, len(payload))
+        self.assertEqual(target.getvalue(), payload)
+        self.assertEqual(reader.requests, [4096, 4096, 4096])
+
+    def test_text_source_is_encoded(self):
+        target = io.BytesIO()
+        copy_stream(io.StringIO("a,b\nü,2\n"), target, chunk_size=3)
+        self.assertEqual(target.getvalue().decode("utf-8"), "a,b\nü,2\n")
+
+
+class TestSpooledStdin(unittest.TestCase):
+    def test_spool_file_removed_on_exit(self):
+        with patch("sys.stdin", _FakeStdin(b"payload")):
+            with spooled_stdin(suffix=".csv") as path:
+                with open(path, "rb") as f:
+                    self.assertEqual(f.read(), b"payload")
+        self.assertFalse(os.path.exists(path))
+
+    def test_csv_stdin_never_read_whole(self):
+        payload = b"col1,col2\n" + b"".join(b"%d,x\n" % i for i in range(5000))
+        with patch.object(input_streams, "SPOOL_CHUNK_SIZE", 1024):
+            with patch("sys.stdin", _FakeStdin(payload)):
+                df = CSVDataLoader("-").load()
+                requests = set(sys.stdin.buffer.requests)
+
+        self.assertEqual(len(df), 5000)
+        self.assertEqual(requests, {1024})
+
+    def test_parquet_stdin_larger_than_chunk(self):
+        buffer = io.BytesIO()
+        pl.DataFrame({"a": list(range(20_000))}).write_parquet(buffer)
+        with patch.object(input_streams, "SPOOL_CHUNK_SIZE", 4096):
+            with patch("sys.stdin", _FakeStdin(buffer.getvalue())):
+                df = ParquetDataLoader("-").load()
+        self.assertEqual(df["a"].sum(), sum(range(20_000)))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -79,6 +79,15 @@ class TestConsoleOutputterHelpers(unittest.TestCase):
         self.assertIn("violations=5", line)
         self.assertIn("reason=Data validation failed", line)
 
+    def test_line_for_rule_lower_bound(self):
+        """Test that counts stopped early by --count-mode show as lower bounds."""
+        entry = {
+            "ok": False,
+            "details": {"violations": 1, "violations_lower_bound": True}
+        }
+        line = _line_for_rule("TestRule-004-M", entry)
+        self.assertIn("violations>=1", line)
+
     def test_line_for_rule_skipped(self):
         """Test line formatting for skipped rule."""
         rule_id = "TestRule-003-O"
@@ -295,6 +304,58 @@ class TestConsoleOutputter(unittest.TestCase):
         # Should be alphabetically sorted
         self.assertEqual(rule_ids_in_order, ["Alpha", "Beta", "Zebra"])
 
+    @patch('builtins.print')
+    def test_write_reports_partial_results(self, mock_print):
+        """Test that rules cut off by a deadline are counted in a partial-results line."""
+        not_evaluated = {"skipped": True, "not_evaluated": "deadline", "reason": "not evaluated (deadline)"}
+        partial_results = ValidationResults(
+            by_idx={
+                0: {"ok": True, "details": {}, "rule_id": "Pass-001-M"},
+                1: {"ok": True, "details": not_evaluated, "rule_id": "Late-002-M"}
+            },
+            by_rule_id={
+                "Pass-001-M": {"ok": True, "details": {}, "rule_id": "Pass-001-M"},
+                "Late-002-M": {"ok": True, "details": not_evaluated, "rule_id": "Late-002-M"}
+            },
+            rules={},
+            rules_version="test_rules_version",
+            data_filename="test_data.csv",
+            data_row_count=100,
+            model_version="test_model_version",
+            focus_dataset="CostAndUsage",
+            partial=True
+        )
+
+        self.outputter.write(partial_results)
+
+        calls = [call[0][0] for call in mock_print.call_args_list]
+        self.assertTrue(any("Partial results: 1 rules not evaluated" in call for call in calls))
+
+    @patch('builtins.print')
+    def test_write_reports_most_frequent_violating_values(self, mock_print):
+        """Test that --show-violations lists the most frequent violating values."""
+        details = {
+            "violations": 30,
+            "message": "BilledCost MUST NOT be null",
+            "top_violating_values": [{"value": None, "count": 20}, {"value": "x", "count": 10}],
+        }
+        entry = {"ok": False, "details": details, "rule_id": "Fail-001-M"}
+        failing_results = ValidationResults(
+            by_idx={0: entry},
+            by_rule_id={"Fail-001-M": entry},
+            rules={},
+            rules_version="test_rules_version",
+            data_filename="test_data.csv",
+            data_row_count=100,
+            model_version="test_model_version",
+            focus_dataset="CostAndUsage"
+        )
+
+        ConsoleOutputter(output_destination=None, show_violations=True).write(failing_results)
+
+        calls = [call[0][0] for call in mock_print.call_args_list]
+        self.assertIn("  Most frequent: None x20, 'x' x10", calls)
+
     def test_outputter_logger_name(self):
         """Test that outputter has correct logger name."""
         self.assertEqual(
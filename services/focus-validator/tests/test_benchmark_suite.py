@@ -0,0 +1,74 @@
+"""Tests for the end-to-end benchmark suite."""
+
+import unittest
+
+from focus_validator.benchmarks.suite import (
+    PHASES,
+    case_key,
+    compare_to_baseline,
+    run_suite,
+    scaling_exponents,
+)
+
+
+def _report(seconds_by_case):
+    results = {}
+    for (fmt, data, rows), total in seconds_by_case.items():
+        results[case_key(fmt, data, rows)] = {
+            "format": fmt,
+            "data": data,
+            "rows": rows,
+            "size_mb": 0.0,
+            "seconds": {phase: total for phase in PHASES},
+        }
+    return {"results": results}
+
+
+class TestBenchmarkSuite(unittest.TestCase):
+    def test_run_suite_reports_every_phase(self):
+        report = run_suite(rows=[200], repeat=1)
+
+        self.assertEqual(
+            set(report["results"]),
+            {
+                "csv/clean/200",
+                "parquet/clean/200",
+                "csv/violations/200",
+                "parquet/violations/200",
+            },
+        )
+        for record in report["results"].values():
+            self.assertEqual(set(record["seconds"]), set(PHASES))
+            self.assertGreater(record["seconds"]["execute"], 0)
+            self.assertGreaterEqual(
+                record["seconds"]["total"], record["seconds"]["execute"]
+            )
+        self.assertIn("duckdb", report["environment"])
+
+    def test_compare_flags_only_real_regressions(self):
+        baseline = _report({("csv", "clean", 1000): 1.0, ("csv", "clean", 10): 0.01})
+        current = _report({("csv", "clean", 1000): 1.5, ("csv", "clean", 10): 0.03})
+
+        regressions = compare_to_baseline(current, baseline, threshold=0.2)
+
+        # The 10-row case tripled but stays under the noise floor
+        self.assertEqual({r["case"] for r in regressions}, {"csv/clean/1000"})
+        self.assertEqual({r["phase"] for r in regressions}, set(PHASES))
+        self.assertAlmostEqual(regressions[0]["change"], 0.5)
+        self.assertEqual(compare_to_baseline(baseline, baseline), [])
+
+    def test_scaling_exponent(self):
+        report = _report(
+            {
+                ("parquet", "clean", 1000): 1.0,
+                ("parquet", "clean", 10000): 10.0,
+                ("csv", "clean", 1000): 1.0,
+            }
+        )
+        exponents = scaling_exponents(report)
+        self.assertAlmostEqual(exponents["parquet/clean"], 1.0)
+        self.assertIsNone(exponents["csv/clean"])
+
+
+if __name__ == "__main__":
+    unittest.main()
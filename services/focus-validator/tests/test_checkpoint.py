@@ -0,0 +1,196 @@
+"""Tests for checkpoints and resumed validation runs."""
+
+import json
+import os
+import shutil
+import tempfile
+import unittest
+from unittest.mock import patch
+
+import pandas as pd
+import polars as pl
+
+from focus_validator.benchmarks.synthetic import generate_frame
+from focus_validator.config_objects.focus_to_duckdb_converter import (
+    FocusToDuckDBSchemaConverter,
+)
+from focus_validator.rules.checkpoint import ValidationCheckpoint
+from focus_validator.validator import Validator
+
+
+class TestValidationCheckpoint(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.temp_dir, "run.ckpt")
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_round_trip(self):
+        results = {0: {"ok": True, "details": {"violations": 0}, "rule_id": "R-1"}}
+        ValidationCheckpoint(self.path, "key").save(results)
+        self.assertEqual(ValidationCheckpoint(self.path, "key").load(), results)
+
+    def test_round_trip_keeps_violation_samples(self):
+        samples = pd.DataFrame({"BilledCost": [-1.5, -2.0]})
+        results = {
+            3: {
+                "ok": False,
+                "details": {"violations": 2, "failure_cases": samples},
+                "rule_id": "R-1",
+            }
+        }
+        ValidationCheckpoint(self.path, "key").save(results)
+        with open(self.path, encoding="utf-8") as f:
+            json.load(f)
+        restored = ValidationCheckpoint(self.path, "key").load()
+        pd.testing.assert_frame_equal(restored[3]["details"]["failure_cases"], samples)
+
+    def test_maybe_save_waits_for_interval(self):
+        results = {0: {"ok": True, "details": {}, "rule_id": "R-1"}}
+        ValidationCheckpoint(self.path, "key", save_interval_seconds=3600).maybe_save(
+            results
+        )
+        self.assertFalse(os.path.exists(self.path))
+        ValidationCheckpoint(self.path, "key", save_interval_seconds=0).maybe_save(
+            results
+        )
+        self.assertEqual(ValidationCheckpoint(self.path, "key").load(), results)
+
+    def test_other_key_or_missing_file_starts_over(self):
+        checkpoint = ValidationCheckpoint(self.path, "key")
+        self.assertIsNone(checkpoint.load())
+        checkpoint.save({})
+        self.assertIsNone(ValidationCheckpoint(self.path, "other").load())
+
+    def test_unreadable_file_starts_over(self):
+        with open(self.path, "wb") as f:
+            f.write(b"not a checkpoint")
+        self.assertIsNone(ValidationCheckpoint(self.path, "key").load())
+
+    def test_clear_removes_samples(self):
+        checkpoint = ValidationCheckpoint(self.path, "key")
+        checkpoint.save(
+            {0: {"ok": False, "details": {"failure_cases": pd.DataFrame({"a": [1]})}}}
+        )
+        checkpoint.clear()
+        self.assertFalse(os.path.exists(self.path))
+        self.assertFalse(os.path.exists(checkpoint.frame_dir))
+
+
+class TestResumedValidation(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.temp_dir = tempfile.mkdtemp()
+        cls.data_path = os.path.join(cls.temp_dir, "faulty.parquet")
+        df, _ = generate_frame(200, {"BilledCost-C-003-M": 0.1})
+        df.write_parquet(cls.data_path)
+        cls.checkpoint_path = os.path.join(cls.temp_dir, "run.ckpt")
+        cls.expected, cls.full_calls = cls._validate(checkpoint=False)
+
+    @classmethod
+    def tearDownClass(cls):
+        shutil.rmtree(cls.temp_dir, ignore_errors=True)
+
+    @classmethod
+    def _validate(cls, checkpoint=True, resume=False, fail_after=None, **kwargs):
+        validator = Validator(
+            data_filename=cls.data_path,
+            output_type="unittest",
+            output_destination=os.path.join(cls.temp_dir, "results.xml"),
+            rules_version="1.2",
+            focus_dataset="CostAndUsage",
+            rules_block_remote_download=True,
+            checkpoint_path=cls.checkpoint_path if checkpoint else None,
+            resume=resume,
+            **kwargs,
+        )
+        run_check = FocusToDuckDBSchemaConverter.run_check
+        calls = []
+
+        def counting_run_check(self, check):
+            calls.append(check)
+            if fail_after is not None and len(calls) > fail_after:
+                raise RuntimeError("worker died")
+            return run_check(self, check)
+
+        with patch.object(
+            FocusToDuckDBSchemaConverter, "run_check", counting_run_check
+        ):
+            results = validator.validate()
+        return results, len(calls)
+
+    @staticmethod
+    def _outcomes(results):
+        return {
+            rule_id: (entry["ok"], entry["details"].get("violations"))
+            for rule_id, entry in results.by_rule_id.items()
+        }
+
+    def test_resume_continues_after_last_finished_layer(self):
+        with self.assertRaises(RuntimeError):
+            self._validate(fail_after=self.full_calls - 1)
+        self.assertTrue(os.path.exists(self.checkpoint_path))
+
+        results, calls = self._validate(resume=True)
+        self.assertLess(calls, self.full_calls)
+        self.assertEqual(self._outcomes(results), self._outcomes(self.expected))
+        # A completed run leaves nothing to resume from
+        self.assertFalse(os.path.exists(self.checkpoint_path))
+
+    def test_resume_continues_inside_first_layer(self):
+        with self.assertRaises(RuntimeError):
+            self._validate(fail_after=5)
+
+        results, calls = self._validate(resume=True)
+        self.assertEqual(calls, self.full_calls - 5)
+        self.assertEqual(self._outcomes(results), self._outcomes(self.expected))
+
+    def test_other_group_by_starts_over(self):
+        with self.assertRaises(RuntimeError):
+            self._validate(fail_after=self.full_calls - 1)
+
+        results, calls = self._validate(resume=True, group_by="ProviderName")
+        self.assertEqual(calls, self.full_calls)
+        self.assertIn(
+            "violations_by_group",
+            results.by_rule_id["BilledCost-C-003-M"]["details"],
+        )
+
+    def test_restored_rules_stay_in_the_violation_matrix(self):
+        matrix_path = os.path.join(self.temp_dir, "matrix.parquet")
+        with self.assertRaises(RuntimeError):
+            self._validate(fail_after=self.full_calls - 1, violation_matrix=matrix_path)
+
+        results, calls = self._validate(resume=True, violation_matrix=matrix_path)
+        self.assertLess(calls, self.full_calls)
+        details = results.by_rule_id["BilledCost-C-003-M"]["details"]
+        violated = pl.read_parquet(matrix_path)["violated_rules"].explode()
+        self.assertEqual(
+            (violated == "BilledCost-C-003-M").sum(), details["violations"]
+        )
+
+    def test_restored_failed_rules_are_exported(self):
+        export_dir = os.path.join(self.temp_dir, "exports")
+        with self.assertRaises(RuntimeError):
+            self._validate(fail_after=self.full_calls - 1, export_violations=export_dir)
+        shutil.rmtree(export_dir)
+
+        results, _ = self._validate(resume=True, export_violations=export_dir)
+        details = results.by_rule_id["BilledCost-C-003-M"]["details"]
+        self.assertEqual(
+            pl.read_parquet(details["violations_file"]).height, details["violations"]
+        )
+
+    def test_resume_requires_checkpoint_path(self):
+        with self.assertRaises(ValueError):
+            Validator(
+                data_filename=self.data_path,
+                output_type="console",
+                output_destination=None,
+                resume=True,
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,115 @@
+"""Tests for exact / exists / capped violation counting."""
+
+import os
+import shutil
+import tempfile
+import unittest
+
+from focus_validator.benchmarks.synthetic import generate_frame
+from focus_validator.config_objects.focus_to_duckdb_converter import (
+    limit_violations,
+    parse_count_mode,
+)
+from focus_validator.validator import Validator
+
+
+class TestParseCountMode(unittest.TestCase):
+    def test_modes(self):
+        self.assertIsNone(parse_count_mode("exact"))
+        self.assertEqual(parse_count_mode("exists"), 1)
+        self.assertEqual(parse_count_mode("capped:25"), 25)
+
+    def test_invalid_modes_rejected(self):
+        for mode in ("capped", "capped:0", "capped:-1", "capped:x", "all"):
+            with self.subTest(mode=mode), self.assertRaises(ValueError):
+                parse_count_mode(mode)
+
+
+class TestLimitViolations(unittest.TestCase):
+    def test_limit_goes_inside_invalid_cte(self):
+        sql = """
+        WITH invalid AS (
+            SELECT 1
+            FROM focus_data
+            WHERE NOT regexp_full_match(x, '^(a|b)\\)$') AND y IN ('(', ')')
+        )
+        SELECT COUNT(*) AS violations FROM invalid
+        """
+        limited = limit_violations(sql, 3)
+        body, outer = limited.split("LIMIT 3", 1)
+        self.assertIn("IN ('(', ')')", body)
+        self.assertTrue(outer.lstrip().startswith(")"))
+        self.assertIn("COUNT(*) AS violations FROM invalid", outer)
+
+    def test_queries_without_invalid_cte_unchanged(self):
+        sql = "WITH col_check AS (SELECT 1 AS found) SELECT found AS violations FROM col_check"
+        self.assertEqual(limit_violations(sql, 1), sql)
+
+
+class TestCountModeValidation(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.temp_dir = tempfile.mkdtemp()
+        cls.data_path = os.path.join(cls.temp_dir, "faulty.parquet")
+        df, cls.injected = generate_frame(
+            200,
+            {"BilledCost-C-003-M": 0.2, "ResourceId-C-002-M": 0.1},
+        )
+        df.write_parquet(cls.data_path)
+        cls.results = {
+            mode: cls._validate(mode) for mode in ("exact", "exists", "capped:5")
+        }
+
+    @classmethod
+    def tearDownClass(cls):
+        shutil.rmtree(cls.temp_dir, ignore_errors=True)
+
+    @classmethod
+    def _validate(cls, count_mode):
+        validator = Validator(
+            data_filename=cls.data_path,
+            output_type="unittest",
+            output_destination=os.path.join(cls.temp_dir, f"{count_mode}.xml"),
+            rules_version="1.2",
+            focus_dataset="CostAndUsage",
+            rules_block_remote_download=True,
+            count_mode=count_mode,
+        )
+        return validator.validate().by_rule_id
+
+    def test_outcomes_match_exact_counts(self):
+        exact = self.results["exact"]
+        for mode in ("exists", "capped:5"):
+            with self.subTest(mode=mode):
+                bounded = self.results[mode]
+                self.assertEqual(
+                    {rid: entry["ok"] for rid, entry in bounded.items()},
+                    {rid: entry["ok"] for rid, entry in exact.items()},
+                )
+
+    def test_counts_are_capped_and_marked(self):
+        for rule_id, injected in self.injected.items():
+            exact = self.results["exact"][rule_id]["details"]
+            self.assertEqual(exact["violations"], injected)
+            self.assertNotIn("violations_lower_bound", exact)
+
+            exists = self.results["exists"][rule_id]["details"]
+            self.assertEqual(exists["violations"], 1)
+            self.assertTrue(exists["violations_lower_bound"])
+
+            capped = self.results["capped:5"][rule_id]["details"]
+            self.assertEqual(capped["violations"], 5)
+            self.assertTrue(capped["violations_lower_bound"])
+
+    def test_invalid_count_mode_rejected(self):
+        with self.assertRaises(ValueError):
+            Validator(
+                data_filename=self.data_path,
+                output_type="console",
+                output_destination=None,
+                count_mode="capped:none",
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
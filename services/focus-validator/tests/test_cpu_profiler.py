@@ -0,0 +1,69 @@
+"""Tests for the cProfile / sampling CPU profiler hook."""
+
+import os
+import pstats
+import shutil
+import tempfile
+import time
+import unittest
+
+from focus_validator.utils.cpu_profiler import CPUProfiler, default_output_path
+
+
+def busy_loop(seconds):
+    end = time.perf_counter() + seconds
+    total = 0
+    while time.perf_counter() < end:
+        total += sum(range(100))
+    return total
+
+
+class TestCPUProfiler(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_cprofile_writes_pstats_and_ranks_functions(self):
+        path = os.path.join(self.temp_dir, "run.prof")
+        profiler = CPUProfiler("cprofile", path)
+        with profiler.profile():
+            busy_loop(0.05)
+
+        top = profiler.top_functions()
+        busy = next(r for r in top if "busy_loop" in r["function"])
+        self.assertEqual(busy["calls"], 1)
+        self.assertGreater(busy["cumulative_s"], 0.0)
+        self.assertEqual(top, sorted(top, key=lambda r: -r["cumulative_s"]))
+        self.assertIn("test_cpu_profiler.py", busy["function"])
+        self.assertIn("busy_loop", profiler.format_top())
+        self.assertTrue(pstats.Stats(path).total_calls > 0)
+
+    def test_sampling_writes_collapsed_stacks(self):
+        path = os.path.join(self.temp_dir, "run.folded")
+        profiler = CPUProfiler("sampling", path, interval=0.001)
+        with profiler.profile():
+            busy_loop(0.2)
+
+        self.assertGreater(profiler.samples, 0)
+        labels = [r["function"] for r in profiler.top_functions(limit=1000)]
+        self.assertTrue(any("busy_loop" in label for label in labels))
+
+        with open(path) as f:
+            lines = f.read().splitlines()
+        counts = [int(line.rsplit(" ", 1)[1]) for line in lines]
+        self.assertEqual(sum(counts), profiler.samples)
+        self.assertTrue(any("busy_loop" in line for line in lines))
+
+    def test_unknown_mode_rejected(self):
+        with self.assertRaises(ValueError):
+            CPUProfiler("perf")
+
+    def test_default_output_path_suffix(self):
+        self.assertTrue(default_output_path("cprofile").endswith(".prof"))
+        self.assertTrue(default_output_path("sampling").endswith(".folded"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,116 @@
+"""Tests for time-budgeted validation and query cancellation."""
+
+import os
+import shutil
+import tempfile
+import threading
+import time
+import unittest
+
+from focus_validator.benchmarks.synthetic import generate_frame
+from focus_validator.utils.deadline import (
+    DEADLINE,
+    TIMEOUT,
+    QueryDeadline,
+    not_evaluated_details,
+)
+from focus_validator.validator import Validator
+
+
+class FakeConnection:
+    """Stands in for a DuckDB connection whose query runs until interrupted."""
+
+    def __init__(self):
+        self.interrupts = 0
+        self.interrupted = threading.Event()
+
+    def interrupt(self):
+        self.interrupts += 1
+        self.interrupted.set()
+
+    def run_query(self, seconds):
+        return self.interrupted.wait(seconds)
+
+
+class TestQueryDeadline(unittest.TestCase):
+    def test_rule_timeout_interrupts_running_query(self):
+        connection = FakeConnection()
+        deadline = QueryDeadline(connection, rule_timeout_seconds=0.05)
+        with deadline.guard():
+            self.assertTrue(connection.run_query(5))
+        self.assertEqual(deadline.interrupted, TIMEOUT)
+
+    def test_deadline_wins_when_sooner_than_timeout(self):
+        connection = FakeConnection()
+        deadline = QueryDeadline(
+            connection, deadline=time.monotonic() + 0.05, rule_timeout_seconds=10
+        )
+        with deadline.guard():
+            connection.run_query(5)
+        self.assertEqual(deadline.interrupted, DEADLINE)
+        self.assertTrue(deadline.expired())
+
+    def test_no_interrupt_after_guard_exits(self):
+        connection = FakeConnection()
+        deadline = QueryDeadline(connection, rule_timeout_seconds=0.05)
+        with deadline.guard():
+            pass
+        time.sleep(0.1)
+        self.assertEqual(connection.interrupts, 0)
+        self.assertIsNone(deadline.interrupted)
+
+    def test_not_evaluated_details_are_skipped(self):
+        details = not_evaluated_details(DEADLINE)
+        self.assertTrue(details["skipped"])
+        self.assertEqual(details["not_evaluated"], DEADLINE)
+        self.assertEqual(details["reason"], "not evaluated (deadline)")
+
+
+class TestDeadlineValidation(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.temp_dir = tempfile.mkdtemp()
+        cls.data_path = os.path.join(cls.temp_dir, "data.parquet")
+        df, _ = generate_frame(200, {})
+        df.write_parquet(cls.data_path)
+
+    @classmethod
+    def tearDownClass(cls):
+        shutil.rmtree(cls.temp_dir, ignore_errors=True)
+
+    def _validator(self, **kwargs):
+        return Validator(
+            data_filename=self.data_path,
+            output_type="unittest",
+            output_destination=os.path.join(self.temp_dir, "results.xml"),
+            rules_version="1.2",
+            focus_dataset="CostAndUsage",
+            rules_block_remote_download=True,
+            **kwargs,
+        )
+
+    def test_expired_deadline_returns_partial_results(self):
+        results = self._validator(deadline_seconds=1e-6).validate()
+        self.assertTrue(results.partial)
+        self.assertTrue(results.by_rule_id)
+        for entry in results.by_rule_id.values():
+            self.assertTrue(entry["ok"])
+            self.assertEqual(entry["details"]["not_evaluated"], DEADLINE)
+
+    def test_generous_limits_evaluate_every_rule(self):
+        results = self._validator(
+            deadline_seconds=600, rule_timeout_seconds=600
+        ).validate()
+        self.assertFalse(results.partial)
+        self.assertFalse(
+            any(e["details"].get("not_evaluated") for e in results.by_rule_id.values())
+        )
+
+    def test_non_positive_limits_rejected(self):
+        for kwargs in ({"deadline_seconds": 0}, {"rule_timeout_seconds": -1}):
+            with self.subTest(**kwargs), self.assertRaises(ValueError):
+                self._validator(**kwargs)
+
+
+if __name__ == "__main__":
+    unittest.main()
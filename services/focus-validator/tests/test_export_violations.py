@@ -0,0 +1,85 @@
+"""Tests for exporting violating rows (--export-violations)."""
+
+import os
+import shutil
+import tempfile
+import unittest
+
+import polars as pl
+
+from focus_validator.benchmarks.synthetic import generate_frame
+from focus_validator.validator import Validator
+
+
+class TestExportViolations(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.temp_dir = tempfile.mkdtemp()
+        cls.data_path = os.path.join(cls.temp_dir, "faulty.parquet")
+        cls.df, _ = generate_frame(
+            300, {"BilledCost-C-003-M": 0.1, "ResourceId-C-002-M": 0.05}
+        )
+        cls.df.write_parquet(cls.data_path)
+
+    @classmethod
+    def tearDownClass(cls):
+        shutil.rmtree(cls.temp_dir, ignore_errors=True)
+
+    def _validate(self, export_dir, **kwargs):
+        return Validator(
+            data_filename=self.data_path,
+            output_type="unittest",
+            output_destination=os.path.join(self.temp_dir, "results.xml"),
+            rules_version="1.2",
+            focus_dataset="CostAndUsage",
+            rules_block_remote_download=True,
+            export_violations=export_dir,
+            **kwargs,
+        ).validate()
+
+    def test_all_violating_rows_of_failed_rules(self):
+        export_dir = os.path.join(self.temp_dir, "all")
+        results = self._validate(export_dir)
+
+        exported = {}
+        for rule_id, entry in results.by_rule_id.items():
+            path = entry["details"].get("violations_file")
+            if path is None:
+                continue
+            self.assertFalse(entry["ok"], rule_id)
+            rows = pl.read_parquet(path)
+            self.assertEqual(rows.columns, ["row_index", *self.df.columns])
+            if "children" not in entry["details"]:
+                self.assertEqual(rows.height, entry["details"]["violations"], rule_id)
+            exported[rule_id] = rows
+        self.assertEqual(
+            sorted(os.listdir(export_dir)),
+            sorted(f"{rule_id}.parquet" for rule_id in exported),
+        )
+
+        nulls = (
+            self.df.with_row_index("row_index")
+            .filter(pl.col("BilledCost").is_null())
+            .with_columns(pl.col("row_index").cast(pl.Int64))
+        )
+        self.assertEqual(
+            exported["BilledCost-C-003-M"]["row_index"].to_list(),
+            nulls["row_index"].to_list(),
+        )
+        self.assertIn("ResourceId-C-002-M", exported)
+
+    def test_limit_caps_rows_per_rule(self):
+        export_dir = os.path.join(self.temp_dir, "capped")
+        results = self._validate(export_dir, export_violations_limit=5)
+        path = results.by_rule_id["BilledCost-C-003-M"]["details"]["violations_file"]
+        rows = pl.read_parquet(path)
+        self.assertEqual(rows.height, 5)
+        self.assertEqual(rows["row_index"].to_list(), sorted(rows["row_index"]))
+
+    def test_limit_must_be_positive(self):
+        with self.assertRaises(ValueError):
+            self._validate(self.temp_dir, export_violations_limit=0)
+
+
+if __name__ == "__main__":
+    unittest.main()
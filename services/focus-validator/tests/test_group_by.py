@@ -0,0 +1,123 @@
+"""Tests for grouped validation (--group-by)."""
+
+import json
+import os
+import shutil
+import tempfile
+import unittest
+
+from focus_validator.benchmarks.synthetic import generate_frame
+from focus_validator.config_objects.focus_to_duckdb_converter import (
+    GROUP_COLUMN,
+    grouped_violations_sql,
+)
+from focus_validator.validator import Validator
+
+LEAF_SQL = """
+WITH invalid AS (
+    SELECT x::TEXT AS value
+    FROM {table_name}
+    WHERE x IS NOT NULL AND x NOT IN ('(', ')')
+)
+SELECT COUNT(*) AS violations,
+    CASE WHEN COUNT(*) > 0 THEN 'x is bad' END AS error_message
+FROM invalid
+"""
+
+
+class TestGroupedViolationsSql(unittest.TestCase):
+    def test_groups_invalid_rows_in_one_query(self):
+        grouped = grouped_violations_sql(LEAF_SQL, "g", GROUP_COLUMN)
+        self.assertIn(f"SELECT g AS {GROUP_COLUMN}, x::TEXT AS value", grouped)
+        self.assertIn("WHERE x IS NOT NULL AND x NOT IN ('(', ')')", grouped)
+        self.assertTrue(
+            grouped.endswith(f"FROM invalid GROUP BY {GROUP_COLUMN}"), grouped
+        )
+        self.assertEqual(grouped.count("{table_name}"), 1)
+
+    def test_other_shapes_are_not_grouped(self):
+        self.assertIsNone(
+            grouped_violations_sql("SELECT COUNT(*) FROM {table_name}", "g", "a")
+        )
+
+
+class TestGroupedValidation(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.temp_dir = tempfile.mkdtemp()
+        cls.data_path = os.path.join(cls.temp_dir, "faulty.parquet")
+        df, _ = generate_frame(
+            300, {"BilledCost-C-003-M": 0.1, "ResourceId-C-002-M": 0.05}
+        )
+        df.write_parquet(cls.data_path)
+
+    @classmethod
+    def tearDownClass(cls):
+        shutil.rmtree(cls.temp_dir, ignore_errors=True)
+
+    def _validator(self, **kwargs):
+        return Validator(
+            data_filename=self.data_path,
+            output_type="unittest",
+            output_destination=os.path.join(self.temp_dir, "results.xml"),
+            rules_version="1.2",
+            focus_dataset="CostAndUsage",
+            rules_block_remote_download=True,
+            **kwargs,
+        )
+
+    def test_group_counts_add_up_to_exact_violations(self):
+        expected = self._validator().validate().by_rule_id
+        grouped = self._validator(group_by="RegionId").validate().by_rule_id
+
+        self.assertEqual(set(grouped), set(expected))
+        with_groups = 0
+        for rule_id, entry in grouped.items():
+            details = entry["details"]
+            self.assertEqual(entry["ok"], expected[rule_id]["ok"], rule_id)
+            self.assertEqual(
+                details.get("violations"),
+                expected[rule_id]["details"].get("violations"),
+                rule_id,
+            )
+            groups = details.get("violations_by_group")
+            if groups is None:
+                continue
+            with_groups += 1
+            self.assertEqual(details["group_by"], "RegionId")
+            self.assertEqual(sum(groups.values()), details["violations"], rule_id)
+            self.assertEqual(
+                list(groups.values()), sorted(groups.values(), reverse=True)
+            )
+        self.assertGreater(with_groups, 100)
+        failing = grouped["BilledCost-C-003-M"]["details"]["violations_by_group"]
+        self.assertGreater(len(failing), 1)
+
+    def test_groups_shown_in_web_report(self):
+        report = os.path.join(self.temp_dir, "report.html")
+        Validator(
+            data_filename=self.data_path,
+            output_type="web",
+            output_destination=report,
+            rules_version="1.2",
+            focus_dataset="CostAndUsage",
+            rules_block_remote_download=True,
+            group_by="RegionId",
+        ).validate()
+        with open(report) as f:
+            html = f.read()
+        self.assertIn("renderViolationsByGroup", html)
+        self.assertIn(json.dumps("violationsByGroup"), html)
+        self.assertIn('"groupBy": "RegionId"', html)
+
+    def test_unknown_column_is_rejected(self):
+        with self.assertRaisesRegex(ValueError, "Choose one of"):
+            self._validator(group_by="NoSuchColumn").validate()
+
+    def test_needs_exact_counts(self):
+        with self.assertRaises(ValueError):
+            self._validator(group_by="RegionId", count_mode="exists")
+
+
+if __name__ == "__main__":
+    unittest.main()
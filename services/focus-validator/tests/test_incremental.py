@@ -0,0 +1,131 @@
+"""Tests for incremental validation over appended partitions."""
+
+import json
+import os
+import shutil
+import tempfile
+import unittest
+
+import polars as pl
+
+from focus_validator.benchmarks.synthetic import generate_frame
+from focus_validator.config_objects.incremental import (
+    PARTITION_COLUMN,
+    partition_counts_sql,
+)
+from focus_validator.validator import Validator
+
+
+class TestPartitionCountsSql(unittest.TestCase):
+    def test_leaf_query_grouped_by_partition(self):
+        sql = """
+        WITH invalid AS (
+            SELECT x::TEXT AS value
+            FROM {table_name}
+            WHERE x IS NOT NULL AND x NOT IN ('(', ')')
+        )
+        SELECT
+            COUNT(*) AS violations,
+            CASE WHEN COUNT(*) > 0 THEN 'x is bad' END AS error_message
+        FROM invalid
+        """
+        counts = partition_counts_sql(sql)
+        self.assertIn(f"SELECT {PARTITION_COLUMN}, x::TEXT AS value", counts)
+        self.assertIn("NOT IN ('(', ')')", counts)
+        self.assertTrue(counts.rstrip().endswith(f"GROUP BY {PARTITION_COLUMN}"))
+        self.assertIn("'x is bad' END AS error_message", counts)
+
+    def test_other_shapes_not_rewritten(self):
+        self.assertIsNone(
+            partition_counts_sql(
+                "WITH col_check AS (SELECT 1 AS found) SELECT found AS violations FROM col_check"
+            )
+        )
+        self.assertIsNone(
+            partition_counts_sql(
+                "WITH invalid AS (SELECT 1 FROM {table_name} WHERE x) "
+                "SELECT COUNT(*) AS violations FROM invalid WHERE 1 = 1"
+            )
+        )
+
+
+class TestIncrementalValidation(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.temp_dir = tempfile.mkdtemp()
+        df, _ = generate_frame(
+            600, {"BilledCost-C-003-M": 0.05, "ResourceId-C-002-M": 0.02}
+        )
+        df = df.sort("ChargePeriodStart")
+        # Appended rows reuse the first SkuPriceId with other SkuIds, so the
+        # distinct-count rule only fails across partitions
+        df = df.with_columns(
+            pl.when(pl.int_range(pl.len()) >= 550)
+            .then(pl.lit(df["SkuPriceId"][0]))
+            .otherwise(pl.col("SkuPriceId"))
+            .alias("SkuPriceId")
+        )
+        cls.first_path = os.path.join(cls.temp_dir, "first.parquet")
+        cls.grown_path = os.path.join(cls.temp_dir, "grown.parquet")
+        df.head(500).write_parquet(cls.first_path)
+        df.write_parquet(cls.grown_path)
+        cls.state_path = os.path.join(cls.temp_dir, "state.json")
+
+    @classmethod
+    def tearDownClass(cls):
+        shutil.rmtree(cls.temp_dir, ignore_errors=True)
+
+    def _outcomes(self, data_path, incremental_state=None):
+        validator = Validator(
+            data_filename=data_path,
+            output_type="unittest",
+            output_destination=os.path.join(self.temp_dir, "results.xml"),
+            rules_version="1.2",
+            focus_dataset="CostAndUsage",
+            rules_block_remote_download=True,
+            incremental_state=incremental_state,
+        )
+        return {
+            rule_id: (entry["ok"], entry["details"].get("violations"))
+            for rule_id, entry in validator.validate().by_rule_id.items()
+        }
+
+    def test_appended_data_matches_full_validation(self):
+        if os.path.exists(self.state_path):
+            os.unlink(self.state_path)
+        for path in (self.first_path, self.grown_path):
+            with self.subTest(path=os.path.basename(path)):
+                outcomes = self._outcomes(path, self.state_path)
+                self.assertEqual(outcomes, self._outcomes(path))
+        self.assertEqual(outcomes["SkuPriceId-C-008-M"], (False, 1))
+
+        with open(self.state_path) as f:
+            state = json.load(f)
+        self.assertEqual(state["partition_by"], "ChargePeriodStart")
+        self.assertGreater(len(state["partitions"]), 1)
+        for partition in state["partitions"].values():
+            self.assertTrue(partition["violations"])
+            self.assertTrue(partition["groups"])
+
+    def test_unchanged_file_is_not_fingerprinted(self):
+        state_path = os.path.join(self.temp_dir, "unchanged.json")
+        expected = self._outcomes(self.first_path, state_path)
+        with self.assertLogs(
+            "focus_validator.config_objects.incremental", level="INFO"
+        ) as logs:
+            self.assertEqual(self._outcomes(self.first_path, state_path), expected)
+        self.assertTrue(any("is unchanged" in line for line in logs.output))
+
+    def test_incremental_requires_exact_counts(self):
+        with self.assertRaises(ValueError):
+            Validator(
+                data_filename=self.first_path,
+                output_type="console",
+                output_destination=None,
+                incremental_state=self.state_path,
+                count_mode="exists",
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
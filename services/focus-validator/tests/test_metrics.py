@@ -0,0 +1,170 @@
+"""Tests for per-rule metrics collection."""
+
+import csv
+import io
+import json
+import os
+import shutil
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+
+import pandas as pd
+
+from focus_validator.benchmarks.synthetic import generate_frame
+from focus_validator.outputter.outputter_console import ConsoleOutputter
+from focus_validator.rules.spec_rules import SpecRules
+from focus_validator.utils.metrics import CSV_FIELDS, MetricsCollector
+
+
+def _load_spec_rules(filter_rules=None):
+    spec_rules = SpecRules(
+        rule_set_path="focus_validator/rules",
+        rules_file_prefix="model-",
+        rules_version="1.2",
+        rules_file_suffix=".json",
+        focus_dataset="CostAndUsage",
+        filter_rules=filter_rules,
+        rules_force_remote_download=False,
+        allow_draft_releases=False,
+        allow_prerelease_releases=False,
+        column_namespace=None,
+        rules_block_remote_download=True,
+    )
+    spec_rules.load_rules()
+    return spec_rules
+
+
+class TestMetricsCollector(unittest.TestCase):
+    def test_nested_nodes_aggregate_into_parent(self):
+        collector = MetricsCollector(table_row_count=100)
+        with collector.node("R-1", node_idx=0) as parent:
+            parent.exec_ms = 10.0
+            collector.record_sql(2.0, rows_scanned=100)
+            with collector.node("R-1#child") as child:
+                child.exec_ms = 5.0
+                collector.record_sql(4.0, rows_scanned=100)
+                collector.record_sql(1.0)
+
+        self.assertEqual(len(collector.nodes), 1)
+        node = collector.nodes[0]
+        self.assertEqual(node.kind, "composite")
+        self.assertEqual(node.sql_queries, 3)
+        self.assertEqual(node.rows_scanned, 200)
+        self.assertEqual(node.sql_ms, 2.0)
+        self.assertEqual(node.children_ms, 5.0)
+        self.assertEqual(node.python_ms, 3.0)
+        self.assertEqual(child.rows_scanned, 100)
+
+    def test_record_sql_outside_node_is_ignored(self):
+        collector = MetricsCollector(table_row_count=10)
+        collector.record_sql(1.0)
+        self.assertEqual(collector.nodes, [])
+
+    def test_slowest_orders_by_total(self):
+        collector = MetricsCollector()
+        for rule_id, ms in (("fast", 1.0), ("slow", 9.0), ("mid", 5.0)):
+            with collector.node(rule_id) as node:
+                node.exec_ms = ms
+        self.assertEqual([n.rule_id for n in collector.slowest(2)], ["slow", "mid"])
+
+    def test_export_json_and_csv(self):
+        collector = MetricsCollector(table_row_count=3)
+        with collector.node("R-1"):
+            with collector.node("R-1#child"):
+                collector.record_sql(1.0, rows_scanned=3)
+
+        temp_dir = tempfile.mkdtemp()
+        try:
+            json_path = os.path.join(temp_dir, "metrics.json")
+            csv_path = os.path.join(temp_dir, "metrics.csv")
+            collector.export(json_path)
+            collector.export(csv_path)
+
+            with open(json_path) as f:
+                data = json.load(f)
+            with open(csv_path, newline="") as f:
+                rows = list(csv.DictReader(f))
+        finally:
+            shutil.rmtree(temp_dir, ignore_errors=True)
+
+        self.assertEqual(data["summary"]["rows_scanned"], 3)
+        self.assertEqual(data["nodes"][0]["children"][0]["rule_id"], "R-1#child")
+        self.assertEqual(tuple(rows[0].keys()), CSV_FIELDS)
+        self.assertEqual([r["depth"] for r in rows], ["0", "1"])
+        self.assertEqual(rows[1]["parent_rule_id"], "R-1")
+
+
+class TestRowsScannedMeasured(unittest.TestCase):
+    def test_capped_counts_scan_fewer_rows(self):
+        df, _ = generate_frame(20000, {"BilledCost-C-003-M": 0.5})
+        focus_data = df.to_pandas()
+        rows_scanned = {}
+        for limit in (None, 1):
+            spec_rules = _load_spec_rules(filter_rules="BilledCost")
+            metrics = MetricsCollector(table_row_count=len(focus_data))
+            spec_rules.validate(
+                focus_data=focus_data, metrics=metrics, violation_limit=limit
+            )
+            rows_scanned[limit] = {n.rule_id: n.rows_scanned for n in metrics.nodes}
+        # Counting every violation reads the whole table
+        self.assertEqual(rows_scanned[None]["BilledCost-C-003-M"], len(focus_data))
+        # Stopping at the first violation does not
+        self.assertLess(rows_scanned[1]["BilledCost-C-003-M"], len(focus_data))
+
+
+class TestCheckSeconds(unittest.TestCase):
+    def test_check_times_without_metrics_collector(self):
+        spec_rules = _load_spec_rules(filter_rules="BilledCost")
+        focus_data = pd.DataFrame({"BilledCost": [1.0, None]})
+        check_seconds = []
+        results = spec_rules.validate(
+            focus_data=focus_data, check_seconds=check_seconds
+        )
+        self.assertIsNone(results.metrics)
+        self.assertEqual(len(check_seconds), len(results.by_idx))
+        self.assertTrue(all(seconds >= 0 for _, seconds in check_seconds))
+        self.assertIn("column_presence", {check for check, _ in check_seconds})
+
+
+class TestSpecRulesMetrics(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        spec_rules = _load_spec_rules()
+        cls.focus_data = pd.DataFrame(
+            {
+                "BillingAccountId": ["a", "b"],
+                "ChargeType": ["Usage", "Usage"],
+                "BilledCost": [1.0, 2.0],
+            }
+        )
+        cls.metrics = MetricsCollector(table_row_count=len(cls.focus_data))
+        cls.results = spec_rules.validate(
+            focus_data=cls.focus_data, metrics=cls.metrics
+        )
+
+    def test_every_plan_node_is_measured(self):
+        self.assertIs(self.results.metrics, self.metrics)
+        self.assertEqual(len(self.metrics.nodes), len(self.results.by_idx))
+        kinds = {n.kind for n in self.metrics.nodes}
+        self.assertIn("leaf", kinds)
+        self.assertTrue(any(n.sql_queries for n in self.metrics.nodes))
+        self.assertTrue(all(n.exec_ms >= 0 for n in self.metrics.nodes))
+
+    def test_rows_scanned_is_measured_per_query(self):
+        summary = self.metrics.summary()
+        self.assertGreater(summary["rows_scanned"], 0)
+        for node in self.metrics.nodes:
+            self.assertLessEqual(
+                node.rows_scanned, node.sql_queries * len(self.focus_data)
+            )
+
+    def test_console_prints_slowest_rules(self):
+        out = io.StringIO()
+        with redirect_stdout(out):
+            ConsoleOutputter(output_destination=None).write(self.results)
+        self.assertIn("Top 20 Slowest Rules", out.getvalue())
+
+
+if __name__ == "__main__":
+    unittest.main()
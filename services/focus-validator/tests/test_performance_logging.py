@@ -0,0 +1,118 @@
+"""Tests for phase timers, memory tracking and the per-run performance report."""
+
+import json
+import os
+import shutil
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from focus_validator.utils import performance_logging, tracing
+from focus_validator.utils.performance_logging import (
+    logPerformance,
+    performance_session,
+    perfLogger,
+    trackPhase,
+)
+from focus_validator.validator import Validator
+
+
+@logPerformance("test.allocate")
+def allocate(size):
+    return bytearray(size)
+
+
+@logPerformance("test.fail")
+def fail():
+    raise RuntimeError("boom")
+
+
+class TestPerformanceReport(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_off_calls_straight_through(self):
+        with patch.object(perfLogger, "disabled", True), patch.object(
+            performance_logging, "PerformanceTracker"
+        ) as tracker:
+            self.assertEqual(len(allocate(10)), 10)
+            with trackPhase("test.block"):
+                pass
+        tracker.assert_not_called()
+        self.assertIsNone(performance_logging.get_report())
+
+    def test_nested_phases_record_time_and_python_peak(self):
+        path = os.path.join(self.temp_dir, "perf.json")
+        with performance_session(path) as report:
+            with trackPhase("test.outer", rows=3):
+                allocate(4 * 1024 * 1024)
+
+        outer, inner = report.phases
+        self.assertEqual((outer.operation, outer.depth), ("test.outer", 0))
+        self.assertEqual((inner.operation, inner.depth), ("test.allocate", 1))
+        self.assertEqual(outer.context, {"rows": 3})
+        self.assertEqual(inner.context["result_size"], 4 * 1024 * 1024)
+        self.assertGreaterEqual(inner.peak_python_bytes, 4 * 1024 * 1024)
+        self.assertGreaterEqual(outer.peak_python_bytes, inner.peak_python_bytes)
+        self.assertGreaterEqual(outer.wall_ms, inner.wall_ms)
+        self.assertGreaterEqual(outer.peak_rss_delta_bytes, inner.peak_rss_delta_bytes)
+
+        with open(path) as f:
+            data = json.load(f)
+        self.assertEqual(data["summary"]["phases"], 2)
+        self.assertGreater(data["summary"]["peak_rss_bytes"], 0)
+        self.assertEqual(data["summary"]["wall_ms"], outer.wall_ms)
+        self.assertIn("test.allocate", report.format_table())
+
+    def test_error_marks_phase(self):
+        with performance_session(trace_python_memory=False) as report:
+            with self.assertRaises(RuntimeError):
+                fail()
+        self.assertEqual(report.phases[0].status, "error")
+        self.assertEqual(report.phases[0].peak_python_bytes, 0)
+        self.assertIsNone(performance_logging.get_report())
+
+    def test_tracing_and_report_together(self):
+        with tracing.trace_session() as tracer, performance_session() as report:
+            allocate(10)
+        self.assertEqual([s.name for s in tracer.spans], ["test.allocate"])
+        self.assertEqual(tracer.spans[0].attributes["result_size"], 10)
+        self.assertEqual([p.operation for p in report.phases], ["test.allocate"])
+
+
+class TestValidatorPerformanceReport(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_validate_writes_phase_report(self):
+        path = os.path.join(self.temp_dir, "perf.json")
+        validator = Validator(
+            data_filename="tests/samples/all_pass_0.5.csv",
+            output_destination=os.path.join(self.temp_dir, "out.xml"),
+            output_type="unittest",
+            rules_version="1.2",
+            focus_dataset="CostAndUsage",
+            rules_block_remote_download=True,
+            performance_output=path,
+        )
+        validator.validate()
+
+        with open(path) as f:
+            data = json.load(f)
+        operations = [p["operation"] for p in data["phases"]]
+        self.assertEqual(operations[0], "validator.validate")
+        for phase in ("validator.load", "validator.execute", "validator.output"):
+            self.assertIn(phase, operations)
+        self.assertEqual(
+            validator.performance_report.summary()["phases"], len(operations)
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,52 @@
+"""Tests for the in-process Prometheus metrics registry."""
+
+import unittest
+
+from focus_validator.utils.prometheus import Registry
+
+
+class TestRegistry(unittest.TestCase):
+    def setUp(self):
+        self.registry = Registry()
+
+    def test_counter_and_gauge_exposition(self):
+        requests = self.registry.counter("requests_total", "Requests", ["outcome"])
+        in_flight = self.registry.gauge("in_flight", "Running jobs")
+        requests.inc(outcome="valid")
+        requests.inc(2, outcome='say "hi"\n')
+        with in_flight.track():
+            self.assertEqual(in_flight.value(), 1)
+
+        text = self.registry.render()
+        self.assertIn("# HELP requests_total Requests\n# TYPE requests_total counter\n", text)
+        self.assertIn('requests_total{outcome="valid"} 1\n', text)
+        self.assertIn('requests_total{outcome="say \\"hi\\"\\n"} 2\n', text)
+        self.assertIn("# TYPE in_flight gauge\nin_flight 0\n", text)
+
+    def test_histogram_buckets_are_cumulative(self):
+        latency = self.registry.histogram(
+            "latency_seconds", "Latency", ["phase"], buckets=(0.1, 1.0)
+        )
+        for value in (0.05, 0.1, 0.5, 3.0):
+            latency.observe(value, phase="load")
+
+        text = self.registry.render()
+        self.assertIn('latency_seconds_bucket{phase="load",le="0.1"} 2\n', text)
+        self.assertIn('latency_seconds_bucket{phase="load",le="1"} 3\n', text)
+        self.assertIn('latency_seconds_bucket{phase="load",le="+Inf"} 4\n', text)
+        self.assertIn('latency_seconds_sum{phase="load"} 3.65\n', text)
+        self.assertIn('latency_seconds_count{phase="load"} 4\n', text)
+        self.assertEqual(latency.count(phase="load"), 4)
+
+    def test_invalid_usage_rejected(self):
+        counter = self.registry.counter("jobs_total", "Jobs", ["outcome"])
+        with self.assertRaises(ValueError):
+            counter.inc(phase="load")
+        with self.assertRaises(ValueError):
+            counter.inc(-1, outcome="valid")
+        with self.assertRaises(ValueError):
+            self.registry.counter("jobs_total", "Jobs again")
+
+
+if __name__ == "__main__":
+    unittest.main()
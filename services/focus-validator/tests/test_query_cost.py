@@ -0,0 +1,133 @@
+"""Tests for EXPLAIN-based query cost estimation."""
+
+import io
+import os
+import shutil
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+
+import polars as pl
+
+from focus_validator.rules.spec_rules import SpecRules
+from focus_validator.utils.query_cost import CostReport, RuleCost, data_file_shape
+from focus_validator.validator import Validator
+
+
+class TestDataFileShape(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.df = pl.DataFrame(
+            {"BilledCost": [1.0, 2.0, 3.0], "ServiceName": ["a", "b", "c"]}
+        )
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_csv_parquet_and_arrow(self):
+        paths = {
+            "data.csv": self.df.write_csv,
+            "data.parquet": self.df.write_parquet,
+            "data.arrow": self.df.write_ipc,
+        }
+        for name, write in paths.items():
+            path = os.path.join(self.temp_dir, name)
+            write(path)
+            with self.subTest(name=name):
+                columns, rows = data_file_shape(path)
+                self.assertEqual(columns, ["BilledCost", "ServiceName"])
+                self.assertEqual(rows, 3)
+
+    def test_csv_without_trailing_newline(self):
+        path = os.path.join(self.temp_dir, "data.csv")
+        with open(path, "w") as f:
+            f.write("BilledCost,ServiceName\n1.0,a\n2.0,b")
+        self.assertEqual(data_file_shape(path), (["BilledCost", "ServiceName"], 2))
+
+
+class TestCostReport(unittest.TestCase):
+    def test_layers_and_ranking(self):
+        report = CostReport(
+            100,
+            {
+                "A": RuleCost("A", layer=0, queries=1, estimated_rows=10),
+                "B": RuleCost("B", layer=0, queries=2, estimated_rows=50),
+                "C": RuleCost("C", layer=1, queries=1, estimated_rows=5, errors=["x"]),
+            },
+        )
+        self.assertEqual([c.rule_id for c in report.most_expensive(2)], ["B", "A"])
+        self.assertEqual(report.estimated_cost("C"), 5)
+        self.assertIsNone(report.estimated_cost("missing"))
+        layers = report.layers()
+        self.assertEqual([e["estimated_rows"] for e in layers], [60, 5])
+        self.assertEqual([e["queries"] for e in layers], [3, 1])
+        self.assertIn("Could not plan 1 rules: C", report.format_table())
+
+
+class TestEstimateCosts(unittest.TestCase):
+    def test_estimates_cover_plan_without_data(self):
+        spec_rules = SpecRules(
+            rule_set_path="focus_validator/rules",
+            rules_file_prefix="model-",
+            rules_version="1.2",
+            rules_file_suffix=".json",
+            focus_dataset="CostAndUsage",
+            filter_rules=None,
+            rules_force_remote_download=False,
+            allow_draft_releases=False,
+            allow_prerelease_releases=False,
+            column_namespace=None,
+            rules_block_remote_download=True,
+        )
+        spec_rules.load_rules()
+        report = spec_rules.estimate_costs(1_000_000)
+
+        self.assertIs(spec_rules.cost_estimates, report)
+        self.assertEqual(len(report.rules), len(spec_rules.plan.nodes))
+        costed = [c for c in report.rules.values() if c.queries]
+        self.assertGreater(len(costed), 100)
+        self.assertFalse([c.rule_id for c in costed if c.errors])
+        scanning = [c for c in costed if c.scan_rows >= 1_000_000]
+        self.assertGreater(len(scanning), len(costed) // 2)
+        self.assertEqual(
+            sum(e["estimated_rows"] for e in report.layers()),
+            sum(c.estimated_rows for c in report.rules.values()),
+        )
+
+    def test_validator_explain_with_row_count(self):
+        validator = Validator(
+            data_filename=None,
+            output_type="console",
+            output_destination=None,
+            rules_version="1.2",
+            focus_dataset="CostAndUsage",
+            rules_block_remote_download=True,
+            explain_mode=True,
+            explain_rows=1000,
+        )
+        sql_map = validator.explain()
+        self.assertIsNotNone(validator.cost_report)
+        self.assertEqual(validator.cost_report.row_count, 1000)
+
+        out = io.StringIO()
+        with redirect_stdout(out):
+            validator.print_sql_explanations(sql_map)
+        self.assertIn("Estimated cost:", out.getvalue())
+
+    def test_validator_needs_rows_or_file(self):
+        validator = Validator(
+            data_filename="-",
+            output_type="console",
+            output_destination=None,
+            rules_version="1.2",
+            focus_dataset="CostAndUsage",
+            rules_block_remote_download=True,
+            explain_mode=True,
+            explain_cost=True,
+        )
+        with self.assertRaises(ValueError):
+            validator.explain()
+
+
+if __name__ == "__main__":
+    unittest.main()
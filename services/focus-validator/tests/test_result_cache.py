@@ -0,0 +1,133 @@
+"""Tests for the per-rule result cache."""
+
+import json
+import os
+import shutil
+import tempfile
+import unittest
+
+import pandas as pd
+import polars as pl
+
+from focus_validator.benchmarks.synthetic import generate_frame
+from focus_validator.config_objects.result_cache import ResultCache
+from focus_validator.validator import Validator
+
+
+class TestResultCache(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_key_depends_only_on_referenced_columns(self):
+        cache = ResultCache(self.temp_dir)
+        cache.column_fingerprints = {"billedcost": "a", "resourceid": "b"}
+        sql = "SELECT COUNT(*) FROM focus_data WHERE BilledCost IS NULL"
+        key = cache.key(sql, {})
+
+        cache.column_fingerprints["resourceid"] = "changed"
+        self.assertEqual(cache.key(sql, {}), key)
+        cache.column_fingerprints["billedcost"] = "changed"
+        self.assertNotEqual(cache.key(sql, {}), key)
+        self.assertNotEqual(cache.key(sql, {"rule_id": "X"}), cache.key(sql, {}))
+
+    def test_hits_are_copies_and_persist(self):
+        cache = ResultCache(self.temp_dir)
+        self.assertIsNone(cache.get("k"))
+        cache.put("k", False, {"violations": 3})
+        ok, details = cache.get("k")
+        details["violations"] = 0
+        self.assertEqual((ok, cache.get("k")[1]["violations"]), (False, 3))
+        cache.save()
+
+        reloaded = ResultCache(self.temp_dir)
+        self.assertEqual(reloaded.get("k"), (False, {"violations": 3, "cached": True}))
+
+    def test_least_recently_used_entries_evicted(self):
+        cache = ResultCache(self.temp_dir, max_entries=2)
+        for key in ("a", "b", "c"):
+            cache.put(key, True, {})
+        cache.get("a")
+        cache.save()
+        self.assertEqual(set(ResultCache(self.temp_dir).entries), {"a", "c"})
+
+    def test_samples_round_trip_without_pickle(self):
+        samples = pd.DataFrame({"BilledCost": [-1.5, -2.0]})
+        cache = ResultCache(self.temp_dir)
+        cache.put("k", False, {"violations": 2, "failure_cases": samples})
+        cache.save()
+        with open(cache.path, encoding="utf-8") as f:
+            json.load(f)
+
+        _, details = ResultCache(self.temp_dir).get("k")
+        pd.testing.assert_frame_equal(details["failure_cases"], samples)
+
+    def test_evicted_samples_are_removed(self):
+        cache = ResultCache(self.temp_dir, max_entries=1)
+        cache.put("a", False, {"failure_cases": pd.DataFrame({"x": [1]})})
+        cache.put("b", False, {"failure_cases": pd.DataFrame({"x": [2]})})
+        cache.get("b")
+        cache.save()
+        self.assertEqual(os.listdir(cache.frame_dir), ["b-0.arrow"])
+
+
+class TestCachedValidation(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.temp_dir = tempfile.mkdtemp()
+        cls.data_path = os.path.join(cls.temp_dir, "faulty.parquet")
+        cls.cache_dir = os.path.join(cls.temp_dir, "cache")
+        cls.df, _ = generate_frame(
+            300, {"BilledCost-C-003-M": 0.1, "ResourceId-C-002-M": 0.05}
+        )
+        cls.df.write_parquet(cls.data_path)
+
+    @classmethod
+    def tearDownClass(cls):
+        shutil.rmtree(cls.temp_dir, ignore_errors=True)
+
+    def _validate(self, result_cache_dir=None):
+        validator = Validator(
+            data_filename=self.data_path,
+            output_type="unittest",
+            output_destination=os.path.join(self.temp_dir, "results.xml"),
+            rules_version="1.2",
+            focus_dataset="CostAndUsage",
+            rules_block_remote_download=True,
+            result_cache_dir=result_cache_dir,
+        )
+        outcomes = {
+            rule_id: (entry["ok"], entry["details"].get("violations"))
+            for rule_id, entry in validator.validate().by_rule_id.items()
+        }
+        return outcomes, validator.result_cache
+
+    def test_unchanged_data_reuses_results_and_edits_invalidate_columns(self):
+        expected, _ = self._validate()
+        first, cache = self._validate(self.cache_dir)
+        self.assertEqual(first, expected)
+        self.assertGreater(cache.misses, 0)
+
+        second, cache = self._validate(self.cache_dir)
+        self.assertEqual(second, expected)
+        self.assertEqual(cache.misses, 0)
+
+        edited = self.df.with_columns(
+            pl.lit(None, dtype=pl.Float64).alias("BilledCost")
+        )
+        edited.write_parquet(self.data_path)
+        try:
+            expected, _ = self._validate()
+            third, cache = self._validate(self.cache_dir)
+        finally:
+            self.df.write_parquet(self.data_path)
+        self.assertEqual(third, expected)
+        # Only the rules reading BilledCost ran again
+        self.assertGreater(cache.misses, 0)
+        self.assertGreater(cache.hits, 10 * cache.misses)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,124 @@
+"""Tests for sampled validation with exact escalation."""
+
+import os
+import shutil
+import tempfile
+import unittest
+
+from focus_validator.benchmarks.synthetic import generate_frame
+from focus_validator.config_objects.focus_to_duckdb_converter import is_row_local
+from focus_validator.utils.sampling import sample_clause, wilson_interval
+from focus_validator.validator import Validator
+
+
+class TestSampleClause(unittest.TestCase):
+    def test_row_count_and_percentage(self):
+        self.assertIn("reservoir(500 ROWS)", sample_clause("500"))
+        self.assertIn("2.5 PERCENT (bernoulli", sample_clause("2.5%"))
+
+    def test_invalid_sizes_rejected(self):
+        for size in ("0", "-5", "1.5", "0%", "101%", "lots"):
+            with self.subTest(size=size), self.assertRaises(ValueError):
+                sample_clause(size)
+
+
+class TestWilsonInterval(unittest.TestCase):
+    def test_zero_violations_has_positive_upper_bound(self):
+        lower, upper = wilson_interval(0, 1000)
+        self.assertEqual(lower, 0.0)
+        self.assertAlmostEqual(upper, 0.00383, places=4)
+
+    def test_interval_contains_estimate(self):
+        lower, upper = wilson_interval(50, 1000)
+        self.assertLess(lower, 0.05)
+        self.assertGreater(upper, 0.05)
+        self.assertAlmostEqual(lower, 0.0382, places=3)
+        self.assertAlmostEqual(upper, 0.0653, places=3)
+
+    def test_unsupported_confidence_rejected(self):
+        with self.assertRaises(ValueError):
+            wilson_interval(1, 10, confidence=0.8)
+
+
+class TestIsRowLocal(unittest.TestCase):
+    def test_cross_row_checks_excluded(self):
+        leaf = "WITH invalid AS (SELECT 1 FROM {table_name} WHERE x IS NULL) SELECT COUNT(*) AS violations FROM invalid"
+        self.assertTrue(is_row_local("type_string", leaf))
+        self.assertFalse(is_row_local("distinct_count", leaf))
+        self.assertFalse(is_row_local("column_presence", leaf))
+        grouped = "WITH counts AS (SELECT a FROM {table_name} GROUP BY a) SELECT COUNT(*) AS violations FROM counts"
+        self.assertFalse(is_row_local("check_value", grouped))
+
+
+class TestSampledValidation(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.temp_dir = tempfile.mkdtemp()
+        cls.data_path = os.path.join(cls.temp_dir, "faulty.parquet")
+        df, cls.injected = generate_frame(
+            2000,
+            {"BilledCost-C-003-M": 0.05, "ResourceId-C-002-M": 0.02},
+        )
+        df.write_parquet(cls.data_path)
+        cls.exact = cls._validate(None)
+        cls.sampled = cls._validate("500")
+
+    @classmethod
+    def tearDownClass(cls):
+        shutil.rmtree(cls.temp_dir, ignore_errors=True)
+
+    @classmethod
+    def _validate(cls, sample):
+        validator = Validator(
+            data_filename=cls.data_path,
+            output_type="unittest",
+            output_destination=os.path.join(cls.temp_dir, f"{sample}.xml"),
+            rules_version="1.2",
+            focus_dataset="CostAndUsage",
+            rules_block_remote_download=True,
+            sample=sample,
+        )
+        return validator.validate().by_rule_id
+
+    def test_outcomes_match_exact_validation(self):
+        self.assertEqual(
+            {rid: entry["ok"] for rid, entry in self.sampled.items()},
+            {rid: entry["ok"] for rid, entry in self.exact.items()},
+        )
+
+    def test_violating_rules_escalate_to_exact_counts(self):
+        for rule_id, injected in self.injected.items():
+            details = self.sampled[rule_id]["details"]
+            self.assertEqual(details["violations"], injected)
+            self.assertTrue(details["sample"]["escalated"])
+            self.assertGreater(details["sample"]["violations"], 0)
+
+    def test_passing_rules_report_confidence_bounds(self):
+        sampled = [
+            entry["details"]
+            for entry in self.sampled.values()
+            if "sample" in entry["details"] and not entry["details"]["sample"]["escalated"]
+        ]
+        self.assertTrue(sampled)
+        for details in sampled:
+            self.assertEqual(details["rows_checked"], 500)
+            self.assertEqual(details["sample"]["rate_lower"], 0.0)
+            self.assertGreater(details["sample"]["rate_upper"], 0.0)
+
+    def test_cross_row_rules_run_exactly(self):
+        for entry in self.sampled.values():
+            if entry["details"].get("check_type") in ("distinct_count", "column_presence"):
+                self.assertNotIn("sample", entry["details"])
+
+    def test_invalid_sample_rejected(self):
+        with self.assertRaises(ValueError):
+            Validator(
+                data_filename=self.data_path,
+                output_type="console",
+                output_destination=None,
+                sample="half",
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,166 @@
+"""Tests for the fused count-and-sample queries behind --show-violations."""
+
+import importlib
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+
+from focus_validator.benchmarks.show_violations import PROFILES, run_benchmark
+from focus_validator.benchmarks.synthetic import generate_frame
+from focus_validator.config_objects.focus_to_duckdb_converter import (
+    SAMPLE_ROW_COLUMN,
+    VALUE_COLUMN,
+    fused_top_values_sql,
+    violation_sample_sql,
+)
+from focus_validator.validator import Validator
+
+
+def _real_duckdb():
+    # Another test module replaces duckdb in sys.modules with a mock
+    module = sys.modules.get("duckdb")
+    if module is not None and hasattr(module, "_mock_name"):
+        del sys.modules["duckdb"]
+    return importlib.import_module("duckdb")
+
+
+LEAF_SQL = """
+WITH invalid AS (
+    SELECT 1
+    FROM {table_name}
+    WHERE BilledCost IS NULL AND ChargeCategory = 'Usage'
+)
+SELECT COUNT(*) AS violations,
+    CASE WHEN COUNT(*) > 0 THEN 'BilledCost is bad' END AS error_message
+FROM invalid
+"""
+
+
+class TestFusedSql(unittest.TestCase):
+    columns = ["BilledCost", "ChargeCategory", "ResourceId"]
+
+    def test_top_values_come_from_the_count_scan(self):
+        fused = fused_top_values_sql(LEAF_SQL, self.columns, ["billedcost"], 5)
+        self.assertIn(f'SELECT "BilledCost" AS {VALUE_COLUMN}, 1', fused)
+        self.assertIn(f"GROUP BY GROUPING SETS ((), ({VALUE_COLUMN}))", fused)
+        self.assertIn("'BilledCost is bad' END AS error_message\n", fused)
+        self.assertNotIn("invalid AS MATERIALIZED", fused)
+        self.assertIn("LIMIT 5", fused)
+        self.assertEqual(fused.count("{table_name}"), 1)
+
+        # Several value columns are counted as one struct
+        fused = fused_top_values_sql(
+            LEAF_SQL, self.columns, ["BilledCost", "ChargeCategory"], 5
+        )
+        self.assertIn(
+            'struct_pack("BilledCost" := "BilledCost", '
+            f'"ChargeCategory" := "ChargeCategory") AS {VALUE_COLUMN}',
+            fused,
+        )
+
+    def test_sample_stops_at_the_limit(self):
+        sample = violation_sample_sql(LEAF_SQL, self.columns, 2)
+        self.assertIn(
+            'struct_pack("BilledCost" := "BilledCost", '
+            f'"ChargeCategory" := "ChargeCategory") AS {SAMPLE_ROW_COLUMN}, 1',
+            sample,
+        )
+        self.assertNotIn("ResourceId", sample)
+        self.assertNotIn("MATERIALIZED", sample)
+        self.assertIn("FROM invalid LIMIT 2)", sample)
+
+    def test_queries_run_in_duckdb(self):
+        conn = _real_duckdb().connect()
+        conn.execute(
+            "CREATE TABLE t AS SELECT CASE WHEN i % 4 = 0 THEN 1.0 END AS BilledCost, "
+            "'Usage' AS ChargeCategory, 'r' || i AS ResourceId FROM range(100) r(i)"
+        )
+        leaf = LEAF_SQL.replace("{table_name}", "t")
+        fused = fused_top_values_sql(leaf, self.columns, ["ResourceId"], 3)
+        self.assertIsNone(fused)
+        fused = fused_top_values_sql(leaf, self.columns, ["BilledCost"], 3)
+        self.assertEqual(
+            conn.execute(fused).fetchall(),
+            [(75, "BilledCost is bad", [{"value": None, "count": 75}])],
+        )
+        passing = leaf.replace("IS NULL", "IS NULL AND BilledCost > 0")
+        fused = fused_top_values_sql(passing, self.columns, ["BilledCost"], 3)
+        self.assertEqual(conn.execute(fused).fetchall(), [(0, None, None)])
+        (rows,) = conn.execute(violation_sample_sql(leaf, self.columns, 2)).fetchone()
+        self.assertEqual(rows, [{"BilledCost": None, "ChargeCategory": "Usage"}] * 2)
+
+    def test_other_shapes_are_not_fused(self):
+        self.assertIsNone(
+            fused_top_values_sql("SELECT COUNT(*) FROM {table_name}", ["a"], ["a"], 5)
+        )
+        self.assertIsNone(fused_top_values_sql(LEAF_SQL, self.columns, [], 5))
+        self.assertIsNone(fused_top_values_sql(LEAF_SQL, self.columns, ["Other"], 5))
+        self.assertIsNone(violation_sample_sql(LEAF_SQL, ["Other"], 2))
+
+
+class TestShowViolations(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.temp_dir = tempfile.mkdtemp()
+        cls.data_path = os.path.join(cls.temp_dir, "faulty.parquet")
+        df, _ = generate_frame(
+            300, {"BilledCost-C-003-M": 0.1, "ResourceId-C-002-M": 0.05}
+        )
+        df.write_parquet(cls.data_path)
+
+    @classmethod
+    def tearDownClass(cls):
+        shutil.rmtree(cls.temp_dir, ignore_errors=True)
+
+    def _validate(self, show_violations):
+        return Validator(
+            data_filename=self.data_path,
+            output_type="unittest",
+            output_destination=os.path.join(self.temp_dir, "results.xml"),
+            rules_version="1.2",
+            focus_dataset="CostAndUsage",
+            rules_block_remote_download=True,
+            show_violations=show_violations,
+        ).validate()
+
+    def test_samples_and_frequent_values_without_changing_results(self):
+        expected = self._validate(False).by_rule_id
+        results = self._validate(True).by_rule_id
+        for rule_id, entry in results.items():
+            baseline = expected[rule_id]
+            self.assertEqual(
+                (entry["ok"], entry["details"].get("violations")),
+                (baseline["ok"], baseline["details"].get("violations")),
+                rule_id,
+            )
+
+        billed = results["BilledCost-C-003-M"]["details"]
+        self.assertEqual(billed["failure_cases"].shape[0], 2)
+        self.assertIn("BilledCost", billed["failure_cases"].columns)
+        self.assertEqual(billed["top_violating_values"], [{"value": None, "count": 30}])
+
+        resource = results["ResourceId-C-002-M"]["details"]
+        counts = [entry["count"] for entry in resource["top_violating_values"]]
+        self.assertEqual(len(counts), 5)
+        self.assertEqual(counts, sorted(counts, reverse=True))
+        self.assertLessEqual(sum(counts), resource["violations"])
+        # Passing rules carry no samples
+        self.assertNotIn(
+            "top_violating_values", results["BilledCost-C-001-M"]["details"]
+        )
+
+
+class TestShowViolationsBenchmark(unittest.TestCase):
+    def test_every_profile_is_timed_with_and_without_samples(self):
+        results = run_benchmark(rows=[200], repeat=1)
+
+        self.assertEqual([r["profile"] for r in results], list(PROFILES))
+        for record in results:
+            self.assertEqual(set(record["seconds"]), {"plain", "show_violations"})
+            self.assertGreater(record["seconds"]["plain"], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
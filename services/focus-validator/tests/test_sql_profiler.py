@@ -0,0 +1,83 @@
+"""Tests for DuckDB query-profile capture."""
+
+import json
+import os
+import shutil
+import tempfile
+import unittest
+
+import pandas as pd
+
+from focus_validator.rules.spec_rules import SpecRules
+from focus_validator.utils.sql_profiler import SUMMARY_JSON, SUMMARY_TEXT, SQLProfiler
+
+
+class TestSQLProfiler(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.temp_dir = tempfile.mkdtemp()
+        spec_rules = SpecRules(
+            rule_set_path="focus_validator/rules",
+            rules_file_prefix="model-",
+            rules_version="1.2",
+            rules_file_suffix=".json",
+            focus_dataset="CostAndUsage",
+            filter_rules=None,
+            rules_force_remote_download=False,
+            allow_draft_releases=False,
+            allow_prerelease_releases=False,
+            column_namespace=None,
+            rules_block_remote_download=True,
+        )
+        spec_rules.load_rules()
+        focus_data = pd.DataFrame(
+            {
+                "BillingAccountId": ["a", "b"],
+                "ChargeType": ["Usage", "Usage"],
+                "BilledCost": [1.0, 2.0],
+            }
+        )
+        cls.profiler = SQLProfiler(cls.temp_dir, top_operators=5)
+        cls.results = spec_rules.validate(
+            focus_data=focus_data, sql_profiler=cls.profiler
+        )
+        cls.bundle = cls.profiler.finish()
+
+    @classmethod
+    def tearDownClass(cls):
+        shutil.rmtree(cls.temp_dir, ignore_errors=True)
+
+    def test_bundle_has_profile_per_query(self):
+        self.assertEqual(os.path.dirname(self.bundle), self.temp_dir)
+        self.assertGreater(len(self.profiler.queries), 0)
+        for query in self.profiler.queries:
+            with open(os.path.join(self.bundle, query["profile"])) as f:
+                profile = json.load(f)
+            self.assertIn("children", profile)
+            self.assertIn(query["rule_id"], self.results.by_rule_id)
+
+    def test_summary_ranks_operators(self):
+        with open(os.path.join(self.bundle, SUMMARY_JSON)) as f:
+            summary = json.load(f)
+        self.assertEqual(summary["queries"], len(self.profiler.queries))
+        self.assertEqual(len(summary["top_operators"]), 5)
+        timings = [op["timing_ms"] for op in summary["top_operators"]]
+        self.assertEqual(timings, sorted(timings, reverse=True))
+        operators = {e["operator"] for e in summary["operators_by_type"]}
+        self.assertIn("FILTER [regex]", operators)
+        with open(os.path.join(self.bundle, SUMMARY_TEXT)) as f:
+            self.assertIn("Most expensive operators", f.read())
+
+    def test_profiling_does_not_change_results(self):
+        # Profiling setup must never surface as a rule failure
+        for rule_id, result in self.results.by_rule_id.items():
+            details = result.get("details", {})
+            self.assertNotIn("Profiler", str(details.get("error", "")), rule_id)
+
+    def test_each_run_gets_new_bundle(self):
+        other = SQLProfiler(self.temp_dir)
+        self.assertNotEqual(other.bundle_dir, self.bundle)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,105 @@
+"""Tests for the vectorized synthetic FOCUS data generator."""
+
+import json
+import os
+import shutil
+import tempfile
+import unittest
+
+import polars as pl
+
+from focus_validator.benchmarks.synthetic import (
+    FAULTS,
+    MANIFEST_FILE,
+    clean_frame,
+    expected_violations,
+    generate_frame,
+    uniform_rates,
+    write_dataset,
+)
+from focus_validator.validator import Validator
+
+
+class TestSyntheticGenerator(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_clean_frame_shape_and_types(self):
+        df = clean_frame(100, offset=500)
+        self.assertEqual(df.shape, (100, 57))
+        self.assertEqual(df["ChargePeriodStart"].dtype, pl.Datetime("us", "UTC"))
+        self.assertEqual(df["SkuId"][0], "SKU000500")
+        self.assertEqual(df["BilledCost"].null_count(), 0)
+
+    def test_faults_are_exact_and_disjoint(self):
+        rates = uniform_rates(0.03)
+        df, counts = generate_frame(1000, rates, seed=7)
+
+        self.assertEqual(counts, {rule_id: 30 for rule_id in FAULTS})
+        self.assertEqual(df["BilledCost"].null_count(), 30)
+        self.assertEqual((df["ListUnitPrice"] < 0).sum(), 30)
+        self.assertEqual((df["BillingCurrency"] != "USD").sum(), 30)
+        corrupted = df.select(
+            pl.sum_horizontal(
+                pl.col("BilledCost").is_null(),
+                pl.col("ServiceName").is_null(),
+                pl.col("ListUnitPrice") < 0,
+            )
+        ).to_series()
+        self.assertEqual(corrupted.max(), 1)
+
+    def test_invalid_rates_rejected(self):
+        with self.assertRaises(ValueError):
+            generate_frame(10, {"Unknown-C-001-M": 0.1})
+        with self.assertRaises(ValueError):
+            generate_frame(10, uniform_rates(0.5))
+
+    def test_partitioned_dataset_matches_expected_counts(self):
+        rates = {"BilledCost-C-003-M": 0.01, "ResourceId-C-002-M": 0.005}
+        for fmt, ext in (("csv", ".csv"), ("parquet", ".parquet"), ("arrow", ".arrow")):
+            with self.subTest(fmt=fmt):
+                out_dir = os.path.join(self.temp_dir, fmt)
+                manifest = write_dataset(out_dir, 2500, fmt, partition_rows=1000, rates=rates)
+
+                files = sorted(f for f in os.listdir(out_dir) if f.endswith(ext))
+                self.assertEqual(files, [f"part-0000{i}{ext}" for i in range(3)])
+                self.assertEqual(
+                    manifest["expected_violations"],
+                    expected_violations(2500, rates, partition_rows=1000),
+                )
+                with open(os.path.join(out_dir, MANIFEST_FILE)) as f:
+                    self.assertEqual(json.load(f)["rows"], 2500)
+
+        parts = pl.read_parquet(os.path.join(self.temp_dir, "parquet", "*.parquet"))
+        self.assertEqual(len(parts), 2500)
+        self.assertEqual(parts["SkuId"].n_unique(), 2500)
+        self.assertEqual(
+            parts["BilledCost"].null_count(),
+            manifest["expected_violations"]["BilledCost-C-003-M"],
+        )
+
+    def test_validator_reports_injected_counts(self):
+        df, counts = generate_frame(1000, uniform_rates(0.01), seed=3)
+        path = os.path.join(self.temp_dir, "focus.parquet")
+        df.write_parquet(path)
+
+        results = Validator(
+            data_filename=path,
+            output_destination=os.path.join(self.temp_dir, "out.xml"),
+            output_type="unittest",
+            rules_version="1.2",
+            focus_dataset="CostAndUsage",
+            rules_block_remote_download=True,
+        ).validate()
+
+        for rule_id, count in counts.items():
+            with self.subTest(rule_id=rule_id):
+                details = results.by_rule_id[rule_id]["details"]
+                self.assertEqual(details["violations"], count)
+
+
+if __name__ == "__main__":
+    unittest.main()
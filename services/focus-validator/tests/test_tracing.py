@@ -0,0 +1,141 @@
+"""Tests for span tracing and Chrome trace export."""
+
+import json
+import os
+import shutil
+import tempfile
+import threading
+import unittest
+
+from focus_validator.utils import tracing
+from focus_validator.utils.performance_logging import logPerformance
+from focus_validator.validator import Validator
+
+
+class TestTracer(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.temp_dir, "trace.json")
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_spans_nest_and_export_as_chrome_trace(self):
+        with tracing.trace_session(self.path) as tracer:
+            with tracing.span("outer", rule_id="R-1"):
+                with tracing.span("inner") as inner:
+                    inner.set_attribute("violations", 3)
+
+        outer_span, inner_span = tracer.spans
+        self.assertIsNone(outer_span.parent_id)
+        self.assertEqual(inner_span.parent_id, outer_span.span_id)
+        self.assertEqual([s.name for s in tracer.critical_path()], ["outer", "inner"])
+
+        with open(self.path) as f:
+            trace = json.load(f)
+        events = {e["name"]: e for e in trace["traceEvents"] if e["ph"] == "X"}
+        self.assertEqual(events["outer"]["args"]["rule_id"], "R-1")
+        self.assertEqual(events["inner"]["args"]["violations"], 3)
+        self.assertGreaterEqual(events["inner"]["ts"], events["outer"]["ts"])
+        self.assertLessEqual(events["inner"]["dur"], events["outer"]["dur"])
+
+    def test_span_is_noop_when_tracing_off(self):
+        self.assertIsNone(tracing.get_tracer())
+        with tracing.span("ignored") as s:
+            self.assertIsNone(s)
+
+    def test_error_marks_span_and_trace_still_written(self):
+        with self.assertRaises(ValueError):
+            with tracing.trace_session(self.path) as tracer:
+                with tracing.span("failing"):
+                    raise ValueError("boom")
+        self.assertEqual(tracer.spans[0].status, "error")
+        self.assertTrue(os.path.exists(self.path))
+        self.assertIsNone(tracing.get_tracer())
+
+    def test_threads_have_separate_stacks(self):
+        def run_worker():
+            with tracing.span("worker"):
+                pass
+
+        with tracing.trace_session(self.path) as tracer:
+            with tracing.span("main"):
+                worker = threading.Thread(target=run_worker)
+                worker.start()
+                worker.join()
+        worker_span = [s for s in tracer.spans if s.name == "worker"][0]
+        self.assertIsNone(worker_span.parent_id)
+
+    def test_traced_decorator_records_attributes(self):
+        @tracing.traced(
+            "double",
+            attributes=lambda x: {"x": x},
+            result_attributes=lambda r: {"result": r},
+        )
+        def double(x):
+            return x * 2
+
+        with tracing.trace_session(self.path) as tracer:
+            self.assertEqual(double(4), 8)
+        self.assertEqual(tracer.spans[0].attributes, {"x": 4, "result": 8})
+
+    def test_log_performance_becomes_span(self):
+        @logPerformance("op.name")
+        def work():
+            return [1, 2]
+
+        with self.assertNoLogs("performance"):
+            with tracing.trace_session(self.path) as tracer:
+                work()
+        self.assertEqual(tracer.spans[0].name, "op.name")
+        self.assertEqual(tracer.spans[0].attributes["result_size"], 2)
+
+
+class TestValidatorTrace(unittest.TestCase):
+    def test_validate_writes_trace_with_pipeline_spans(self):
+        temp_dir = tempfile.mkdtemp()
+        try:
+            path = os.path.join(temp_dir, "trace.json")
+            data_file = os.path.join(temp_dir, "data.csv")
+            with open(data_file, "w") as f:
+                f.write("BillingAccountId,ChargeType,BilledCost\na,Usage,1.0\n")
+            validator = Validator(
+                data_filename=data_file,
+                output_destination=None,
+                output_type="unittest",
+                rule_set_path="focus_validator/rules",
+                rules_version="1.2",
+                focus_dataset="CostAndUsage",
+                filter_rules="BilledCost-C-001-M",
+                rules_block_remote_download=True,
+                trace_output=path,
+            )
+            validator.outputter.outputter.output_destination = os.path.join(
+                temp_dir, "out.xml"
+            )
+            validator.validate()
+            with open(path) as f:
+                events = json.load(f)["traceEvents"]
+        finally:
+            shutil.rmtree(temp_dir, ignore_errors=True)
+
+        names = {e["name"] for e in events}
+        for expected in (
+            "validator.validate",
+            "validator.load",
+            "json_loader.load_json_rules_with_dependencies_and_types",
+            "rule_dependency_resolver.collectDatasetRules",
+            "plan_builder.compile_validation_plan",
+            "converter.prepare",
+            "converter.build_check",
+            "converter.run_check",
+            "outputter.write",
+        ):
+            self.assertIn(expected, names)
+        run_checks = [e for e in events if e["name"] == "converter.run_check"]
+        self.assertTrue(all("violations" in e["args"] for e in run_checks))
+        self.assertTrue(any(e["args"]["rule_id"] for e in run_checks))
+
+
+if __name__ == "__main__":
+    unittest.main()
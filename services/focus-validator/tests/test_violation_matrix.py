@@ -0,0 +1,136 @@
+"""Tests for the row-level violation matrix (--violation-matrix)."""
+
+import os
+import shutil
+import tempfile
+import unittest
+from types import SimpleNamespace
+
+import polars as pl
+
+from focus_validator.benchmarks.synthetic import generate_frame
+from focus_validator.config_objects.focus_to_duckdb_converter import (
+    row_violation_predicate,
+)
+from focus_validator.validator import Validator
+
+
+def _leaf(predicate):
+    return SimpleNamespace(
+        checkType="format_string",
+        checkSql=f"WITH invalid AS (SELECT 1 FROM {{table_name}} WHERE {predicate}) "
+        "SELECT COUNT(*) AS violations FROM invalid",
+        meta={"violation_predicate": predicate},
+    )
+
+
+def _handler(name):
+    # Composites are told apart by their handler's name ("all" / "any")
+    def handler(oks):
+        return None
+
+    handler.__name__ = name
+    return handler
+
+
+class TestRowViolationPredicate(unittest.TestCase):
+    def test_leaf_uses_generator_predicate(self):
+        self.assertEqual(row_violation_predicate(_leaf("a IS NULL")), "a IS NULL")
+
+    def test_composites_combine_children(self):
+        children = [_leaf("a IS NULL"), _leaf("b < 0")]
+        and_check = SimpleNamespace(
+            nestedChecks=children, nestedCheckHandler=_handler("all")
+        )
+        or_check = SimpleNamespace(
+            nestedChecks=children, nestedCheckHandler=_handler("any")
+        )
+        self.assertEqual(
+            row_violation_predicate(and_check), "((a IS NULL) OR (b < 0))"
+        )
+        self.assertEqual(
+            row_violation_predicate(or_check), "((a IS NULL) AND (b < 0))"
+        )
+
+    def test_cross_row_checks_are_left_out(self):
+        leaf = _leaf("a IS NULL")
+        leaf.checkType = "distinct_count"
+        self.assertIsNone(row_violation_predicate(leaf))
+        composite = SimpleNamespace(
+            nestedChecks=[leaf, _leaf("b < 0")], nestedCheckHandler=_handler("all")
+        )
+        self.assertIsNone(row_violation_predicate(composite))
+
+
+class TestViolationMatrix(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.temp_dir = tempfile.mkdtemp()
+        cls.data_path = os.path.join(cls.temp_dir, "faulty.parquet")
+        cls.matrix_path = os.path.join(cls.temp_dir, "matrix.parquet")
+        cls.df, _ = generate_frame(
+            300, {"BilledCost-C-003-M": 0.1, "ResourceId-C-002-M": 0.05}
+        )
+        cls.df.write_parquet(cls.data_path)
+        cls.results = Validator(
+            data_filename=cls.data_path,
+            output_type="unittest",
+            output_destination=os.path.join(cls.temp_dir, "results.xml"),
+            rules_version="1.2",
+            focus_dataset="CostAndUsage",
+            rules_block_remote_download=True,
+            violation_matrix=cls.matrix_path,
+        ).validate()
+        cls.matrix = pl.read_parquet(cls.matrix_path)
+
+    @classmethod
+    def tearDownClass(cls):
+        shutil.rmtree(cls.temp_dir, ignore_errors=True)
+
+    def test_one_row_per_input_row(self):
+        self.assertEqual(
+            self.matrix.columns, ["row_index", "violated_rules", "failure_count"]
+        )
+        self.assertEqual(
+            self.matrix["row_index"].to_list(), list(range(self.df.height))
+        )
+        self.assertEqual(
+            self.matrix["failure_count"].to_list(),
+            self.matrix["violated_rules"].list.len().to_list(),
+        )
+
+    def test_rows_match_leaf_rule_counts(self):
+        per_rule = (
+            self.matrix.explode("violated_rules")
+            .drop_nulls("violated_rules")
+            .group_by("violated_rules")
+            .len()
+        )
+        counts = dict(zip(per_rule["violated_rules"], per_rule["len"]))
+        leaf_rules = 0
+        for rule_id, entry in self.results.by_rule_id.items():
+            details = entry["details"]
+            if "children" in details or details.get("skipped"):
+                continue
+            if rule_id in counts or entry["ok"]:
+                leaf_rules += 1
+                self.assertEqual(
+                    counts.get(rule_id, 0), details["violations"], rule_id
+                )
+        self.assertGreater(leaf_rules, 100)
+
+    def test_violating_rows_are_keyed_by_input_order(self):
+        flagged = self.matrix.filter(
+            pl.col("violated_rules").list.contains("BilledCost-C-003-M")
+        )["row_index"].to_list()
+        nulls = (
+            self.df.with_row_index("row_index")
+            .filter(pl.col("BilledCost").is_null())["row_index"]
+            .to_list()
+        )
+        self.assertEqual(flagged, nulls)
+        self.assertEqual(len(flagged), 30)
+
+
+if __name__ == "__main__":
+    unittest.main()